@@ -92,6 +92,8 @@ class ORMManager:
         self._engine: Optional[Engine] = None
         self._session_factory: Optional[sessionmaker] = None
         self._lock = threading.Lock()
+        # Session of the transaction() block active on each thread, if any
+        self._transaction_state = threading.local()
 
         # Initialize engine and create tables
         self._initialize()
@@ -101,10 +103,13 @@ class ORMManager:
         # Create engine with SQLite optimizations
         db_url = f"sqlite:///{self.db_path}"
 
+        # Sessions check connections out of the engine's QueuePool, so the
+        # file is opened and the pragmas below run once per pooled connection.
+        # No pre-ping: a local SQLite file cannot drop the connection the way
+        # a database server can, and the ping cost a query per session.
         self._engine = create_engine(
             db_url,
             echo=False,
-            pool_pre_ping=True,
             connect_args={"check_same_thread": False},
         )
 
@@ -148,7 +153,15 @@ class ORMManager:
                 session.add(campaign)
                 # Auto-commit on successful exit
                 # Auto-rollback on exception
+
+        Inside a transaction() block on the same thread, the transaction's
+        session is yielded instead, and committing is left to the transaction.
         """
+        active = getattr(self._transaction_state, "session", None)
+        if active is not None:
+            yield active
+            return
+
         if self._session_factory is None:
             raise RuntimeError("ORM Manager not initialized")
 
@@ -162,6 +175,38 @@ class ORMManager:
         finally:
             session.close()
 
+    @contextmanager
+    def transaction(self) -> Generator[Session, None, None]:
+        """
+        Run several repository calls in a single database transaction.
+
+        Every get_session() call made on this thread inside the block shares
+        one session, so repository methods that normally commit on their own
+        are committed together when the block exits. An exception rolls
+        everything back. Repository methods report failures as DomainError
+        rather than raising, so callers discard partial work by calling
+        ``rollback()`` on the yielded session before leaving the block.
+        Nested transaction() blocks join the outermost one.
+
+        Usage:
+            with orm_manager.transaction() as session:
+                result = campaign_repo.create_campaign(data)
+                if result.is_failure:
+                    session.rollback()
+                    return result
+        """
+        active = getattr(self._transaction_state, "session", None)
+        if active is not None:
+            yield active
+            return
+
+        with self.get_session() as session:
+            self._transaction_state.session = session
+            try:
+                yield session
+            finally:
+                self._transaction_state.session = None
+
     def create_session(self) -> Session:
         """
         Create a session without context manager.
@@ -0,0 +1,20 @@
+"""
+Batching for queries over long ID lists.
+
+SQLite caps the number of bound parameters in one statement (999 before
+SQLite 3.32.0) and every value in an ``IN (...)`` list is one parameter, so
+repositories split long ID lists and run one query per chunk.
+"""
+
+from typing import Iterator, Sequence, TypeVar
+
+T = TypeVar("T")
+
+# Below the pre-3.32 limit, leaving room for a query's other parameters
+MAX_IN_PARAMS = 500
+
+
+def chunked(values: Sequence[T], size: int = MAX_IN_PARAMS) -> Iterator[Sequence[T]]:
+    """Yield consecutive slices of values holding at most size items each."""
+    for start in range(0, len(values), size):
+        yield values[start : start + size]
@@ -4,13 +4,14 @@ Campaign Repository.
 SQLAlchemy ORM-based repository for campaign operations.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import case, func, select
 
 from task_crusade_mcp.database.models.campaign import Campaign
 from task_crusade_mcp.database.models.task import Task
 from task_crusade_mcp.database.orm_manager import ORMManager, get_orm_manager
+from task_crusade_mcp.database.repositories.batching import chunked
 from task_crusade_mcp.domain.entities.campaign import CampaignDTO
 from task_crusade_mcp.domain.entities.result_types import (
     DomainError,
@@ -181,14 +182,13 @@ class CampaignRepository:
 
                 campaigns = session.execute(query).scalars().all()
 
+                # Task statistics for every listed campaign in one query
+                stats_by_campaign = self._get_task_statistics(session, [c.id for c in campaigns])
+
                 result_data = []
                 for campaign in campaigns:
                     campaign_dict = self._to_dto(campaign).to_dict()
-
-                    # Add task statistics
-                    stats = self._get_task_statistics(session, campaign.id)
-                    campaign_dict["task_statistics"] = stats
-
+                    campaign_dict["task_statistics"] = stats_by_campaign[campaign.id]
                     result_data.append(campaign_dict)
 
                 return DomainSuccess.create(data=result_data)
@@ -196,31 +196,42 @@ class CampaignRepository:
         except Exception as e:
             return DomainError.operation_failed("list_campaigns", str(e))
 
-    def _get_task_statistics(self, session: Any, campaign_id: str) -> Dict[str, Any]:
-        """Get task statistics for a campaign."""
-        stats = session.execute(
-            select(
-                func.count(Task.id).label("total"),
-                func.sum(case((Task.status == "done", 1), else_=0)).label("completed"),
-                func.sum(case((Task.status == "in-progress", 1), else_=0)).label("in_progress"),
-                func.sum(case((Task.status == "pending", 1), else_=0)).label("pending"),
-                func.sum(case((Task.status == "blocked", 1), else_=0)).label("blocked"),
-            ).where(Task.campaign_id == campaign_id)
-        ).one()
-
-        total = stats.total or 0
-        completed = stats.completed or 0
-
-        return {
-            "total": total,
-            "by_status": {
-                "done": completed,
-                "in-progress": stats.in_progress or 0,
-                "pending": stats.pending or 0,
-                "blocked": stats.blocked or 0,
-            },
-            "completed_percentage": (completed / total * 100) if total > 0 else 0.0,
-        }
+    def _get_task_statistics(
+        self, session: Any, campaign_ids: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get task statistics for several campaigns, keyed by campaign ID."""
+        counts: Dict[str, Tuple[int, ...]] = {}
+        for chunk in chunked(campaign_ids):
+            rows = session.execute(
+                select(
+                    Task.campaign_id,
+                    func.count(Task.id),
+                    func.sum(case((Task.status == "done", 1), else_=0)),
+                    func.sum(case((Task.status == "in-progress", 1), else_=0)),
+                    func.sum(case((Task.status == "pending", 1), else_=0)),
+                    func.sum(case((Task.status == "blocked", 1), else_=0)),
+                )
+                .where(Task.campaign_id.in_(chunk))
+                .group_by(Task.campaign_id)
+            )
+            counts.update((campaign_id, tuple(row)) for campaign_id, *row in rows)
+
+        stats_by_campaign = {}
+        for campaign_id in campaign_ids:
+            total, completed, in_progress, pending, blocked = counts.get(
+                campaign_id, (0, 0, 0, 0, 0)
+            )
+            stats_by_campaign[campaign_id] = {
+                "total": total,
+                "by_status": {
+                    "done": completed,
+                    "in-progress": in_progress,
+                    "pending": pending,
+                    "blocked": blocked,
+                },
+                "completed_percentage": (completed / total * 100) if total > 0 else 0.0,
+            }
+        return stats_by_campaign
 
     def update(self, campaign_id: str, updates: Dict[str, Any]) -> DomainResult[CampaignDTO]:
         """
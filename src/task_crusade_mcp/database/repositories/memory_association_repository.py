@@ -5,13 +5,15 @@ SQLAlchemy ORM-based repository for memory task association operations.
 Used internally by task services - not exposed via MCP.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import ColumnElement, Select, case, func, select
 
-from task_crusade_mcp.database.models.memory import MemoryTaskAssociation
+from task_crusade_mcp.database.models.memory import MemoryEntity, MemoryTaskAssociation
 from task_crusade_mcp.database.orm_manager import ORMManager, get_orm_manager
-from task_crusade_mcp.domain.entities.memory import MemoryTaskAssociationDTO
+from task_crusade_mcp.database.repositories.batching import chunked
+from task_crusade_mcp.database.repositories.memory_entity_repository import memory_entity_to_dto
+from task_crusade_mcp.domain.entities.memory import MemoryEntityDTO, MemoryTaskAssociationDTO
 from task_crusade_mcp.domain.entities.result_types import (
     DomainError,
     DomainResult,
@@ -19,6 +21,18 @@ from task_crusade_mcp.domain.entities.result_types import (
 )
 
 
+def _entity_metadata_value(key: str, default: Optional[str] = None) -> ColumnElement[Any]:
+    """Build a SQL expression reading a top-level key from MemoryEntity metadata."""
+    # json_extract raises on malformed JSON, so only read valid documents
+    valid_json = case(
+        (func.json_valid(MemoryEntity.metadata_json) == 1, MemoryEntity.metadata_json)
+    )
+    value = func.json_extract(valid_json, f'$."{key}"')
+    if default is None:
+        return value
+    return func.coalesce(value, default)
+
+
 class MemoryAssociationRepository:
     """
     Memory Task Association repository using SQLAlchemy ORM.
@@ -146,6 +160,96 @@ class MemoryAssociationRepository:
         except Exception as e:
             return DomainError.operation_failed("list_memory_associations_by_task", str(e))
 
+    def list_with_entities_by_tasks(
+        self,
+        task_ids: List[str],
+        association_types: Optional[List[str]] = None,
+    ) -> DomainResult[List[Tuple[MemoryTaskAssociationDTO, MemoryEntityDTO]]]:
+        """
+        List associations for several tasks together with their memory entities.
+
+        Each association is joined to its entity in the same query, one query
+        per MAX_IN_PARAMS tasks.
+
+        Args:
+            task_ids: Task IDs to include.
+            association_types: Association types to include; all types if None.
+
+        Returns:
+            DomainResult with (association, entity) pairs, each task's ordered
+            by order_index.
+        """
+        if not task_ids:
+            return DomainSuccess.create(data=[])
+
+        try:
+            with self.orm_manager.get_session() as session:
+                pairs: List[Tuple[MemoryTaskAssociationDTO, MemoryEntityDTO]] = []
+                for chunk in chunked(task_ids):
+                    query = self._with_entities_query(association_types).where(
+                        MemoryTaskAssociation.task_id.in_(chunk)
+                    )
+                    pairs.extend(
+                        (self._to_dto(assoc), memory_entity_to_dto(entity))
+                        for assoc, entity in session.execute(query)
+                    )
+
+                return DomainSuccess.create(data=pairs)
+
+        except Exception as e:
+            return DomainError.operation_failed(
+                "list_memory_associations_with_entities_by_tasks", str(e)
+            )
+
+    def count_by_tasks(
+        self,
+        task_ids: List[str],
+        association_types: Optional[List[str]] = None,
+    ) -> DomainResult[Dict[str, Dict[str, int]]]:
+        """
+        Count associations for several tasks, one query per MAX_IN_PARAMS tasks.
+
+        Args:
+            task_ids: Task IDs to include.
+            association_types: Association types to include; all types if None.
+
+        Returns:
+            DomainResult mapping task_id -> association_type -> count. Tasks
+            and types without associations are omitted.
+        """
+        if not task_ids:
+            return DomainSuccess.create(data={})
+
+        try:
+            with self.orm_manager.get_session() as session:
+                counts: Dict[str, Dict[str, int]] = {}
+                for chunk in chunked(task_ids):
+                    query = (
+                        select(
+                            MemoryTaskAssociation.task_id,
+                            MemoryTaskAssociation.association_type,
+                            func.count(MemoryTaskAssociation.id),
+                        )
+                        .where(MemoryTaskAssociation.task_id.in_(chunk))
+                        .group_by(
+                            MemoryTaskAssociation.task_id,
+                            MemoryTaskAssociation.association_type,
+                        )
+                    )
+
+                    if association_types:
+                        query = query.where(
+                            MemoryTaskAssociation.association_type.in_(association_types)
+                        )
+
+                    for task_id, association_type, count in session.execute(query):
+                        counts.setdefault(task_id, {})[association_type] = count
+
+                return DomainSuccess.create(data=counts)
+
+        except Exception as e:
+            return DomainError.operation_failed("count_memory_associations_by_tasks", str(e))
+
     def list_by_campaign(
         self,
         campaign_id: str,
@@ -169,6 +273,58 @@ class MemoryAssociationRepository:
         except Exception as e:
             return DomainError.operation_failed("list_memory_associations_by_campaign", str(e))
 
+    def list_with_entities_by_campaign(
+        self,
+        campaign_id: str,
+        association_type: Optional[str] = None,
+        entity_metadata: Optional[Dict[str, str]] = None,
+        metadata_defaults: Optional[Dict[str, str]] = None,
+    ) -> DomainResult[List[Tuple[MemoryTaskAssociationDTO, MemoryEntityDTO]]]:
+        """
+        List associations for a campaign together with their memory entities.
+
+        Args:
+            campaign_id: Campaign ID.
+            association_type: Association type to include; all types if None.
+            entity_metadata: Metadata values an entity must have to be included,
+                matched in SQL.
+            metadata_defaults: Values assumed for entity_metadata keys an entity
+                lacks, or for every key when its metadata JSON is invalid.
+
+        Returns:
+            DomainResult with (association, entity) pairs ordered by order_index.
+        """
+        try:
+            with self.orm_manager.get_session() as session:
+                query = self._with_entities_query(
+                    [association_type] if association_type else None
+                ).where(MemoryTaskAssociation.campaign_id == campaign_id)
+                defaults = metadata_defaults or {}
+                for key, value in (entity_metadata or {}).items():
+                    query = query.where(_entity_metadata_value(key, defaults.get(key)) == value)
+
+                pairs = [
+                    (self._to_dto(assoc), memory_entity_to_dto(entity))
+                    for assoc, entity in session.execute(query)
+                ]
+                return DomainSuccess.create(data=pairs)
+
+        except Exception as e:
+            return DomainError.operation_failed(
+                "list_memory_associations_with_entities_by_campaign", str(e)
+            )
+
+    def _with_entities_query(
+        self, association_types: Optional[List[str]]
+    ) -> Select[Tuple[MemoryTaskAssociation, MemoryEntity]]:
+        """Build a query joining associations to their entities, in order_index order."""
+        query = select(MemoryTaskAssociation, MemoryEntity).join(MemoryTaskAssociation.entity)
+
+        if association_types:
+            query = query.where(MemoryTaskAssociation.association_type.in_(association_types))
+
+        return query.order_by(MemoryTaskAssociation.order_index.asc())
+
     def update(
         self, association_id: str, updates: Dict[str, Any]
     ) -> DomainResult[MemoryTaskAssociationDTO]:
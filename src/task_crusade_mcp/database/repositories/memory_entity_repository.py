@@ -5,12 +5,18 @@ SQLAlchemy ORM-based repository for memory entity operations.
 Used internally by task services - not exposed via MCP.
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
 
-from task_crusade_mcp.database.models.memory import MemoryEntity
+from task_crusade_mcp.database.models.memory import (
+    MemoryEntity,
+    MemorySession,
+    MemoryTaskAssociation,
+)
 from task_crusade_mcp.database.orm_manager import ORMManager, get_orm_manager
+from task_crusade_mcp.database.repositories.batching import chunked
 from task_crusade_mcp.domain.entities.memory import MemoryEntityDTO
 from task_crusade_mcp.domain.entities.result_types import (
     DomainError,
@@ -19,6 +25,20 @@ from task_crusade_mcp.domain.entities.result_types import (
 )
 
 
+def memory_entity_to_dto(entity: MemoryEntity) -> MemoryEntityDTO:
+    """Convert MemoryEntity model to MemoryEntityDTO."""
+    return MemoryEntityDTO(
+        id=entity.id,
+        session_id=entity.session_id,
+        name=entity.name,
+        entity_type=entity.entity_type,
+        observations=entity.get_observations(),
+        metadata=entity.get_metadata(),
+        created_at=entity.created_at,
+        updated_at=entity.updated_at,
+    )
+
+
 class MemoryEntityRepository:
     """
     Memory Entity repository using SQLAlchemy ORM.
@@ -33,16 +53,7 @@ class MemoryEntityRepository:
 
     def _to_dto(self, entity: MemoryEntity) -> MemoryEntityDTO:
         """Convert MemoryEntity model to MemoryEntityDTO."""
-        return MemoryEntityDTO(
-            id=entity.id,
-            session_id=entity.session_id,
-            name=entity.name,
-            entity_type=entity.entity_type,
-            observations=entity.get_observations(),
-            metadata=entity.get_metadata(),
-            created_at=entity.created_at,
-            updated_at=entity.updated_at,
-        )
+        return memory_entity_to_dto(entity)
 
     def create(self, entity_data: Dict[str, Any]) -> DomainResult[MemoryEntityDTO]:
         """Create a new memory entity."""
@@ -67,6 +78,181 @@ class MemoryEntityRepository:
         except Exception as e:
             return DomainError.operation_failed("create_memory_entity", str(e))
 
+    def create_task_items(self, items: List[Dict[str, Any]]) -> DomainResult[List[Tuple[str, int]]]:
+        """
+        Create memory entities and their task associations in one transaction.
+
+        Each item describes one entity linked to a task. Memory sessions are
+        looked up or created by name, and association order continues from
+        the highest existing order_index per (task_id, association_type).
+        Rows are flushed together, so either every item is stored or none is.
+
+        Args:
+            items: Dicts with session_name, workflow_type, task_id, name,
+                entity_type, observations, metadata, association_type and
+                optional notes.
+
+        Returns:
+            DomainResult with the (entity_id, order_index) of each item, in
+            input order.
+        """
+        if not items:
+            return DomainSuccess.create(data=[])
+
+        try:
+            with self.orm_manager.get_session() as session:
+                memory_sessions = self._get_or_add_memory_sessions(session, items)
+
+                # Highest existing order_index per (task, type), one query per
+                # MAX_IN_PARAMS tasks
+                task_ids = list(dict.fromkeys(item["task_id"] for item in items))
+                next_order: Dict[Tuple[str, str], int] = {}
+                for chunk in chunked(task_ids):
+                    next_order.update(
+                        ((task_id, assoc_type), (max_order or 0) + 1)
+                        for task_id, assoc_type, max_order in session.execute(
+                            select(
+                                MemoryTaskAssociation.task_id,
+                                MemoryTaskAssociation.association_type,
+                                func.max(MemoryTaskAssociation.order_index),
+                            )
+                            .where(MemoryTaskAssociation.task_id.in_(chunk))
+                            .group_by(
+                                MemoryTaskAssociation.task_id,
+                                MemoryTaskAssociation.association_type,
+                            )
+                        )
+                    )
+
+                created = []
+                for item in items:
+                    entity = self._new_item_entity(item, memory_sessions)
+
+                    key = (item["task_id"], item["association_type"])
+                    order_index = next_order.get(key, 1)
+                    next_order[key] = order_index + 1
+                    entity.associations.append(
+                        MemoryTaskAssociation(
+                            task_id=item["task_id"],
+                            association_type=item["association_type"],
+                            notes=item.get("notes"),
+                            order_index=order_index,
+                        )
+                    )
+                    session.add(entity)
+                    created.append((entity, order_index))
+
+                session.flush()
+                return DomainSuccess.create(
+                    data=[(entity.id, order_index) for entity, order_index in created]
+                )
+
+        except Exception as e:
+            return DomainError.operation_failed("create_task_memory_items", str(e))
+
+    def create_campaign_items(
+        self, campaign_id: str, items: List[Dict[str, Any]]
+    ) -> DomainResult[List[Tuple[str, int]]]:
+        """
+        Create memory entities and their campaign associations in one transaction.
+
+        Works like create_task_items, for entities linked to a campaign
+        instead of a task. Association order continues from the highest
+        existing order_index per association_type within the campaign.
+
+        Args:
+            campaign_id: Campaign the entities are associated with.
+            items: Dicts with session_name, workflow_type, name, entity_type,
+                observations, metadata, association_type and optional notes.
+
+        Returns:
+            DomainResult with the (entity_id, order_index) of each item, in
+            input order.
+        """
+        if not items:
+            return DomainSuccess.create(data=[])
+
+        try:
+            with self.orm_manager.get_session() as session:
+                memory_sessions = self._get_or_add_memory_sessions(session, items)
+
+                # Highest existing order_index per type in the campaign, in one query
+                next_order = {
+                    assoc_type: (max_order or 0) + 1
+                    for assoc_type, max_order in session.execute(
+                        select(
+                            MemoryTaskAssociation.association_type,
+                            func.max(MemoryTaskAssociation.order_index),
+                        )
+                        .where(MemoryTaskAssociation.campaign_id == campaign_id)
+                        .group_by(MemoryTaskAssociation.association_type)
+                    )
+                }
+
+                created = []
+                for item in items:
+                    entity = self._new_item_entity(item, memory_sessions)
+
+                    assoc_type = item["association_type"]
+                    order_index = next_order.get(assoc_type, 1)
+                    next_order[assoc_type] = order_index + 1
+                    entity.associations.append(
+                        MemoryTaskAssociation(
+                            campaign_id=campaign_id,
+                            association_type=assoc_type,
+                            notes=item.get("notes"),
+                            order_index=order_index,
+                        )
+                    )
+                    session.add(entity)
+                    created.append((entity, order_index))
+
+                session.flush()
+                return DomainSuccess.create(
+                    data=[(entity.id, order_index) for entity, order_index in created]
+                )
+
+        except Exception as e:
+            return DomainError.operation_failed("create_campaign_memory_items", str(e))
+
+    @staticmethod
+    def _get_or_add_memory_sessions(
+        session: Session, items: List[Dict[str, Any]]
+    ) -> Dict[str, MemorySession]:
+        """Look up the items' memory sessions by name, adding any that are missing."""
+        session_names = list(dict.fromkeys(item["session_name"] for item in items))
+        memory_sessions: Dict[str, MemorySession] = {}
+        for chunk in chunked(session_names):
+            for memory_session in session.execute(
+                select(MemorySession).where(MemorySession.name.in_(chunk))
+            ).scalars():
+                memory_sessions[memory_session.name] = memory_session
+        for item in items:
+            if item["session_name"] not in memory_sessions:
+                memory_session = MemorySession(
+                    name=item["session_name"],
+                    workflow_type=item.get("workflow_type"),
+                    status="active",
+                )
+                session.add(memory_session)
+                memory_sessions[item["session_name"]] = memory_session
+        return memory_sessions
+
+    @staticmethod
+    def _new_item_entity(
+        item: Dict[str, Any], memory_sessions: Dict[str, MemorySession]
+    ) -> MemoryEntity:
+        """Build the memory entity described by a create_*_items item."""
+        entity = MemoryEntity(
+            session=memory_sessions[item["session_name"]],
+            name=item["name"],
+            entity_type=item["entity_type"],
+        )
+        entity.set_observations(item["observations"])
+        if item.get("metadata"):
+            entity.set_metadata(item["metadata"])
+        return entity
+
     def get(self, entity_id: str) -> DomainResult[MemoryEntityDTO]:
         """Get memory entity by ID."""
         try:
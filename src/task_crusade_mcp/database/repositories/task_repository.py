@@ -5,12 +5,13 @@ SQLAlchemy ORM-based repository for task operations.
 """
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from sqlalchemy import case, select
 
 from task_crusade_mcp.database.models.task import Task
 from task_crusade_mcp.database.orm_manager import ORMManager, get_orm_manager
+from task_crusade_mcp.database.repositories.batching import chunked
 from task_crusade_mcp.domain.entities.result_types import (
     DomainError,
     DomainResult,
@@ -56,6 +57,42 @@ class TaskRepository:
             priority_order=task.priority_order,
         )
 
+    def _new_task(self, task_data: Dict[str, Any]) -> Task:
+        """Build an unsaved Task model from a task data dictionary."""
+        task = Task(
+            title=task_data.get("title", ""),
+            description=task_data.get("description"),
+            priority=task_data.get("priority", "medium"),
+            status=task_data.get("status", "pending"),
+            category=task_data.get("category"),
+            type=task_data.get("type", "code"),
+            campaign_id=task_data.get("campaign_id"),
+            priority_order=task_data.get("priority_order"),
+            failure_reason=task_data.get("failure_reason"),
+        )
+
+        # Keep a caller-assigned ID (e.g. one referenced by other new rows)
+        if task_data.get("id"):
+            task.id = task_data["id"]
+
+        # Set tags if provided
+        if "tags" in task_data:
+            tags = task_data["tags"]
+            if isinstance(tags, str):
+                task.tags_json = tags
+            else:
+                task.set_tags(tags or [])
+
+        # Set dependencies if provided
+        if "dependencies" in task_data:
+            deps = task_data["dependencies"]
+            if isinstance(deps, str):
+                task.dependencies_json = deps
+            else:
+                task.set_dependencies(deps or [])
+
+        return task
+
     def create(self, task_data: Dict[str, Any]) -> DomainResult[TaskDTO]:
         """
         Create a new task.
@@ -68,35 +105,7 @@ class TaskRepository:
         """
         try:
             with self.orm_manager.get_session() as session:
-                # Create task
-                task = Task(
-                    title=task_data.get("title", ""),
-                    description=task_data.get("description"),
-                    priority=task_data.get("priority", "medium"),
-                    status=task_data.get("status", "pending"),
-                    category=task_data.get("category"),
-                    type=task_data.get("type", "code"),
-                    campaign_id=task_data.get("campaign_id"),
-                    priority_order=task_data.get("priority_order"),
-                    failure_reason=task_data.get("failure_reason"),
-                )
-
-                # Set tags if provided
-                if "tags" in task_data:
-                    tags = task_data["tags"]
-                    if isinstance(tags, str):
-                        task.tags_json = tags
-                    else:
-                        task.set_tags(tags or [])
-
-                # Set dependencies if provided
-                if "dependencies" in task_data:
-                    deps = task_data["dependencies"]
-                    if isinstance(deps, str):
-                        task.dependencies_json = deps
-                    else:
-                        task.set_dependencies(deps or [])
-
+                task = self._new_task(task_data)
                 session.add(task)
                 session.flush()
 
@@ -105,6 +114,30 @@ class TaskRepository:
         except Exception as e:
             return DomainError.operation_failed("create_task", str(e))
 
+    def create_many(self, tasks_data: List[Dict[str, Any]]) -> DomainResult[List[TaskDTO]]:
+        """
+        Create several tasks with one flush.
+
+        Tasks may carry pre-assigned "id" values so that dependencies can
+        reference tasks created in the same call.
+
+        Args:
+            tasks_data: Dictionaries containing task fields.
+
+        Returns:
+            DomainResult with the created tasks, in input order.
+        """
+        try:
+            with self.orm_manager.get_session() as session:
+                tasks = [self._new_task(task_data) for task_data in tasks_data]
+                session.add_all(tasks)
+                session.flush()
+
+                return DomainSuccess.create(data=[self._to_dto(task) for task in tasks])
+
+        except Exception as e:
+            return DomainError.operation_failed("create_tasks", str(e))
+
     def get(self, task_id: str) -> DomainResult[TaskDTO]:
         """
         Get task by ID.
@@ -193,33 +226,74 @@ class TaskRepository:
                 if not task:
                     return DomainError.not_found("Task", task_id)
 
-                # Apply updates
-                for field, value in updates.items():
-                    if field == "tags":
-                        if isinstance(value, str):
-                            task.tags_json = value
-                        else:
-                            task.set_tags(value or [])
-                    elif field == "dependencies":
-                        if isinstance(value, str):
-                            task.dependencies_json = value
-                        else:
-                            task.set_dependencies(value or [])
-                    elif hasattr(task, field) and field not in ("id", "created_at"):
-                        setattr(task, field, value)
-
-                # Handle status change to terminal states (done or cancelled)
-                terminal_task_states = {"done", "cancelled"}
-                new_status = updates.get("status")
-                if new_status in terminal_task_states and not task.completed_at:
-                    task.completed_at = datetime.now(timezone.utc)
-
+                self._apply_updates(task, updates)
                 session.flush()
                 return DomainSuccess.create(data=self._to_dto(task))
 
         except Exception as e:
             return DomainError.operation_failed("update_task", str(e))
 
+    def update_many(self, updates: List[Tuple[str, Dict[str, Any]]]) -> DomainResult[List[TaskDTO]]:
+        """
+        Update several tasks in one transaction.
+
+        The tasks are loaded with one query per MAX_IN_PARAMS IDs and written
+        with one flush, which batches updates to the same fields into a single
+        executemany.
+
+        Args:
+            updates: (task_id, fields) pairs, each applied as in update().
+
+        Returns:
+            DomainResult with the updated task DTOs, in the order given. No task
+            is updated if any of them does not exist.
+        """
+        if not updates:
+            return DomainSuccess.create(data=[])
+
+        try:
+            with self.orm_manager.get_session() as session:
+                task_ids = [task_id for task_id, _ in updates]
+                task_by_id = {}
+                for chunk in chunked(task_ids):
+                    for task in session.execute(select(Task).where(Task.id.in_(chunk))).scalars():
+                        task_by_id[task.id] = task
+
+                for task_id in task_ids:
+                    if task_id not in task_by_id:
+                        return DomainError.not_found("Task", task_id)
+
+                for task_id, fields in updates:
+                    self._apply_updates(task_by_id[task_id], fields)
+
+                session.flush()
+                return DomainSuccess.create(data=[self._to_dto(task_by_id[i]) for i in task_ids])
+
+        except Exception as e:
+            return DomainError.operation_failed("update_tasks", str(e))
+
+    def _apply_updates(self, task: Task, updates: Dict[str, Any]) -> None:
+        """Apply a dictionary of field updates to a task model."""
+        for field, value in updates.items():
+            if field == "tags":
+                if isinstance(value, str):
+                    task.tags_json = value
+                else:
+                    task.set_tags(value or [])
+            elif field == "dependencies":
+                if isinstance(value, str):
+                    task.dependencies_json = value
+                else:
+                    task.set_dependencies(value or [])
+            elif hasattr(task, field) and field not in ("id", "created_at"):
+                setattr(task, field, value)
+
+        # Handle status change to terminal states (done or cancelled)
+        terminal_task_states = {"done", "cancelled"}
+        new_status = updates.get("status")
+        if new_status in terminal_task_states and not task.completed_at:
+            task.completed_at = datetime.now(timezone.utc)
+
     def delete(self, task_id: str) -> DomainResult[Dict[str, Any]]:
         """
         Delete a task.
@@ -9,9 +9,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, Optional
 
+from task_crusade_mcp.domain.entities.dict_access import DictAccessMixin
 
-@dataclass
-class CampaignDTO:
+
+@dataclass(slots=True)
+class CampaignDTO(DictAccessMixin):
     """
     Campaign Data Transfer Object.
 
@@ -50,18 +52,6 @@ class CampaignDTO:
         """Get campaign owner from metadata."""
         return self.metadata.get("owner")
 
-    def __getitem__(self, key: str) -> Any:
-        """Enable dict-like access for backward compatibility."""
-        return self.to_dict()[key]
-
-    def __contains__(self, key: str) -> bool:
-        """Enable 'in' operator for backward compatibility."""
-        return key in self.to_dict()
-
-    def get(self, key: str, default: Any = None) -> Any:
-        """Retrieve a value by key with optional default for backward compatibility."""
-        return self.to_dict().get(key, default)
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert DTO to dictionary representation."""
         return {
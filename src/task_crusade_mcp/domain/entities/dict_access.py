@@ -0,0 +1,52 @@
+"""
+Dict-style read access for DTOs.
+
+DTOs support ``dto["key"]``, ``"key" in dto`` and ``dto.get("key")`` for
+backward compatibility with code written against plain dicts. Building the
+whole ``to_dict()`` result for each lookup formats every timestamp just to read
+one value, so lookups here read the matching attribute directly instead.
+"""
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet
+
+# DTO class -> keys of its to_dict() result
+_KEYS_BY_CLASS: Dict[type, FrozenSet[str]] = {}
+
+
+class DictAccessMixin:
+    """
+    Mixin giving a DTO read-only dict access to its ``to_dict()`` keys.
+
+    Every ``to_dict()`` key must be an attribute or property of the same name,
+    with datetimes rendered as ISO strings, and every key must always be
+    present so the key set can be cached per class on first use.
+    """
+
+    __slots__ = ()
+
+    if TYPE_CHECKING:
+        # Provided by each DTO class; declared for type checkers only.
+        def to_dict(self) -> Dict[str, Any]: ...
+
+    def _dict_keys(self) -> FrozenSet[str]:
+        cls = type(self)
+        keys = _KEYS_BY_CLASS.get(cls)
+        if keys is None:
+            keys = _KEYS_BY_CLASS[cls] = frozenset(self.to_dict())
+        return keys
+
+    def __getitem__(self, key: str) -> Any:
+        """Enable dict-like access for backward compatibility."""
+        if key not in self._dict_keys():
+            raise KeyError(key)
+        value = getattr(self, key)
+        return value.isoformat() if isinstance(value, datetime) else value
+
+    def __contains__(self, key: str) -> bool:
+        """Enable 'in' operator for backward compatibility."""
+        return key in self._dict_keys()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Retrieve value by key with optional default for backward compatibility."""
+        return self[key] if key in self._dict_keys() else default
@@ -7,7 +7,7 @@ and current state, helping agents navigate the task execution workflow.
 
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
 
 
 class HintCategory(Enum):
@@ -29,6 +29,16 @@ class HintCategory(Enum):
     COMPLETION = "completion"  # Task/campaign completion
 
 
+# Priority order for HintCollection.get_primary_tool_call
+_TOOL_CALL_PRIORITY = (
+    HintCategory.WORKFLOW,
+    HintCategory.QUALITY,
+    HintCategory.COORDINATION,
+    HintCategory.PROGRESS,
+    HintCategory.COMPLETION,
+)
+
+
 class CampaignSetupStage(Enum):
     """
     Stages of campaign setup for progressive guidance.
@@ -127,7 +137,7 @@ class CampaignHealthInfo:
         return round((self.tasks_complete / self.total_tasks) * 100, 1)
 
 
-@dataclass
+@dataclass(slots=True)
 class Hint:
     """
     Single actionable hint for agent guidance.
@@ -157,7 +167,7 @@ class Hint:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HintCollection:
     """
     Collection of hints with utility methods.
@@ -166,7 +176,7 @@ class HintCollection:
     methods for formatting and extracting the primary action.
     """
 
-    hints: List[Hint]
+    hints: Sequence[Hint]
 
     def to_list(self) -> List[Dict[str, Any]]:
         """Convert all hints to list of dictionaries."""
@@ -181,17 +191,8 @@ class HintCollection:
         Returns the tool_call from the highest priority hint,
         or the first hint with a tool_call if none in priority categories.
         """
-        # Priority order for tool call selection
-        priority_order = [
-            HintCategory.WORKFLOW,
-            HintCategory.QUALITY,
-            HintCategory.COORDINATION,
-            HintCategory.PROGRESS,
-            HintCategory.COMPLETION,
-        ]
-
         # Check each category in priority order
-        for category in priority_order:
+        for category in _TOOL_CALL_PRIORITY:
             for hint in self.hints:
                 if hint.category == category and hint.tool_call:
                     return hint.tool_call
@@ -12,9 +12,11 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from task_crusade_mcp.domain.entities.dict_access import DictAccessMixin
 
-@dataclass
-class MemoryEntityDTO:
+
+@dataclass(slots=True)
+class MemoryEntityDTO(DictAccessMixin):
     """
     Domain DTO for Memory Entity.
 
@@ -31,18 +33,6 @@ class MemoryEntityDTO:
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    def __getitem__(self, key: str) -> Any:
-        """Enable dict-like access for backward compatibility."""
-        return self.to_dict()[key]
-
-    def __contains__(self, key: str) -> bool:
-        """Enable 'in' operator for backward compatibility."""
-        return key in self.to_dict()
-
-    def get(self, key: str, default: Any = None) -> Any:
-        """Retrieve value for key with optional default if key not found."""
-        return self.to_dict().get(key, default)
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert DTO to dictionary representation."""
         return {
@@ -90,8 +80,8 @@ class MemoryEntityDTO:
         )
 
 
-@dataclass
-class MemorySessionDTO:
+@dataclass(slots=True)
+class MemorySessionDTO(DictAccessMixin):
     """
     Domain DTO for Memory Session.
 
@@ -109,18 +99,6 @@ class MemorySessionDTO:
     completed_at: Optional[datetime] = None
     archived_at: Optional[datetime] = None
 
-    def __getitem__(self, key: str) -> Any:
-        """Enable dict-like access for backward compatibility."""
-        return self.to_dict()[key]
-
-    def __contains__(self, key: str) -> bool:
-        """Enable 'in' operator for backward compatibility."""
-        return key in self.to_dict()
-
-    def get(self, key: str, default: Any = None) -> Any:
-        """Retrieve value for key with optional default if key not found."""
-        return self.to_dict().get(key, default)
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert DTO to dictionary representation."""
         return {
@@ -169,8 +147,8 @@ class MemorySessionDTO:
         )
 
 
-@dataclass
-class MemoryTaskAssociationDTO:
+@dataclass(slots=True)
+class MemoryTaskAssociationDTO(DictAccessMixin):
     """
     Domain DTO for Memory Task Association.
 
@@ -188,18 +166,6 @@ class MemoryTaskAssociationDTO:
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    def __getitem__(self, key: str) -> Any:
-        """Enable dict-like access for backward compatibility."""
-        return self.to_dict()[key]
-
-    def __contains__(self, key: str) -> bool:
-        """Enable 'in' operator for backward compatibility."""
-        return key in self.to_dict()
-
-    def get(self, key: str, default: Any = None) -> Any:
-        """Retrieve value for key with optional default if key not found."""
-        return self.to_dict().get(key, default)
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert DTO to dictionary representation."""
         return {
@@ -10,9 +10,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from task_crusade_mcp.domain.entities.dict_access import DictAccessMixin
 
-@dataclass
-class TaskDTO:
+
+@dataclass(slots=True)
+class TaskDTO(DictAccessMixin):
     """
     Task Data Transfer Object.
 
@@ -53,18 +55,6 @@ class TaskDTO:
     campaign_id: Optional[str] = None
     priority_order: Optional[int] = None
 
-    def __getitem__(self, key: str) -> Any:
-        """Enable dict-like access for backward compatibility."""
-        return self.to_dict()[key]
-
-    def __contains__(self, key: str) -> bool:
-        """Enable 'in' operator for backward compatibility."""
-        return key in self.to_dict()
-
-    def get(self, key: str, default: Any = None) -> Any:
-        """Retrieve value by key with optional default for backward compatibility."""
-        return self.to_dict().get(key, default)
-
     def to_dict(self) -> Dict[str, Any]:
         """Convert DTO to dictionary representation."""
         return {
@@ -18,7 +18,11 @@ from mcp.types import INTERNAL_ERROR, ErrorData, TextContent, Tool
 from task_crusade_mcp.database.orm_manager import get_orm_manager
 from task_crusade_mcp.server.error_sanitizer import sanitize_exception
 from task_crusade_mcp.server.service_executor import ServiceExecutor
-from task_crusade_mcp.server.tools import get_all_tools
+from task_crusade_mcp.server.tools import (
+    build_validators,
+    get_all_tools,
+    validate_tool_arguments,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -141,6 +145,7 @@ TIPS:
         logger.info("Pre-caching tools...")
         self._tools = get_all_tools()
         logger.info("Loaded %d tools", len(self._tools))
+        logger.debug("Built input validators for %d tools", build_validators())
 
         # Register protocol handlers
         self._register_handlers()
@@ -160,12 +165,19 @@ TIPS:
                 logger.debug("Handling list_tools request")
             return self._tools
 
-        @self._server.call_tool()
+        # Input is validated against prebuilt per-tool validators rather than the
+        # SDK's per-call jsonschema.validate, which rebuilds a validator each time.
+        @self._server.call_tool(validate_input=False)
         async def handle_call_tool(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
             """Handle call_tool request."""
             if _is_debug_mode():
                 logger.debug("Handling call_tool: %s", name)
 
+            # The SDK reports exceptions raised here as an isError tool result
+            validation_error = validate_tool_arguments(name, arguments)
+            if validation_error is not None:
+                raise ValueError(f"Input validation error: {validation_error}")
+
             try:
                 result_text = await self._service_executor.execute_tool(name, arguments)
 
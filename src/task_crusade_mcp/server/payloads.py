@@ -0,0 +1,111 @@
+"""
+Payload shapes for MCP tools that take JSON-encoded arguments.
+
+The bulk tools accept their input as a JSON string. The shapes below describe
+what the handlers pass on to the service layer; their TypeAdapters are built
+once at import so each call only runs the prebuilt validator.
+"""
+
+from typing import Any, Dict, List, TypeVar, Union
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
+from typing_extensions import TypedDict
+
+T = TypeVar("T")
+
+
+class ResearchItemPayload(TypedDict, total=False):
+    """A research item in a bulk payload."""
+
+    content: str
+    type: str
+
+
+class TestingStepPayload(TypedDict, total=False):
+    """A testing strategy step in a bulk payload."""
+
+    content: str
+    step_type: str
+
+
+class NotePayload(TypedDict, total=False):
+    """An implementation note in a bulk payload."""
+
+    content: str
+
+
+class BulkResearchPayload(TypedDict, total=False):
+    """Payload for task_bulk_add_research."""
+
+    task_ids: List[str]
+    research_items: List[ResearchItemPayload]
+
+
+class TaskDetailsPayload(TypedDict, total=False):
+    """Details to add to one task in task_bulk_add_details."""
+
+    task_id: str
+    research: List[ResearchItemPayload]
+    notes: List[NotePayload]
+    criteria: List[str]
+    testing_strategy: List[TestingStepPayload]
+
+
+class BulkDetailsPayload(TypedDict, total=False):
+    """Payload for task_bulk_add_details."""
+
+    tasks: List[TaskDetailsPayload]
+
+
+BULK_RESEARCH_ADAPTER: TypeAdapter[BulkResearchPayload] = TypeAdapter(BulkResearchPayload)
+BULK_DETAILS_ADAPTER: TypeAdapter[BulkDetailsPayload] = TypeAdapter(BulkDetailsPayload)
+
+
+def parse_payload(adapter: TypeAdapter[T], raw: Union[str, Dict[str, Any]]) -> T:
+    """
+    Parse and validate a JSON payload argument.
+
+    JSON strings are decoded and validated in one pass by pydantic-core. A
+    payload that was JSON-encoded twice (AI agents sometimes stringify twice)
+    is decoded once more before validating.
+
+    Args:
+        adapter: Prebuilt adapter for the payload shape.
+        raw: The argument value, either a JSON string or an already-decoded object.
+
+    Returns:
+        The validated payload.
+
+    Raises:
+        ValidationError: If the payload does not match the expected shape.
+        ValueError: If the string is not valid JSON.
+    """
+    if not isinstance(raw, str):
+        return adapter.validate_python(raw)
+
+    try:
+        return adapter.validate_json(raw)
+    except ValidationError:
+        decoded = from_json(raw)
+        if isinstance(decoded, str):
+            return adapter.validate_json(decoded)
+        raise
+
+
+def format_validation_error(error: ValidationError) -> str:
+    """
+    Summarize a payload validation error as a single line.
+
+    Args:
+        error: The pydantic validation error.
+
+    Returns:
+        The first error's location and message, e.g. "tasks.0.criteria.1: ...".
+    """
+    first: Dict[str, Any] = dict(error.errors()[0])
+    location = ".".join(str(part) for part in first["loc"])
+    message = first["msg"]
+    if error.error_count() > 1:
+        message += f" (and {error.error_count() - 1} more)"
+    return f"{location}: {message}" if location else message
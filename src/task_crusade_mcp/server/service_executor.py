@@ -9,14 +9,32 @@ import asyncio
 import json
 import logging
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from typing import Any, Dict, Optional
 
 import yaml
-
+from pydantic import ValidationError
+
+from task_crusade_mcp.server.payloads import (
+    BULK_DETAILS_ADAPTER,
+    BULK_RESEARCH_ADAPTER,
+    format_validation_error,
+    parse_payload,
+)
 from task_crusade_mcp.services import get_service_factory
 
 logger = logging.getLogger(__name__)
 
+# libyaml's emitter when PyYAML was built with it. It loads back to the same
+# values as the pure-Python Dumper and encodes large responses several times
+# faster; only the quoting of some unusual strings differs.
+_YAML_DUMPER = getattr(yaml, "CDumper", yaml.Dumper)
+
+
+def _dump_yaml(data: Dict[str, Any]) -> str:
+    """Encode a tool response as block-style YAML."""
+    return yaml.dump(data, Dumper=_YAML_DUMPER, default_flow_style=False, allow_unicode=True)
+
 
 class ServiceExecutor:
     """
@@ -114,9 +132,15 @@ class ServiceExecutor:
                 "task_testing_strategy_show": self._handle_testing_show,
                 "task_testing_strategy_update": self._handle_testing_update,
                 "task_testing_strategy_delete": self._handle_testing_delete,
-                "task_testing_strategy_mark_passed": self._handle_testing_passed,
-                "task_testing_strategy_mark_failed": self._handle_testing_failed,
-                "task_testing_strategy_mark_skipped": self._handle_testing_skipped,
+                "task_testing_strategy_mark_passed": partial(
+                    self._handle_testing_status, status="passed"
+                ),
+                "task_testing_strategy_mark_failed": partial(
+                    self._handle_testing_status, status="failed"
+                ),
+                "task_testing_strategy_mark_skipped": partial(
+                    self._handle_testing_status, status="skipped"
+                ),
                 "task_testing_strategy_reorder": self._handle_testing_reorder,
                 # Bulk tools
                 "task_bulk_add_research": self._handle_bulk_add_research,
@@ -141,11 +165,8 @@ class ServiceExecutor:
 
         try:
             # Run handler in thread pool to avoid blocking event loop
-            loop = asyncio.get_event_loop()
-            result = await loop.run_in_executor(
-                self._executor, lambda: handler(arguments)
-            )
-            return result
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, handler, arguments)
         except Exception as e:
             logger.error("Error executing tool %s: %s", tool_name, e, exc_info=True)
             return self._format_error(str(e))
@@ -164,7 +185,7 @@ class ServiceExecutor:
             if "next_action" in data:
                 result["next_action"] = data.pop("next_action")
 
-        return yaml.dump(result, default_flow_style=False, allow_unicode=True)
+        return _dump_yaml(result)
 
     def _format_error(self, message: str, suggestions: Optional[list] = None) -> str:
         """Format error as YAML."""
@@ -173,7 +194,7 @@ class ServiceExecutor:
             "error": message,
             "suggestions": suggestions or [],
         }
-        return yaml.dump(result, default_flow_style=False, allow_unicode=True)
+        return _dump_yaml(result)
 
     # --- Campaign Handlers ---
 
@@ -950,34 +971,13 @@ class ServiceExecutor:
             return self._format_result(result.data)
         return self._format_error(result.error_message or "Delete failed")
 
-    def _handle_testing_passed(self, args: Dict[str, Any]) -> str:
-        """Handle task_testing_strategy_mark_passed tool."""
-        service = self._factory.get_task_service()
-        result = service.mark_testing_step_passed(
-            task_id=args.get("task_id", ""),
-            step_id=args.get("step_id", ""),
-        )
-        if result.is_success:
-            return self._format_result(result.data)
-        return self._format_error(result.error_message or "Failed")
-
-    def _handle_testing_failed(self, args: Dict[str, Any]) -> str:
-        """Handle task_testing_strategy_mark_failed tool."""
+    def _handle_testing_status(self, args: Dict[str, Any], status: str) -> str:
+        """Handle task_testing_strategy_mark_{passed,failed,skipped} tools."""
         service = self._factory.get_task_service()
-        result = service.mark_testing_step_failed(
-            task_id=args.get("task_id", ""),
-            step_id=args.get("step_id", ""),
-        )
-        if result.is_success:
-            return self._format_result(result.data)
-        return self._format_error(result.error_message or "Failed")
-
-    def _handle_testing_skipped(self, args: Dict[str, Any]) -> str:
-        """Handle task_testing_strategy_mark_skipped tool."""
-        service = self._factory.get_task_service()
-        result = service.mark_testing_step_skipped(
+        result = service.mark_testing_step(
             task_id=args.get("task_id", ""),
             step_id=args.get("step_id", ""),
+            status=status,
         )
         if result.is_success:
             return self._format_result(result.data)
@@ -1000,21 +1000,18 @@ class ServiceExecutor:
     def _handle_bulk_add_research(self, args: Dict[str, Any]) -> str:
         """Handle task_bulk_add_research tool."""
         research_json = args.get("research_json", "")
-
-        if isinstance(research_json, str):
-            try:
-                data = json.loads(research_json)
-                if isinstance(data, str):
-                    data = json.loads(data)
-            except json.JSONDecodeError as e:
-                return self._format_error(f"Invalid JSON: {e}")
-        elif isinstance(research_json, dict):
-            data = research_json
-        else:
+        if not isinstance(research_json, (str, dict)):
             return self._format_error("research_json must be a JSON string or object")
 
-        task_ids = data.get("task_ids", [])
-        research_items = data.get("research_items", [])
+        try:
+            payload = parse_payload(BULK_RESEARCH_ADAPTER, research_json)
+        except ValidationError as e:
+            return self._format_error(f"Invalid research_json: {format_validation_error(e)}")
+        except ValueError as e:
+            return self._format_error(f"Invalid JSON: {e}")
+
+        task_ids = payload.get("task_ids", [])
+        research_items = payload.get("research_items", [])
 
         if not task_ids:
             return self._format_error("task_ids is required and must be non-empty")
@@ -1034,20 +1031,17 @@ class ServiceExecutor:
     def _handle_bulk_add_details(self, args: Dict[str, Any]) -> str:
         """Handle task_bulk_add_details tool."""
         details_json = args.get("details_json", "")
-
-        if isinstance(details_json, str):
-            try:
-                data = json.loads(details_json)
-                if isinstance(data, str):
-                    data = json.loads(data)
-            except json.JSONDecodeError as e:
-                return self._format_error(f"Invalid JSON: {e}")
-        elif isinstance(details_json, dict):
-            data = details_json
-        else:
+        if not isinstance(details_json, (str, dict)):
             return self._format_error("details_json must be a JSON string or object")
 
-        tasks = data.get("tasks", [])
+        try:
+            payload = parse_payload(BULK_DETAILS_ADAPTER, details_json)
+        except ValidationError as e:
+            return self._format_error(f"Invalid details_json: {format_validation_error(e)}")
+        except ValueError as e:
+            return self._format_error(f"Invalid JSON: {e}")
+
+        tasks = payload.get("tasks", [])
         if not tasks:
             return self._format_error("tasks array is required and must be non-empty")
 
@@ -1,23 +1,31 @@
 """MCP Tool definitions."""
 
-from typing import List
+from __future__ import annotations
 
-from mcp.types import Tool
+from typing import TYPE_CHECKING, List
 
 from task_crusade_mcp.server.tools.campaign_tools import get_campaign_tools
 from task_crusade_mcp.server.tools.task_tools import get_task_tools
+from task_crusade_mcp.server.tools.validators import (
+    build_validators,
+    get_validator,
+    validate_tool_arguments,
+)
+
+if TYPE_CHECKING:
+    from mcp.types import Tool
 
 
 def get_all_tools() -> List[Tool]:
     """Get all available MCP tools."""
-    tools = []
-    tools.extend(get_campaign_tools())
-    tools.extend(get_task_tools())
-    return tools
+    return [*get_campaign_tools(), *get_task_tools()]
 
 
 __all__ = [
+    "build_validators",
     "get_all_tools",
     "get_campaign_tools",
     "get_task_tools",
+    "get_validator",
+    "validate_tool_arguments",
 ]
@@ -1,14 +1,36 @@
 """Campaign MCP tool definitions."""
 
-from typing import List
+from __future__ import annotations
 
-from mcp.types import Tool
+from functools import lru_cache
+from typing import TYPE_CHECKING, Tuple
 
+from task_crusade_mcp.server.tools.frozen import freeze
 
-def get_campaign_tools() -> List[Tool]:
-    """Get campaign management MCP tools."""
-    return [
-        Tool(
+if TYPE_CHECKING:
+    from mcp.types import Tool
+
+# Description lines repeated across many tools.
+_CAMPAIGN_ID_PARAM = "- campaign_id (required): Campaign ID"
+_RESEARCH_ID_PARAM = "- research_id (required): Research item ID"
+_NEW_ORDER_PARAM = "- new_order (required): New order index (0-based)"
+_RETURNS_DELETED = "Returns: Deletion confirmation."
+
+
+@lru_cache(maxsize=1)
+def get_campaign_tools() -> Tuple[Tool, ...]:
+    """
+    Get campaign management MCP tools.
+
+    The definitions are static, trusted data, so each Tool is built with
+    ``model_construct`` to skip pydantic validation. They are built on first
+    use and the same tuple is returned on every later call; the schemas are
+    frozen so callers sharing the cached tools cannot modify them.
+    """
+    from mcp.types import Tool
+
+    tools = (
+        Tool.model_construct(
             name="campaign_create",
             description="""Create a new campaign to organize related tasks.
 
@@ -47,7 +69,7 @@ IMPORTANT: Extract campaign ID from `data.id` for subsequent operations.""",
                 "required": ["name"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_list",
             description="""List all campaigns with optional filters.
 
@@ -72,7 +94,7 @@ Returns: List of campaigns with task statistics.""",
                 },
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_show",
             description="""Show detailed campaign information including all tasks.
 
@@ -94,7 +116,7 @@ Returns: Campaign details with task list.""",
                 "required": ["campaign_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_update",
             description="""Update campaign properties.
 
@@ -126,16 +148,16 @@ Returns: Updated campaign.""",
                 "required": ["campaign_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_delete",
-            description="""Delete a campaign and all its tasks.
+            description=f"""Delete a campaign and all its tasks.
 
 WARNING: This is permanent and cannot be undone.
 
 Parameters:
 - campaign_id (required): Campaign ID to delete
 
-Returns: Deletion confirmation.""",
+{_RETURNS_DELETED}""",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -144,14 +166,14 @@ Returns: Deletion confirmation.""",
                 "required": ["campaign_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_get_progress_summary",
-            description="""Get lightweight progress summary for a campaign.
+            description=f"""Get lightweight progress summary for a campaign.
 
 Optimized for frequent progress monitoring (<150ms).
 
 Parameters:
-- campaign_id (required): Campaign ID
+{_CAMPAIGN_ID_PARAM}
 
 Returns: Progress summary with task counts, completion rate, and current/next tasks.""",
             inputSchema={
@@ -162,9 +184,9 @@ Returns: Progress summary with task counts, completion rate, and current/next ta
                 "required": ["campaign_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_get_next_actionable_task",
-            description="""Get the next actionable task with all dependencies met.
+            description=f"""Get the next actionable task with all dependencies met.
 
 WHEN TO USE THIS TOOL:
 - Sequential task processing (work on one task at a time)
@@ -180,7 +202,7 @@ dependencies have status="done". A task is "actionable" when:
 IMPORTANT: Returns acceptance_criteria_details with IDs for marking criteria met.
 
 Parameters:
-- campaign_id (required): Campaign ID
+{_CAMPAIGN_ID_PARAM}
 - context_depth (optional): "basic" (default) returns task with acceptance criteria,
                             "full" includes research items and implementation notes
 
@@ -209,15 +231,15 @@ Returns: Next task with criteria, progress summary, and execution guidance.""",
                 "required": ["campaign_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_get_all_actionable_tasks",
-            description="""Get ALL actionable tasks for parallel execution.
+            description=f"""Get ALL actionable tasks for parallel execution.
 
 Use this when multiple agents can work simultaneously. Returns all tasks ready
 to be worked on (dependencies met).
 
 Parameters:
-- campaign_id (required): Campaign ID
+{_CAMPAIGN_ID_PARAM}
 - max_results (optional): Maximum tasks to return (default: 10, max: 50)
 - context_depth (optional): Context level - "basic" (default) returns task data with acceptance criteria, "full" additionally includes research items and implementation notes
 
@@ -241,14 +263,14 @@ Returns: List of actionable tasks with coordination warnings.""",
                 "required": ["campaign_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_details",
-            description="""Show campaign metadata without full task details.
+            description=f"""Show campaign metadata without full task details.
 
 Faster alternative to campaign_show when you don't need task listings.
 
 Parameters:
-- campaign_id (required): Campaign ID
+{_CAMPAIGN_ID_PARAM}
 
 Returns: Campaign metadata and progress summary.""",
             inputSchema={
@@ -259,9 +281,9 @@ Returns: Campaign metadata and progress summary.""",
                 "required": ["campaign_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_research_add",
-            description="""Add a research item to a campaign.
+            description=f"""Add a research item to a campaign.
 
 Research types:
 - strategy: Strategic decisions, overall approach
@@ -269,7 +291,7 @@ Research types:
 - requirements: High-level requirements
 
 Parameters:
-- campaign_id (required): Campaign ID
+{_CAMPAIGN_ID_PARAM}
 - content (required): Research content
 - research_type (optional): "strategy", "analysis", or "requirements"
 
@@ -297,12 +319,12 @@ data:
                 "required": ["campaign_id", "content"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_research_list",
-            description="""List research items for a campaign.
+            description=f"""List research items for a campaign.
 
 Parameters:
-- campaign_id (required): Campaign ID
+{_CAMPAIGN_ID_PARAM}
 - research_type (optional): Filter by type
 
 Returns: List of research items.""",
@@ -319,7 +341,7 @@ Returns: List of research items.""",
                 "required": ["campaign_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_workflow_guide",
             description="""Get comprehensive workflow guidance.
 
@@ -343,7 +365,7 @@ Related: campaign_create_with_tasks (recommended for new campaigns)""",
                 "properties": {},
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_create_with_tasks",
             description="""Create campaign AND all tasks in ONE atomic operation.
 
@@ -414,15 +436,15 @@ Related: campaign_create (without tasks), task_create (individual tasks),
                 "required": ["campaign_json"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_overview",
-            description="""Get comprehensive campaign overview.
+            description=f"""Get comprehensive campaign overview.
 
 Returns combined view of progress, recent activity, actionable tasks,
 and research items in a single call.
 
 Parameters:
-- campaign_id (required): Campaign ID
+{_CAMPAIGN_ID_PARAM}
 
 Returns: Campaign details, progress summary, recent tasks, actionable tasks,
 and research items.""",
@@ -434,15 +456,15 @@ and research items.""",
                 "required": ["campaign_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_get_state_snapshot",
-            description="""Export full campaign state for backup or analysis.
+            description=f"""Export full campaign state for backup or analysis.
 
 Returns complete campaign data including all tasks with their acceptance
 criteria, research items, and implementation notes.
 
 Parameters:
-- campaign_id (required): Campaign ID
+{_CAMPAIGN_ID_PARAM}
 
 Returns: Complete campaign state with all associated data.""",
             inputSchema={
@@ -453,9 +475,9 @@ Returns: Complete campaign state with all associated data.""",
                 "required": ["campaign_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_validate_readiness",
-            description="""Check if campaign is ready to start execution.
+            description=f"""Check if campaign is ready to start execution.
 
 Validates:
 - Campaign has tasks
@@ -464,7 +486,7 @@ Validates:
 - At least one task is actionable
 
 Parameters:
-- campaign_id (required): Campaign ID
+{_CAMPAIGN_ID_PARAM}
 
 Returns: Readiness status with any issues or warnings found.""",
             inputSchema={
@@ -475,13 +497,13 @@ Returns: Readiness status with any issues or warnings found.""",
                 "required": ["campaign_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_research_show",
-            description="""Get a single campaign research item by ID.
+            description=f"""Get a single campaign research item by ID.
 
 Parameters:
-- campaign_id (required): Campaign ID
-- research_id (required): Research item ID
+{_CAMPAIGN_ID_PARAM}
+{_RESEARCH_ID_PARAM}
 
 Returns: Research item details.""",
             inputSchema={
@@ -493,13 +515,13 @@ Returns: Research item details.""",
                 "required": ["campaign_id", "research_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_research_update",
-            description="""Update a campaign research item.
+            description=f"""Update a campaign research item.
 
 Parameters:
-- campaign_id (required): Campaign ID
-- research_id (required): Research item ID
+{_CAMPAIGN_ID_PARAM}
+{_RESEARCH_ID_PARAM}
 - content (optional): New content
 - research_type (optional): New type ("strategy", "analysis", "requirements")
 
@@ -519,15 +541,15 @@ Returns: Updated research item.""",
                 "required": ["campaign_id", "research_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_research_delete",
-            description="""Delete a campaign research item.
+            description=f"""Delete a campaign research item.
 
 Parameters:
-- campaign_id (required): Campaign ID
-- research_id (required): Research item ID
+{_CAMPAIGN_ID_PARAM}
+{_RESEARCH_ID_PARAM}
 
-Returns: Deletion confirmation.""",
+{_RETURNS_DELETED}""",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -537,14 +559,14 @@ Returns: Deletion confirmation.""",
                 "required": ["campaign_id", "research_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_research_reorder",
-            description="""Change the order of a campaign research item.
+            description=f"""Change the order of a campaign research item.
 
 Parameters:
-- campaign_id (required): Campaign ID
-- research_id (required): Research item ID
-- new_order (required): New order index (0-based)
+{_CAMPAIGN_ID_PARAM}
+{_RESEARCH_ID_PARAM}
+{_NEW_ORDER_PARAM}
 
 Returns: Updated research item with new order.""",
             inputSchema={
@@ -560,14 +582,14 @@ Returns: Updated research item with new order.""",
                 "required": ["campaign_id", "research_id", "new_order"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="campaign_renumber_tasks",
-            description="""Renumber all tasks in a campaign sequentially.
+            description=f"""Renumber all tasks in a campaign sequentially.
 
 Tasks are numbered based on their dependency order (topological sort).
 
 Parameters:
-- campaign_id (required): Campaign ID
+{_CAMPAIGN_ID_PARAM}
 - start_from (optional): Starting number (default: 1)
 
 Returns: Renumbering summary with task numbers.""",
@@ -584,4 +606,7 @@ Returns: Renumbering summary with task numbers.""",
                 "required": ["campaign_id"],
             },
         ),
-    ]
+    )
+    for tool in tools:
+        tool.inputSchema = freeze(tool.inputSchema)
+    return tools
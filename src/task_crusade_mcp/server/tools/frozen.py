@@ -0,0 +1,69 @@
+"""
+Read-only containers for schema fragments shared across MCP tools.
+
+Tool schemas share property dicts and enum lists by reference, so a stray
+mutation through one tool would change every tool using the fragment.
+``types.MappingProxyType`` and tuples would prevent that, but pydantic cannot
+serialize a mappingproxy and JSON Schema requires objects and arrays to be
+real dicts and lists. These subclasses keep the dict/list types and reject
+mutation instead.
+"""
+
+from typing import Any, Dict, List, NoReturn
+
+
+def _read_only(self: Any, *args: Any, **kwargs: Any) -> NoReturn:
+    raise TypeError(f"{type(self).__name__} is read-only")
+
+
+class FrozenDict(Dict[str, Any]):
+    """A dict that raises TypeError on mutation."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __copy__(self) -> Dict[str, Any]:
+        return dict(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenDict":
+        # Contents are read-only too, so the fragment can be shared as-is.
+        return self
+
+    def __reduce__(self) -> Any:
+        return (FrozenDict, (dict(self),))
+
+
+class FrozenList(List[Any]):
+    """A list that raises TypeError on mutation."""
+
+    __slots__ = ()
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __copy__(self) -> List[Any]:
+        return list(self)
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "FrozenList":
+        return self
+
+    def __reduce__(self) -> Any:
+        return (FrozenList, (list(self),))
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively convert dicts and lists to their read-only counterparts.
+
+    Already-frozen containers are returned unchanged, so shared fragments keep
+    their identity when a schema that references them is frozen.
+    """
+    if isinstance(value, (FrozenDict, FrozenList)):
+        return value
+    if isinstance(value, dict):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return FrozenList([freeze(item) for item in value])
+    return value
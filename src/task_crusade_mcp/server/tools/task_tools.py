@@ -1,14 +1,212 @@
 """Task MCP tool definitions."""
 
-from typing import List
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Tuple
+
+from task_crusade_mcp.server.tools.frozen import FrozenDict, FrozenList, freeze
+
+if TYPE_CHECKING:
+    from mcp.types import Tool
+
+# Enum values shared by every schema that accepts them. Kept as lists (not
+# tuples) because JSON Schema validators require ``enum`` to be an array.
+# Shared fragments are read-only so no tool can change them for the others.
+_STATUS_ENUM = FrozenList(["pending", "in-progress", "blocked", "done", "cancelled"])
+_PRIORITY_ENUM = FrozenList(["low", "medium", "high", "critical"])
+_TASK_TYPE_ENUM = FrozenList(
+    [
+        "code",
+        "research",
+        "test",
+        "documentation",
+        "refactor",
+        "deployment",
+        "review",
+    ]
+)
+_STEP_TYPE_ENUM = FrozenList(["setup", "trigger", "verify", "cleanup", "debug", "fix", "iterate"])
+_RESEARCH_TYPE_ENUM = FrozenList(["findings", "approaches", "docs"])
+
+# Identifier properties repeated across most schemas, shared by reference.
+_TASK_ID_PROP = FrozenDict({"type": "string", "description": "Task ID"})
+_CRITERIA_ID_PROP = FrozenDict({"type": "string", "description": "Criterion ID"})
+_RESEARCH_ID_PROP = FrozenDict({"type": "string", "description": "Research ID"})
+_NOTE_ID_PROP = FrozenDict({"type": "string", "description": "Note ID"})
+_CAMPAIGN_ID_PROP = FrozenDict({"type": "string", "description": "Campaign ID"})
+_STEP_ID_PROP = FrozenDict({"type": "string", "description": "Step ID"})
+
+# Other properties repeated verbatim across schemas. Equal string literals are
+# already merged by the compiler; sharing the dicts removes the per-schema
+# allocations as well.
+_NEW_CONTENT_PROP = FrozenDict({"type": "string", "description": "New content"})
+_NEW_ORDER_PROP = FrozenDict({"type": "integer", "description": "New order"})
+_FILTER_CAMPAIGN_PROP = FrozenDict({"type": "string", "description": "Filter by campaign"})
+_STEP_CONTENT_PROP = FrozenDict({"type": "string", "description": "Step content"})
+
+# Shared properties by argument name. Schemas made only of these fields are
+# built by _schema, so tools taking the same arguments share one schema.
+_FIELD_DEFS: Dict[str, Dict[str, Any]] = {
+    "task_id": _TASK_ID_PROP,
+    "criteria_id": _CRITERIA_ID_PROP,
+    "criterion_id": _CRITERIA_ID_PROP,
+    "research_id": _RESEARCH_ID_PROP,
+    "note_id": _NOTE_ID_PROP,
+    "step_id": _STEP_ID_PROP,
+    "new_order": _NEW_ORDER_PROP,
+}
+
+
+@lru_cache(maxsize=None)
+def _schema(*required: str) -> FrozenDict:
+    """
+    Build the input schema for a tool whose arguments are all required fields.
+
+    Results are memoized per argument tuple, so every tool with the same
+    arguments (e.g. ``task_id`` and ``step_id``) gets the same frozen schema.
+
+    Args:
+        *required: Field names from ``_FIELD_DEFS``, in property order.
+
+    Returns:
+        A read-only object schema requiring every field.
+    """
+    return FrozenDict(
+        {
+            "type": "object",
+            "properties": FrozenDict({name: _FIELD_DEFS[name] for name in required}),
+            "required": FrozenList(required),
+        }
+    )
+
+
+# Description lines repeated across many tools.
+_TASK_ID_PARAM = "- task_id (required): Task ID"
+_CRITERION_ID_PARAM = "- criterion_id (required): Criterion ID"
+_STEP_ID_PARAM = "- step_id (required): Testing step ID"
+_NEW_ORDER_PARAM = "- new_order (required): New order index (0-based)"
+_RETURNS_DELETED = "Returns: Deletion confirmation."
+
+
+def _make_crud_tools(
+    prefix: str,
+    id_field: str,
+    id_prop: Dict[str, Any],
+    item: str,
+    short: str,
+    article: str,
+    update_fields: Tuple[Tuple[str, Dict[str, Any], bool], ...],
+) -> Tuple[Tool, ...]:
+    """
+    Build the list/show/update/delete/reorder tools for a task sub-item type.
+
+    Args:
+        prefix: Tool name prefix (e.g. "task_research").
+        id_field: Name of the sub-item ID argument (e.g. "research_id").
+        id_prop: Shared schema property for the sub-item ID.
+        item: Full item noun used in summaries (e.g. "implementation note").
+        short: Short item noun used in return lines (e.g. "note").
+        article: Indefinite article for ``item`` ("a" or "an").
+        update_fields: (name, property, required) triples accepted by update.
+
+    Returns:
+        The five CRUD tools in list/show/update/delete/reorder order.
+    """
+    from mcp.types import Tool
+
+    id_line = f"- {id_field} (required): {short.capitalize()} ID"
+    update_lines = "\n".join(
+        f"- {name} ({'required' if required else 'optional'}): {prop['description']}"
+        for name, prop, required in update_fields
+    )
+    return (
+        Tool.model_construct(
+            name=f"{prefix}_list",
+            description=f"""List all {item}s for a task.
+
+Parameters:
+{_TASK_ID_PARAM}
+
+Returns: List of {short}s.""",
+            inputSchema=_schema("task_id"),
+        ),
+        Tool.model_construct(
+            name=f"{prefix}_show",
+            description=f"""Get a single {item} by ID.
+
+Parameters:
+{_TASK_ID_PARAM}
+{id_line}
+
+Returns: {short.capitalize()} details.""",
+            inputSchema=_schema("task_id", id_field),
+        ),
+        Tool.model_construct(
+            name=f"{prefix}_update",
+            description=f"""Update {article} {item}.
+
+Parameters:
+{_TASK_ID_PARAM}
+{id_line}
+{update_lines}
+
+Returns: Updated {short}.""",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "task_id": _TASK_ID_PROP,
+                    id_field: id_prop,
+                    **{name: prop for name, prop, _ in update_fields},
+                },
+                "required": [
+                    "task_id",
+                    id_field,
+                    *(name for name, _, required in update_fields if required),
+                ],
+            },
+        ),
+        Tool.model_construct(
+            name=f"{prefix}_delete",
+            description=f"""Delete {article} {item}.
+
+Parameters:
+{_TASK_ID_PARAM}
+{id_line}
 
-from mcp.types import Tool
+{_RETURNS_DELETED}""",
+            inputSchema=_schema("task_id", id_field),
+        ),
+        Tool.model_construct(
+            name=f"{prefix}_reorder",
+            description=f"""Change {item} order.
 
+Parameters:
+{_TASK_ID_PARAM}
+{id_line}
+{_NEW_ORDER_PARAM}
 
-def get_task_tools() -> List[Tool]:
-    """Get task management MCP tools."""
-    return [
-        Tool(
+Returns: Updated {short}.""",
+            inputSchema=_schema("task_id", id_field, "new_order"),
+        ),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_task_tools() -> Tuple[Tool, ...]:
+    """
+    Get task management MCP tools.
+
+    The definitions below are static, trusted data, so each Tool is built with
+    ``model_construct`` to skip pydantic validation. The tuple is built on
+    first call and cached, which also defers importing ``mcp.types`` until
+    the tools are actually needed. The schemas are frozen so callers sharing
+    the cached tools cannot modify them.
+    """
+    from mcp.types import Tool
+
+    tools = (
+        Tool.model_construct(
             name="task_create",
             description="""Create a new task in a campaign.
 
@@ -62,24 +260,16 @@ Related: campaign_create_with_tasks (bulk), task_update (modify dependencies),
                 "type": "object",
                 "properties": {
                     "title": {"type": "string", "description": "Task title"},
-                    "campaign_id": {"type": "string", "description": "Campaign ID"},
+                    "campaign_id": _CAMPAIGN_ID_PROP,
                     "description": {"type": "string", "description": "Task description"},
                     "priority": {
                         "type": "string",
-                        "enum": ["low", "medium", "high", "critical"],
+                        "enum": _PRIORITY_ENUM,
                         "description": "Task priority",
                     },
                     "type": {
                         "type": "string",
-                        "enum": [
-                            "code",
-                            "research",
-                            "test",
-                            "documentation",
-                            "refactor",
-                            "deployment",
-                            "review",
-                        ],
+                        "enum": _TASK_TYPE_ENUM,
                         "description": "Task type",
                     },
                     "dependencies": {
@@ -96,7 +286,7 @@ Related: campaign_create_with_tasks (bulk), task_update (modify dependencies),
                 "required": ["title", "campaign_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="task_list",
             description="""List tasks with optional filtering.
 
@@ -109,41 +299,35 @@ Returns: List of tasks.""",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "campaign_id": {"type": "string", "description": "Filter by campaign"},
+                    "campaign_id": _FILTER_CAMPAIGN_PROP,
                     "status": {
                         "type": "string",
-                        "enum": ["pending", "in-progress", "blocked", "done", "cancelled"],
+                        "enum": _STATUS_ENUM,
                         "description": "Filter by status",
                     },
                     "priority": {
                         "type": "string",
-                        "enum": ["low", "medium", "high", "critical"],
+                        "enum": _PRIORITY_ENUM,
                         "description": "Filter by priority",
                     },
                 },
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="task_show",
-            description="""Show detailed task information.
+            description=f"""Show detailed task information.
 
 Returns task with acceptance criteria, research, implementation notes, and testing steps.
 
 Parameters:
-- task_id (required): Task ID
+{_TASK_ID_PARAM}
 
 Returns: Task details with all associated data.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                },
-                "required": ["task_id"],
-            },
+            inputSchema=_schema("task_id"),
         ),
-        Tool(
+        Tool.model_construct(
             name="task_update",
-            description="""Update task properties including dependencies, status, and priority.
+            description=f"""Update task properties including dependencies, status, and priority.
 
 WHEN TO USE THIS TOOL:
 - Change task status (pending → in-progress → blocked → done)
@@ -158,7 +342,7 @@ DEPENDENCY MANAGEMENT - Choose ONE per call:
 - dependencies: REPLACE ALL dependencies with this list
 
 Parameters:
-- task_id (required): Task ID
+{_TASK_ID_PARAM}
 - status (optional): "pending", "in-progress", "blocked", "done", "cancelled"
 - priority (optional): "low", "medium", "high", "critical"
 - title (optional): New title
@@ -179,15 +363,15 @@ Returns: Updated task.""",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
+                    "task_id": _TASK_ID_PROP,
                     "status": {
                         "type": "string",
-                        "enum": ["pending", "in-progress", "blocked", "done", "cancelled"],
+                        "enum": _STATUS_ENUM,
                         "description": "New status",
                     },
                     "priority": {
                         "type": "string",
-                        "enum": ["low", "medium", "high", "critical"],
+                        "enum": _PRIORITY_ENUM,
                         "description": "New priority",
                     },
                     "title": {"type": "string", "description": "New title"},
@@ -211,14 +395,14 @@ Returns: Updated task.""",
                 "required": ["task_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="task_delete",
-            description="""Delete a task permanently.
+            description=f"""Delete a task permanently.
 
 Parameters:
 - task_id (required): Task ID to delete
 
-Returns: Deletion confirmation.""",
+{_RETURNS_DELETED}""",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -227,7 +411,7 @@ Returns: Deletion confirmation.""",
                 "required": ["task_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="task_complete",
             description="""Mark a task as complete.
 
@@ -238,17 +422,11 @@ Parameters:
 - task_id (required): Task ID to complete
 
 Returns: Completed task or error if criteria not met.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                },
-                "required": ["task_id"],
-            },
+            inputSchema=_schema("task_id"),
         ),
-        Tool(
+        Tool.model_construct(
             name="task_acceptance_criteria_add",
-            description="""Add an acceptance criterion to a task.
+            description=f"""Add an acceptance criterion to a task.
 
 WHEN TO USE THIS TOOL:
 - Define completion requirements for a task
@@ -259,7 +437,7 @@ Acceptance criteria define the completion requirements for a task.
 All criteria must be marked as met before the task can be completed.
 
 Parameters:
-- task_id (required): Task ID
+{_TASK_ID_PARAM}
 - content (required): Criterion description
 
 WORKFLOW:
@@ -289,13 +467,13 @@ data:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
+                    "task_id": _TASK_ID_PROP,
                     "content": {"type": "string", "description": "Criterion description"},
                 },
                 "required": ["task_id", "content"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="task_acceptance_criteria_mark_met",
             description="""Mark an acceptance criterion as met.
 
@@ -306,15 +484,9 @@ Parameters:
 - criteria_id (required): Criterion ID to mark as met
 
 Returns: Updated criterion.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "criteria_id": {"type": "string", "description": "Criterion ID"},
-                },
-                "required": ["criteria_id"],
-            },
+            inputSchema=_schema("criteria_id"),
         ),
-        Tool(
+        Tool.model_construct(
             name="task_acceptance_criteria_mark_unmet",
             description="""Mark an acceptance criterion as not met.
 
@@ -324,17 +496,11 @@ Parameters:
 - criteria_id (required): Criterion ID to mark as unmet
 
 Returns: Updated criterion.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "criteria_id": {"type": "string", "description": "Criterion ID"},
-                },
-                "required": ["criteria_id"],
-            },
+            inputSchema=_schema("criteria_id"),
         ),
-        Tool(
+        Tool.model_construct(
             name="task_research_add",
-            description="""Add a research item to a task.
+            description=f"""Add a research item to a task.
 
 WHEN TO USE THIS TOOL:
 - Document findings BEFORE implementation
@@ -348,7 +514,7 @@ Research types:
 - docs: Links to documentation/resources
 
 Parameters:
-- task_id (required): Task ID
+{_TASK_ID_PARAM}
 - content (required): Research content
 - research_type (optional): "findings", "approaches", "docs" (default: "findings")
 
@@ -365,20 +531,20 @@ Returns: Created research item with ID.""",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
+                    "task_id": _TASK_ID_PROP,
                     "content": {"type": "string", "description": "Research content"},
                     "research_type": {
                         "type": "string",
-                        "enum": ["findings", "approaches", "docs"],
+                        "enum": _RESEARCH_TYPE_ENUM,
                         "description": "Type of research",
                     },
                 },
                 "required": ["task_id", "content"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="task_implementation_notes_add",
-            description="""Add an implementation note to a task.
+            description=f"""Add an implementation note to a task.
 
 WHEN TO USE THIS TOOL:
 - Document implementation decisions
@@ -387,7 +553,7 @@ WHEN TO USE THIS TOOL:
 - Capture code change details
 
 Parameters:
-- task_id (required): Task ID
+{_TASK_ID_PARAM}
 - content (required): Note content
 
 EXAMPLE:
@@ -402,15 +568,15 @@ Returns: Created note with ID.""",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
+                    "task_id": _TASK_ID_PROP,
                     "content": {"type": "string", "description": "Note content"},
                 },
                 "required": ["task_id", "content"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="task_testing_step_add",
-            description="""Add a testing step to a task.
+            description=f"""Add a testing step to a task.
 
 WHEN TO USE THIS TOOL:
 - Define individual test/verification steps
@@ -427,7 +593,7 @@ Testing steps provide verification guidance. Step types:
 - iterate: Refinement and retesting cycles
 
 Parameters:
-- task_id (required): Task ID
+{_TASK_ID_PARAM}
 - content (required): Step content
 - step_type (optional): Type of step (default: "verify")
 
@@ -444,19 +610,11 @@ Returns: Created testing step with ID.""",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "content": {"type": "string", "description": "Step content"},
+                    "task_id": _TASK_ID_PROP,
+                    "content": _STEP_CONTENT_PROP,
                     "step_type": {
                         "type": "string",
-                        "enum": [
-                            "setup",
-                            "trigger",
-                            "verify",
-                            "cleanup",
-                            "debug",
-                            "fix",
-                            "iterate",
-                        ],
+                        "enum": _STEP_TYPE_ENUM,
                         "description": "Type of step",
                     },
                 },
@@ -464,7 +622,7 @@ Returns: Created testing step with ID.""",
             },
         ),
         # Phase 2: Search & Analytics tools
-        Tool(
+        Tool.model_construct(
             name="task_search",
             description="""Full-text search across task titles and descriptions.
 
@@ -480,18 +638,15 @@ Returns: Matching tasks with match information.""",
                 "type": "object",
                 "properties": {
                     "query": {"type": "string", "description": "Search query"},
-                    "campaign_id": {
-                        "type": "string",
-                        "description": "Filter by campaign",
-                    },
+                    "campaign_id": _FILTER_CAMPAIGN_PROP,
                     "status": {
                         "type": "string",
-                        "enum": ["pending", "in-progress", "blocked", "done", "cancelled"],
+                        "enum": _STATUS_ENUM,
                         "description": "Filter by status",
                     },
                     "priority": {
                         "type": "string",
-                        "enum": ["low", "medium", "high", "critical"],
+                        "enum": _PRIORITY_ENUM,
                         "description": "Filter by priority",
                     },
                     "limit": {
@@ -503,7 +658,7 @@ Returns: Matching tasks with match information.""",
                 "required": ["query"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="task_stats",
             description="""Get aggregate task statistics.
 
@@ -517,34 +672,25 @@ Returns: Task statistics summary.""",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "campaign_id": {
-                        "type": "string",
-                        "description": "Filter by campaign",
-                    },
+                    "campaign_id": _FILTER_CAMPAIGN_PROP,
                 },
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="task_get_dependency_info",
-            description="""Get dependency information for a task.
+            description=f"""Get dependency information for a task.
 
 Returns upstream dependencies (blockers) and downstream dependents (tasks
 that depend on this task).
 
 Parameters:
-- task_id (required): Task ID
+{_TASK_ID_PARAM}
 
 Returns: Dependency graph information.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                },
-                "required": ["task_id"],
-            },
+            inputSchema=_schema("task_id"),
         ),
         # Phase 3: Bulk & Workflow tools
-        Tool(
+        Tool.model_construct(
             name="task_bulk_update",
             description="""Update multiple tasks at once.
 
@@ -564,19 +710,19 @@ Returns: Update summary with success/failure counts.""",
                     },
                     "status": {
                         "type": "string",
-                        "enum": ["pending", "in-progress", "blocked", "done", "cancelled"],
+                        "enum": _STATUS_ENUM,
                         "description": "New status",
                     },
                     "priority": {
                         "type": "string",
-                        "enum": ["low", "medium", "high", "critical"],
+                        "enum": _PRIORITY_ENUM,
                         "description": "New priority",
                     },
                 },
                 "required": ["task_ids"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="task_create_from_template",
             description="""Create a task from a predefined template.
 
@@ -612,7 +758,7 @@ Returns: Created task.""",
                         ],
                         "description": "Template name",
                     },
-                    "campaign_id": {"type": "string", "description": "Campaign ID"},
+                    "campaign_id": _CAMPAIGN_ID_PROP,
                     "title": {"type": "string", "description": "Override title"},
                     "overrides": {
                         "type": "string",
@@ -622,9 +768,9 @@ Returns: Created task.""",
                 "required": ["template_name", "campaign_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="task_complete_with_workflow",
-            description="""Complete a task with full validation.
+            description=f"""Complete a task with full validation.
 
 Validates before completing:
 - All acceptance criteria are met
@@ -634,306 +780,111 @@ Validates before completing:
 Use this for strict workflow enforcement.
 
 Parameters:
-- task_id (required): Task ID
+{_TASK_ID_PARAM}
 
 Returns: Completed task or validation errors.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                },
-                "required": ["task_id"],
-            },
+            inputSchema=_schema("task_id"),
         ),
         # Phase 4: Task Research CRUD
-        Tool(
-            name="task_research_list",
-            description="""List all research items for a task.
-
-Parameters:
-- task_id (required): Task ID
-
-Returns: List of research items.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                },
-                "required": ["task_id"],
-            },
-        ),
-        Tool(
-            name="task_research_show",
-            description="""Get a single research item by ID.
-
-Parameters:
-- task_id (required): Task ID
-- research_id (required): Research item ID
-
-Returns: Research item details.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "research_id": {"type": "string", "description": "Research ID"},
-                },
-                "required": ["task_id", "research_id"],
-            },
-        ),
-        Tool(
-            name="task_research_update",
-            description="""Update a research item.
-
-Parameters:
-- task_id (required): Task ID
-- research_id (required): Research item ID
-- content (optional): New content
-- research_type (optional): New type
-
-Returns: Updated research item.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "research_id": {"type": "string", "description": "Research ID"},
-                    "content": {"type": "string", "description": "New content"},
-                    "research_type": {
+        *_make_crud_tools(
+            prefix="task_research",
+            id_field="research_id",
+            id_prop=_RESEARCH_ID_PROP,
+            item="research item",
+            short="research item",
+            article="a",
+            update_fields=(
+                ("content", _NEW_CONTENT_PROP, False),
+                (
+                    "research_type",
+                    {
                         "type": "string",
-                        "enum": ["findings", "approaches", "docs"],
+                        "enum": _RESEARCH_TYPE_ENUM,
                         "description": "New type",
                     },
-                },
-                "required": ["task_id", "research_id"],
-            },
-        ),
-        Tool(
-            name="task_research_delete",
-            description="""Delete a research item.
-
-Parameters:
-- task_id (required): Task ID
-- research_id (required): Research item ID
-
-Returns: Deletion confirmation.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "research_id": {"type": "string", "description": "Research ID"},
-                },
-                "required": ["task_id", "research_id"],
-            },
-        ),
-        Tool(
-            name="task_research_reorder",
-            description="""Change research item order.
-
-Parameters:
-- task_id (required): Task ID
-- research_id (required): Research item ID
-- new_order (required): New order index (0-based)
-
-Returns: Updated research item.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "research_id": {"type": "string", "description": "Research ID"},
-                    "new_order": {"type": "integer", "description": "New order"},
-                },
-                "required": ["task_id", "research_id", "new_order"],
-            },
+                    False,
+                ),
+            ),
         ),
         # Phase 5: Task Implementation Notes CRUD
-        Tool(
-            name="task_implementation_notes_list",
-            description="""List all implementation notes for a task.
-
-Parameters:
-- task_id (required): Task ID
-
-Returns: List of notes.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                },
-                "required": ["task_id"],
-            },
-        ),
-        Tool(
-            name="task_implementation_notes_show",
-            description="""Get a single implementation note by ID.
-
-Parameters:
-- task_id (required): Task ID
-- note_id (required): Note ID
-
-Returns: Note details.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "note_id": {"type": "string", "description": "Note ID"},
-                },
-                "required": ["task_id", "note_id"],
-            },
-        ),
-        Tool(
-            name="task_implementation_notes_update",
-            description="""Update an implementation note.
-
-Parameters:
-- task_id (required): Task ID
-- note_id (required): Note ID
-- content (required): New content
-
-Returns: Updated note.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "note_id": {"type": "string", "description": "Note ID"},
-                    "content": {"type": "string", "description": "New content"},
-                },
-                "required": ["task_id", "note_id", "content"],
-            },
-        ),
-        Tool(
-            name="task_implementation_notes_delete",
-            description="""Delete an implementation note.
-
-Parameters:
-- task_id (required): Task ID
-- note_id (required): Note ID
-
-Returns: Deletion confirmation.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "note_id": {"type": "string", "description": "Note ID"},
-                },
-                "required": ["task_id", "note_id"],
-            },
-        ),
-        Tool(
-            name="task_implementation_notes_reorder",
-            description="""Change implementation note order.
-
-Parameters:
-- task_id (required): Task ID
-- note_id (required): Note ID
-- new_order (required): New order index (0-based)
-
-Returns: Updated note.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "note_id": {"type": "string", "description": "Note ID"},
-                    "new_order": {"type": "integer", "description": "New order"},
-                },
-                "required": ["task_id", "note_id", "new_order"],
-            },
+        *_make_crud_tools(
+            prefix="task_implementation_notes",
+            id_field="note_id",
+            id_prop=_NOTE_ID_PROP,
+            item="implementation note",
+            short="note",
+            article="an",
+            update_fields=(("content", _NEW_CONTENT_PROP, True),),
         ),
         # Phase 6: Task Acceptance Criteria CRUD
-        Tool(
+        Tool.model_construct(
             name="task_acceptance_criteria_list",
-            description="""List all acceptance criteria for a task.
+            description=f"""List all acceptance criteria for a task.
 
 Parameters:
-- task_id (required): Task ID
+{_TASK_ID_PARAM}
 
 Returns: List of criteria with met/unmet status.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                },
-                "required": ["task_id"],
-            },
+            inputSchema=_schema("task_id"),
         ),
-        Tool(
+        Tool.model_construct(
             name="task_acceptance_criteria_show",
-            description="""Get a single acceptance criterion by ID.
+            description=f"""Get a single acceptance criterion by ID.
 
 Parameters:
-- task_id (required): Task ID
-- criterion_id (required): Criterion ID
+{_TASK_ID_PARAM}
+{_CRITERION_ID_PARAM}
 
 Returns: Criterion details.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "criterion_id": {"type": "string", "description": "Criterion ID"},
-                },
-                "required": ["task_id", "criterion_id"],
-            },
+            inputSchema=_schema("task_id", "criterion_id"),
         ),
-        Tool(
+        Tool.model_construct(
             name="task_acceptance_criteria_update",
-            description="""Update an acceptance criterion description.
+            description=f"""Update an acceptance criterion description.
 
 Parameters:
-- task_id (required): Task ID
-- criterion_id (required): Criterion ID
+{_TASK_ID_PARAM}
+{_CRITERION_ID_PARAM}
 - content (required): New content
 
 Returns: Updated criterion.""",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "criterion_id": {"type": "string", "description": "Criterion ID"},
-                    "content": {"type": "string", "description": "New content"},
+                    "task_id": _TASK_ID_PROP,
+                    "criterion_id": _CRITERIA_ID_PROP,
+                    "content": _NEW_CONTENT_PROP,
                 },
                 "required": ["task_id", "criterion_id", "content"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="task_acceptance_criteria_delete",
-            description="""Delete an acceptance criterion.
+            description=f"""Delete an acceptance criterion.
 
 Parameters:
-- task_id (required): Task ID
-- criterion_id (required): Criterion ID
+{_TASK_ID_PARAM}
+{_CRITERION_ID_PARAM}
 
-Returns: Deletion confirmation.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "criterion_id": {"type": "string", "description": "Criterion ID"},
-                },
-                "required": ["task_id", "criterion_id"],
-            },
+{_RETURNS_DELETED}""",
+            inputSchema=_schema("task_id", "criterion_id"),
         ),
-        Tool(
+        Tool.model_construct(
             name="task_acceptance_criteria_reorder",
-            description="""Change acceptance criterion order.
+            description=f"""Change acceptance criterion order.
 
 Parameters:
-- task_id (required): Task ID
-- criterion_id (required): Criterion ID
-- new_order (required): New order index (0-based)
+{_TASK_ID_PARAM}
+{_CRITERION_ID_PARAM}
+{_NEW_ORDER_PARAM}
 
 Returns: Updated criterion.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "criterion_id": {"type": "string", "description": "Criterion ID"},
-                    "new_order": {"type": "integer", "description": "New order"},
-                },
-                "required": ["task_id", "criterion_id", "new_order"],
-            },
+            inputSchema=_schema("task_id", "criterion_id", "new_order"),
         ),
         # Phase 7: Task Testing Strategy CRUD
-        Tool(
+        Tool.model_construct(
             name="task_testing_strategy_add",
-            description="""Add a testing strategy or verification step to a task.
+            description=f"""Add a testing strategy or verification step to a task.
 
 WHEN TO USE THIS TOOL:
 - Define HIGH-LEVEL testing strategy (overall approach)
@@ -953,7 +904,7 @@ Step types:
 - debug/fix/iterate: Testing cycle support
 
 Parameters:
-- task_id (required): Task ID
+{_TASK_ID_PARAM}
 - content (required): Testing strategy or step description
 - step_type (optional): Type of step (default: "verify")
 
@@ -977,66 +928,45 @@ Returns: Created testing step with ID.""",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "content": {"type": "string", "description": "Step content"},
+                    "task_id": _TASK_ID_PROP,
+                    "content": _STEP_CONTENT_PROP,
                     "step_type": {
                         "type": "string",
-                        "enum": [
-                            "setup",
-                            "trigger",
-                            "verify",
-                            "cleanup",
-                            "debug",
-                            "fix",
-                            "iterate",
-                        ],
+                        "enum": _STEP_TYPE_ENUM,
                         "description": "Step type",
                     },
                 },
                 "required": ["task_id", "content"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="task_testing_strategy_list",
-            description="""List all testing steps for a task.
+            description=f"""List all testing steps for a task.
 
 Parameters:
-- task_id (required): Task ID
+{_TASK_ID_PARAM}
 
 Returns: List of testing steps with status.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                },
-                "required": ["task_id"],
-            },
+            inputSchema=_schema("task_id"),
         ),
-        Tool(
+        Tool.model_construct(
             name="task_testing_strategy_show",
-            description="""Get a single testing step by ID.
+            description=f"""Get a single testing step by ID.
 
 Parameters:
-- task_id (required): Task ID
-- step_id (required): Testing step ID
+{_TASK_ID_PARAM}
+{_STEP_ID_PARAM}
 
 Returns: Testing step details.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "step_id": {"type": "string", "description": "Step ID"},
-                },
-                "required": ["task_id", "step_id"],
-            },
+            inputSchema=_schema("task_id", "step_id"),
         ),
-        Tool(
+        Tool.model_construct(
             name="task_testing_strategy_update",
-            description="""Update a testing step.
+            description=f"""Update a testing step.
 
 Parameters:
-- task_id (required): Task ID
-- step_id (required): Testing step ID
+{_TASK_ID_PARAM}
+{_STEP_ID_PARAM}
 - content (optional): New content
 - step_type (optional): New step type
 
@@ -1044,120 +974,76 @@ Returns: Updated testing step.""",
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "step_id": {"type": "string", "description": "Step ID"},
-                    "content": {"type": "string", "description": "New content"},
+                    "task_id": _TASK_ID_PROP,
+                    "step_id": _STEP_ID_PROP,
+                    "content": _NEW_CONTENT_PROP,
                     "step_type": {
                         "type": "string",
-                        "enum": [
-                            "setup",
-                            "trigger",
-                            "verify",
-                            "cleanup",
-                            "debug",
-                            "fix",
-                            "iterate",
-                        ],
+                        "enum": _STEP_TYPE_ENUM,
                         "description": "Step type",
                     },
                 },
                 "required": ["task_id", "step_id"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="task_testing_strategy_delete",
-            description="""Delete a testing step.
+            description=f"""Delete a testing step.
 
 Parameters:
-- task_id (required): Task ID
-- step_id (required): Testing step ID
+{_TASK_ID_PARAM}
+{_STEP_ID_PARAM}
 
-Returns: Deletion confirmation.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "step_id": {"type": "string", "description": "Step ID"},
-                },
-                "required": ["task_id", "step_id"],
-            },
+{_RETURNS_DELETED}""",
+            inputSchema=_schema("task_id", "step_id"),
         ),
-        Tool(
+        Tool.model_construct(
             name="task_testing_strategy_mark_passed",
-            description="""Mark a testing step as passed.
+            description=f"""Mark a testing step as passed.
 
 Parameters:
-- task_id (required): Task ID
-- step_id (required): Testing step ID
+{_TASK_ID_PARAM}
+{_STEP_ID_PARAM}
 
 Returns: Updated testing step.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "step_id": {"type": "string", "description": "Step ID"},
-                },
-                "required": ["task_id", "step_id"],
-            },
+            inputSchema=_schema("task_id", "step_id"),
         ),
-        Tool(
+        Tool.model_construct(
             name="task_testing_strategy_mark_failed",
-            description="""Mark a testing step as failed.
+            description=f"""Mark a testing step as failed.
 
 Parameters:
-- task_id (required): Task ID
-- step_id (required): Testing step ID
+{_TASK_ID_PARAM}
+{_STEP_ID_PARAM}
 
 Returns: Updated testing step.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "step_id": {"type": "string", "description": "Step ID"},
-                },
-                "required": ["task_id", "step_id"],
-            },
+            inputSchema=_schema("task_id", "step_id"),
         ),
-        Tool(
+        Tool.model_construct(
             name="task_testing_strategy_mark_skipped",
-            description="""Mark a testing step as skipped.
+            description=f"""Mark a testing step as skipped.
 
 Parameters:
-- task_id (required): Task ID
-- step_id (required): Testing step ID
+{_TASK_ID_PARAM}
+{_STEP_ID_PARAM}
 
 Returns: Updated testing step.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "step_id": {"type": "string", "description": "Step ID"},
-                },
-                "required": ["task_id", "step_id"],
-            },
+            inputSchema=_schema("task_id", "step_id"),
         ),
-        Tool(
+        Tool.model_construct(
             name="task_testing_strategy_reorder",
-            description="""Change testing step order.
+            description=f"""Change testing step order.
 
 Parameters:
-- task_id (required): Task ID
-- step_id (required): Testing step ID
-- new_order (required): New order index (0-based)
+{_TASK_ID_PARAM}
+{_STEP_ID_PARAM}
+{_NEW_ORDER_PARAM}
 
 Returns: Updated testing step.""",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "task_id": {"type": "string", "description": "Task ID"},
-                    "step_id": {"type": "string", "description": "Step ID"},
-                    "new_order": {"type": "integer", "description": "New order"},
-                },
-                "required": ["task_id", "step_id", "new_order"],
-            },
+            inputSchema=_schema("task_id", "step_id", "new_order"),
         ),
         # Bulk tools
-        Tool(
+        Tool.model_construct(
             name="task_bulk_add_research",
             description="""Bulk add research items to multiple tasks atomically.
 
@@ -1183,7 +1069,7 @@ Related: task_research_add (single task), task_bulk_add_details (different detai
                 "required": ["research_json"],
             },
         ),
-        Tool(
+        Tool.model_construct(
             name="task_bulk_add_details",
             description="""Add DIFFERENT research, notes, criteria, and testing strategy to multiple tasks atomically.
 
@@ -1207,4 +1093,7 @@ Related: task_bulk_add_research (shared research), task_research_add, task_imple
                 "required": ["details_json"],
             },
         ),
-    ]
+    )
+    for tool in tools:
+        tool.inputSchema = freeze(tool.inputSchema)
+    return tools
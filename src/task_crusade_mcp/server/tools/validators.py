@@ -0,0 +1,168 @@
+"""
+Tool argument validation against MCP tool input schemas.
+
+The MCP SDK's default input validation calls ``jsonschema.validate`` on every
+tool call, which re-checks the schema against the metaschema and builds a new
+validator each time. The validators here are built once per tool and reused.
+
+Tool schemas are flat (typed properties, enums and required keys), so each
+tool also gets a compiled check that accepts valid arguments without walking
+the schema. Anything the check does not accept is handed to the jsonschema
+validator, which stays the single source of error messages.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, cast
+
+from task_crusade_mcp.server.tools.campaign_tools import get_campaign_tools
+from task_crusade_mcp.server.tools.task_tools import get_task_tools
+
+if TYPE_CHECKING:
+    from jsonschema import Draft202012Validator
+
+
+@lru_cache(maxsize=1)
+def _get_validators() -> Dict[str, Draft202012Validator]:
+    """Build one validator per tool, keyed by tool name."""
+    from jsonschema import Draft202012Validator
+
+    validators = {}
+    for tool in (*get_campaign_tools(), *get_task_tools()):
+        validators[tool.name] = Draft202012Validator(tool.inputSchema)
+    return validators
+
+
+# Keywords the compiled checks understand; schemas using anything else rely on
+# jsonschema alone.
+_FAST_SCHEMA_KEYS = frozenset({"type", "properties", "required"})
+_FAST_PROPERTY_KEYS = frozenset({"type", "description", "enum", "items", "default"})
+_FAST_TYPES: Dict[str, Tuple[type, ...]] = {
+    "string": (str,),
+    "integer": (int,),
+    "array": (list,),
+}
+
+ArgumentCheck = Callable[[Dict[str, Any]], bool]
+
+
+def _compile_property_check(prop: Dict[str, Any]) -> Optional[Callable[[Any], bool]]:
+    """Compile a check for a single property schema, or None if unsupported."""
+    if not prop.keys() <= _FAST_PROPERTY_KEYS or prop.get("type") not in _FAST_TYPES:
+        return None
+
+    expected = _FAST_TYPES[prop["type"]]
+    enum = tuple(prop["enum"]) if "enum" in prop else None
+    item_check = None
+    if "items" in prop:
+        item_check = _compile_property_check(prop["items"])
+        if item_check is None:
+            return None
+
+    def check(value: Any) -> bool:
+        # bool is a subclass of int but is not a JSON Schema integer.
+        if not isinstance(value, expected) or isinstance(value, bool):
+            return False
+        if enum is not None and value not in enum:
+            return False
+        if item_check is not None:
+            return all(item_check(item) for item in cast(List[Any], value))
+        return True
+
+    return check
+
+
+def _compile_check(schema: Dict[str, Any]) -> Optional[ArgumentCheck]:
+    """
+    Compile a check that returns True only for arguments valid under schema.
+
+    Returns None when the schema uses keywords the compiled checks do not
+    support. A False result means "not known valid", not "invalid".
+    """
+    if schema.get("type") != "object" or not schema.keys() <= _FAST_SCHEMA_KEYS:
+        return None
+
+    property_checks = {}
+    for name, prop in schema.get("properties", {}).items():
+        prop_check = _compile_property_check(prop)
+        if prop_check is None:
+            return None
+        property_checks[name] = prop_check
+    required = frozenset(schema.get("required", ()))
+
+    def check(arguments: Dict[str, Any]) -> bool:
+        if not isinstance(arguments, dict) or not required <= arguments.keys():
+            return False
+        for name, value in arguments.items():
+            prop_check = property_checks.get(name)
+            if prop_check is not None and not prop_check(value):
+                return False
+        return True
+
+    return check
+
+
+@lru_cache(maxsize=1)
+def _get_fast_checks() -> Dict[str, ArgumentCheck]:
+    """Compile fast-path checks for every tool whose schema supports one."""
+    checks = {}
+    for tool in (*get_campaign_tools(), *get_task_tools()):
+        check = _compile_check(tool.inputSchema)
+        if check is not None:
+            checks[tool.name] = check
+    return checks
+
+
+def build_validators() -> int:
+    """
+    Build the validators and compiled checks for every tool ahead of use.
+
+    Both are otherwise built on the first tool call. Calling this at startup
+    moves the jsonschema import and validator construction out of the first
+    request.
+
+    Returns:
+        The number of tools with a validator.
+    """
+    _get_fast_checks()
+    return len(_get_validators())
+
+
+def get_validator(tool_name: str) -> Optional[Draft202012Validator]:
+    """
+    Get the prebuilt input validator for a tool.
+
+    Args:
+        tool_name: Name of the MCP tool.
+
+    Returns:
+        The tool's validator, or None if the tool is unknown.
+    """
+    return _get_validators().get(tool_name)
+
+
+def validate_tool_arguments(tool_name: str, arguments: Dict[str, Any]) -> Optional[str]:
+    """
+    Validate tool arguments against the tool's input schema.
+
+    Args:
+        tool_name: Name of the MCP tool.
+        arguments: Arguments supplied by the client.
+
+    Returns:
+        The message of the most relevant validation error, or None if the
+        arguments are valid (or the tool is unknown).
+    """
+    from jsonschema.exceptions import best_match
+
+    check = _get_fast_checks().get(tool_name)
+    if check is not None and check(arguments):
+        return None
+
+    validator = get_validator(tool_name)
+    if validator is None:
+        return None
+
+    error = best_match(validator.iter_errors(arguments))
+    return error.message if error is not None else None
@@ -1,14 +1,47 @@
-"""Service layer - Business logic orchestration."""
+"""Service layer - Business logic orchestration.
 
-from task_crusade_mcp.services.campaign_service import CampaignService
-from task_crusade_mcp.services.hint_generator import HintGenerator
-from task_crusade_mcp.services.service_factory import ServiceFactory, get_service_factory
-from task_crusade_mcp.services.task_service import TaskService
+Exports are loaded on first access (PEP 562), so importing one name, such as
+``get_service_factory``, does not import every service module.
+"""
 
-__all__ = [
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from task_crusade_mcp.services.campaign_service import CampaignService
+    from task_crusade_mcp.services.hint_generator import HintGenerator
+    from task_crusade_mcp.services.service_factory import ServiceFactory, get_service_factory
+    from task_crusade_mcp.services.task_service import TaskService
+
+# Exported name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "CampaignService": "campaign_service",
+    "TaskService": "task_service",
+    "ServiceFactory": "service_factory",
+    "get_service_factory": "service_factory",
+    "HintGenerator": "hint_generator",
+}
+
+__all__ = (
     "CampaignService",
     "TaskService",
     "ServiceFactory",
     "get_service_factory",
     "HintGenerator",
-]
+)
+
+
+def __getattr__(name: str) -> Any:
+    """Import an exported name from its submodule on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value  # Later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> List[str]:
+    """Include lazy exports in dir() for completion and introspection."""
+    return sorted(set(globals()) | set(__all__))
@@ -7,8 +7,10 @@ and orchestration of repository calls.
 
 from __future__ import annotations
 
+import heapq
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import uuid
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from task_crusade_mcp.database.repositories import (
     CampaignRepository,
@@ -22,15 +24,38 @@ from task_crusade_mcp.domain.entities.result_types import (
     DomainResult,
     DomainSuccess,
 )
+from task_crusade_mcp.services.task_service import load_task_items, task_detail_item
 
 if TYPE_CHECKING:
-    from task_crusade_mcp.domain.entities.campaign_spec import CampaignSpec
+    from task_crusade_mcp.domain.entities.campaign_spec import CampaignSpec, TaskSpec
+    from task_crusade_mcp.domain.entities.memory import (
+        MemoryEntityDTO,
+        MemoryTaskAssociationDTO,
+    )
     from task_crusade_mcp.services.hint_generator import HintGenerator
 
 from task_crusade_mcp.domain.entities.hint import CampaignHealthInfo, CampaignSetupStage
 
 logger = logging.getLogger(__name__)
 
+# Research type reported for campaign research stored without one
+_DEFAULT_RESEARCH_TYPE = "analysis"
+
+
+def _project_research_entity(
+    entity: MemoryEntityDTO, assoc: MemoryTaskAssociationDTO
+) -> Dict[str, Any]:
+    """Build the response dict for a campaign research entity and its association."""
+    observations = entity.observations
+    created_at = entity.created_at
+    return {
+        "id": entity.id,
+        "content": observations[0] if observations else "",
+        "research_type": entity.metadata.get("research_type", _DEFAULT_RESEARCH_TYPE),
+        "order_index": assoc.order_index,
+        "created_at": created_at.isoformat() if created_at else None,
+    }
+
 
 class CampaignService:
     """
@@ -40,6 +65,15 @@ class CampaignService:
     and campaign-level research management.
     """
 
+    __slots__ = (
+        "campaign_repo",
+        "task_repo",
+        "memory_session_repo",
+        "memory_entity_repo",
+        "memory_association_repo",
+        "_hint_generator",
+    )
+
     def __init__(
         self,
         campaign_repo: CampaignRepository,
@@ -95,6 +129,7 @@ class CampaignService:
         self,
         campaign_id: str,
         campaign_name: str,
+        tasks: Optional[List[Any]] = None,
     ) -> Optional[CampaignHealthInfo]:
         """
         Build CampaignHealthInfo for quality hints.
@@ -104,16 +139,16 @@ class CampaignService:
         Args:
             campaign_id: Campaign UUID
             campaign_name: Campaign name
+            tasks: The campaign's tasks, if the caller has already listed them
 
         Returns:
-            CampaignHealthInfo or None if campaign has no tasks
+            CampaignHealthInfo or None if the campaign's tasks cannot be listed
         """
-        # Get all tasks
-        tasks_result = self.task_repo.list(filters={"campaign_id": campaign_id})
-        if tasks_result.is_failure:
-            return None
-
-        tasks = tasks_result.data or []
+        if tasks is None:
+            tasks_result = self.task_repo.list(filters={"campaign_id": campaign_id})
+            if tasks_result.is_failure:
+                return None
+            tasks = tasks_result.data or []
 
         if not tasks:
             return CampaignHealthInfo(
@@ -130,6 +165,12 @@ class CampaignService:
                 tasks_pending=0,
             )
 
+        # Count acceptance criteria and testing steps for every task at once
+        counts_result = self.memory_association_repo.count_by_tasks(
+            [t.id for t in tasks], ["acceptance_criteria", "testing_step"]
+        )
+        item_counts = counts_result.data or {}
+
         # Analyze task quality
         tasks_without_criteria = 0
         tasks_without_testing = 0
@@ -151,18 +192,16 @@ class CampaignService:
             elif task.status == "pending":
                 tasks_pending += 1
 
+            task_counts = item_counts.get(task.id, {})
+
             # Check for acceptance criteria
-            criteria_result = self._get_task_criteria(task.id)
-            criteria = criteria_result.data if criteria_result.is_success else []
-            if not criteria:
+            if not task_counts.get("acceptance_criteria"):
                 tasks_without_criteria += 1
                 if first_task_without_criteria_id is None:
                     first_task_without_criteria_id = task.id
 
             # Check for testing steps
-            testing_result = self._get_task_testing_steps(task.id)
-            testing = testing_result.data if testing_result.is_success else []
-            if not testing:
+            if not task_counts.get("testing_step"):
                 tasks_without_testing += 1
                 if first_task_without_testing_id is None:
                     first_task_without_testing_id = task.id
@@ -181,35 +220,11 @@ class CampaignService:
             tasks_pending=tasks_pending,
         )
 
-    def _get_task_testing_steps(self, task_id: str) -> DomainResult[List[Dict[str, Any]]]:
-        """Get testing steps for a task."""
-        assoc_result = self.memory_association_repo.list_by_task(
-            task_id, association_type="testing_step"
-        )
-        if assoc_result.is_failure:
-            return DomainSuccess.create(data=[])
-
-        steps = []
-        for assoc in assoc_result.data or []:
-            entity_result = self.memory_entity_repo.get(assoc.memory_entity_id)
-            if entity_result.is_failure:
-                continue
-
-            entity = entity_result.data
-            observations = entity.observations
-            content = observations[0] if observations else ""
-            step_type = entity.metadata.get("step_type", "verify")
-
-            steps.append(
-                {
-                    "id": entity.id,
-                    "content": content,
-                    "step_type": step_type,
-                    "order_index": assoc.order_index,
-                }
-            )
-
-        return DomainSuccess.create(data=steps)
+    def _get_task_items(
+        self, task_ids: List[str], association_types: List[str]
+    ) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        """Get task sub-items for many tasks; see load_task_items."""
+        return load_task_items(self.memory_association_repo, task_ids, association_types)
 
     def _get_campaign_setup_stage(
         self,
@@ -296,8 +311,7 @@ class CampaignService:
                     campaign_id=campaign_data["id"],
                     campaign_name=campaign_data["name"],
                 )
-                hint_data = self._hint_generator.format_for_response(hints)
-                campaign_data.update(hint_data)
+                self._hint_generator.add_to_response(hints, campaign_data)
 
             return DomainSuccess.create(data=campaign_data)
         return result
@@ -317,12 +331,9 @@ class CampaignService:
         offset: Optional[int] = None,
     ) -> DomainResult[List[Dict[str, Any]]]:
         """List campaigns with optional filtering."""
-        filters = {}
-        if status:
-            filters["status"] = status
-        if priority:
-            filters["priority"] = priority
-
+        filters = {
+            key: value for key, value in (("status", status), ("priority", priority)) if value
+        }
         return self.campaign_repo.list(filters=filters, limit=limit, offset=offset)
 
     def update_campaign(
@@ -350,8 +361,7 @@ class CampaignService:
                 campaign_id=campaign_id,
                 progress_data=progress_data,
             )
-            hint_data = self._hint_generator.format_for_response(hints)
-            progress_data.update(hint_data)
+            self._hint_generator.add_to_response(hints, progress_data)
             return DomainSuccess.create(data=progress_data)
 
         return result
@@ -377,10 +387,11 @@ class CampaignService:
         Returns:
             DomainResult with task data including acceptance criteria.
         """
-        # Verify campaign exists
-        campaign_result = self.campaign_repo.get(campaign_id)
-        if campaign_result.is_failure:
-            return campaign_result
+        # The progress summary also verifies the campaign exists
+        progress_result = self.campaign_repo.get_progress_summary(campaign_id)
+        if progress_result.is_failure:
+            return progress_result
+        progress_data = progress_result.data
 
         # Get next actionable task
         result = self.task_repo.get_next_actionable_task(campaign_id)
@@ -389,10 +400,6 @@ class CampaignService:
 
         task_dto = result.data
         if task_dto is None:
-            # Get progress for hints even when no task found
-            progress_result = self.campaign_repo.get_progress_summary(campaign_id)
-            progress_data = progress_result.data if progress_result.is_success else None
-
             response_data: Dict[str, Any] = {
                 "task": None,
                 "campaign_progress": progress_data,
@@ -410,32 +417,24 @@ class CampaignService:
                     campaign_progress=progress_data,
                     no_actionable=True,
                 )
-                hint_data = self._hint_generator.format_for_response(hints)
-                response_data.update(hint_data)
+                self._hint_generator.add_to_response(hints, response_data)
 
             return DomainSuccess.create(data=response_data)
 
-        # Get task details
+        # Get task details, with criteria (and research/notes for full
+        # context) loaded in one query
         task_data = task_dto.to_dict()
+        association_types = ["acceptance_criteria"]
+        if context_depth == "full":
+            association_types += ["research", "implementation_note"]
+        task_items = self._get_task_items([task_dto.id], association_types).get(task_dto.id, {})
 
-        # Get acceptance criteria for the task
-        criteria_result = self._get_task_criteria(task_dto.id)
-        if criteria_result.is_success:
-            task_data["acceptance_criteria_details"] = criteria_result.data
+        task_data["acceptance_criteria_details"] = task_items.get("acceptance_criteria", [])
 
         # Include research and notes if full context requested
         if context_depth == "full":
-            research_result = self._get_task_research(task_dto.id)
-            if research_result.is_success:
-                task_data["research"] = research_result.data
-
-            notes_result = self._get_task_notes(task_dto.id)
-            if notes_result.is_success:
-                task_data["implementation_notes"] = notes_result.data
-
-        # Get campaign progress
-        progress_result = self.campaign_repo.get_progress_summary(campaign_id)
-        progress_data = progress_result.data if progress_result.is_success else None
+            task_data["research"] = task_items.get("research", [])
+            task_data["implementation_notes"] = task_items.get("implementation_note", [])
 
         response_data: Dict[str, Any] = {
             "task": task_data,
@@ -452,8 +451,7 @@ class CampaignService:
                 campaign_progress=progress_data,
                 no_actionable=False,
             )
-            hint_data = self._hint_generator.format_for_response(hints)
-            response_data.update(hint_data)
+            self._hint_generator.add_to_response(hints, response_data)
 
         return DomainSuccess.create(data=response_data)
 
@@ -471,53 +469,51 @@ class CampaignService:
         Returns:
             DomainResult with list of actionable tasks.
         """
-        # Verify campaign exists
-        campaign_result = self.campaign_repo.get(campaign_id)
-        if campaign_result.is_failure:
-            return campaign_result
+        # The progress summary also verifies the campaign exists
+        progress_result = self.campaign_repo.get_progress_summary(campaign_id)
+        if progress_result.is_failure:
+            return progress_result
+        progress_data = progress_result.data
 
         # Get actionable tasks
         result = self.task_repo.get_actionable_tasks(campaign_id, max_results)
-        if result.is_failure:
-            return result
+        if result.is_failure or result.data is None:
+            return self._validate_result_data(result, "get actionable tasks")
+
+        tasks = result.data
 
-        tasks = result.data or []
+        # Enrich tasks with criteria (and research/notes for full context),
+        # loaded for all tasks at once
+        association_types = ["acceptance_criteria"]
+        if context_depth == "full":
+            association_types += ["research", "implementation_note"]
+        items_by_task = self._get_task_items([t.id for t in tasks], association_types)
 
-        # Enrich tasks with criteria
         enriched_tasks = []
+        in_progress_count = 0
         for task_dto in tasks:
+            if task_dto.status == "in-progress":
+                in_progress_count += 1
+
             task_data = task_dto.to_dict()
+            task_items = items_by_task.get(task_dto.id, {})
 
-            # Get acceptance criteria
-            criteria_result = self._get_task_criteria(task_dto.id)
-            if criteria_result.is_success:
-                task_data["acceptance_criteria_details"] = criteria_result.data
+            task_data["acceptance_criteria_details"] = task_items.get("acceptance_criteria", [])
 
             if context_depth == "full":
-                research_result = self._get_task_research(task_dto.id)
-                if research_result.is_success:
-                    task_data["research"] = research_result.data
-
-                notes_result = self._get_task_notes(task_dto.id)
-                if notes_result.is_success:
-                    task_data["implementation_notes"] = notes_result.data
+                task_data["research"] = task_items.get("research", [])
+                task_data["implementation_notes"] = task_items.get("implementation_note", [])
 
             enriched_tasks.append(task_data)
 
-        # Check for in-progress tasks
-        in_progress_tasks = [t for t in tasks if t.status == "in-progress"]
-        has_in_progress = len(in_progress_tasks) > 0
-
-        # Get progress summary
-        progress_result = self.campaign_repo.get_progress_summary(campaign_id)
-        progress_data = progress_result.data if progress_result.is_success else None
+        has_in_progress = in_progress_count > 0
 
         response_data: Dict[str, Any] = {
             "actionable_tasks": enriched_tasks,
             "total_actionable": len(tasks),
             "has_in_progress_tasks": has_in_progress,
             "warnings": (
-                [f"{len(in_progress_tasks)} tasks currently in-progress"]
+                [f"{in_progress_count} tasks currently in-progress"]
                 if has_in_progress
                 else []
             ),
@@ -532,8 +528,7 @@ class CampaignService:
                 campaign_id=campaign_id,
                 campaign_progress=progress_data,
             )
-            hint_data = self._hint_generator.format_for_response(hints)
-            response_data.update(hint_data)
+            self._hint_generator.add_to_response(hints, response_data)
 
         return DomainSuccess.create(data=response_data)
 
@@ -556,249 +551,120 @@ class CampaignService:
         Returns:
             DomainResult with created research item data.
         """
-        # Verify campaign exists
-        campaign_result = self.campaign_repo.get(campaign_id)
-        if campaign_result.is_failure:
-            return campaign_result
-
-        # Get or create memory session for campaign research
-        session_name = f"campaign-research-{campaign_id}"
-        session_result = self.memory_session_repo.get_or_create(
-            name=session_name, workflow_type="campaign-research"
-        )
-        if session_result.is_failure:
-            return session_result
-
-        session_id = session_result.data.id
-
-        # Create memory entity for research item
-        entity_result = self.memory_entity_repo.create(
-            {
-                "session_id": session_id,
-                "name": f"research-{research_type}",
-                "entity_type": "campaign_research",
-                "observations": [content],
-                "metadata": {"research_type": research_type},
-            }
-        )
-        entity_result = self._validate_result_data(
-            entity_result, "create campaign research entity"
-        )
-        if entity_result.is_failure:
-            return entity_result
-
-        entity_id = entity_result.data.id
-
-        # Create association to campaign
-        assoc_result = self.memory_association_repo.create(
-            {
-                "memory_entity_id": entity_id,
-                "campaign_id": campaign_id,
-                "association_type": "research",
-                "notes": research_type,
-            }
+        # Verify campaign exists. Hints also need its name and task count,
+        # which the progress summary provides along with the existence check.
+        progress_data: Dict[str, Any] = {}
+        if self._hint_generator:
+            progress_result = self.campaign_repo.get_progress_summary(campaign_id)
+            if progress_result.is_failure:
+                return progress_result
+            progress_data = progress_result.data or {}
+        else:
+            campaign_result = self.campaign_repo.get(campaign_id)
+            if campaign_result.is_failure:
+                return campaign_result
+
+        research_result = self._create_campaign_research_items(
+            campaign_id, [(content, research_type)]
         )
-        if assoc_result.is_failure:
-            return assoc_result
+        if research_result.is_failure or not research_result.data:
+            return self._validate_result_data(research_result, "create campaign research")
 
-        result_data: Dict[str, Any] = {
-            "id": entity_id,
-            "campaign_id": campaign_id,
-            "content": content,
-            "research_type": research_type,
-        }
+        result_data: Dict[str, Any] = research_result.data[0]
 
         # Generate hints if hint generator is available
         if self._hint_generator:
-            campaign_name = (
-                campaign_result.data.name
-                if campaign_result.is_success and campaign_result.data
-                else "Unknown"
-            )
-            # Get task count for context
-            progress_result = self.campaign_repo.get_progress_summary(campaign_id)
-            task_count = 0
-            if progress_result.is_success and progress_result.data:
-                task_count = progress_result.data.get("total_tasks", 0)
-
             hints = self._hint_generator.post_campaign_research_add(
                 campaign_id=campaign_id,
-                campaign_name=campaign_name,
+                campaign_name=progress_data.get("campaign_name", "Unknown"),
                 research_type=research_type,
-                task_count=task_count,
+                task_count=progress_data.get("total_tasks", 0),
             )
-            hint_data = self._hint_generator.format_for_response(hints)
-            result_data.update(hint_data)
+            self._hint_generator.add_to_response(hints, result_data)
 
         return DomainSuccess.create(data=result_data)
 
-    def list_campaign_research(
-        self, campaign_id: str, research_type: Optional[str] = None
+    def _create_campaign_research_items(
+        self, campaign_id: str, items: List[Tuple[str, str]]
     ) -> DomainResult[List[Dict[str, Any]]]:
         """
-        List research items for a campaign.
+        Store research items for an existing campaign.
+
+        All items, and the campaign's research memory session if it does not
+        exist yet, are written in a single transaction.
 
         Args:
             campaign_id: Campaign UUID.
-            research_type: Optional filter by research type.
+            items: (content, research_type) pairs, in the order to add them.
 
         Returns:
-            DomainResult with list of research items.
+            DomainResult with the created research item data, in input order.
         """
-        # Verify campaign exists
-        campaign_result = self.campaign_repo.get(campaign_id)
-        if campaign_result.is_failure:
-            return campaign_result
-
-        # Get associations for campaign
-        assoc_result = self.memory_association_repo.list_by_campaign(
-            campaign_id, association_type="research"
-        )
-        if assoc_result.is_failure:
-            return assoc_result
-
-        research_items = []
-        failed_entities = []
-        for assoc in assoc_result.data or []:
-            # Get the entity
-            entity_result = self.memory_entity_repo.get(assoc.memory_entity_id)
-            if entity_result.is_failure:
-                failed_entities.append({
-                    "entity_id": assoc.memory_entity_id,
-                    "error": entity_result.error_message,
-                })
-                logger.warning(
-                    f"Failed to retrieve research entity {assoc.memory_entity_id} "
-                    f"for campaign {campaign_id}: {entity_result.error_message}"
-                )
-                continue
-
-            entity = entity_result.data
-            entity_type = entity.metadata.get("research_type", "analysis")
-
-            # Filter by research_type if specified
-            if research_type and entity_type != research_type:
-                continue
-
-            observations = entity.observations
-            content = observations[0] if observations else ""
-
-            created_at = (
-                entity.created_at.isoformat() if entity.created_at else None
-            )
-            research_items.append({
-                "id": entity.id,
-                "content": content,
-                "research_type": entity_type,
-                "order_index": assoc.order_index,
-                "created_at": created_at,
-            })
-
-        if failed_entities:
-            warning_msg = (
-                f"Warning: {len(failed_entities)} research items "
-                "could not be retrieved"
-            )
-            return DomainSuccess.create(
-                data=research_items,
-                suggestions=[
-                    warning_msg,
-                    "Some research data may be incomplete or corrupted",
-                    "Consider running database integrity check",
-                ],
-            )
-
-        return DomainSuccess.create(data=research_items)
-
-    # --- Internal helper methods ---
-
-    def _get_task_criteria(self, task_id: str) -> DomainResult[List[Dict[str, Any]]]:
-        """Get acceptance criteria for a task."""
-        assoc_result = self.memory_association_repo.list_by_task(
-            task_id, association_type="acceptance_criteria"
-        )
-        if assoc_result.is_failure:
-            return DomainSuccess.create(data=[])
-
-        criteria = []
-        for assoc in assoc_result.data or []:
-            entity_result = self.memory_entity_repo.get(assoc.memory_entity_id)
-            if entity_result.is_failure:
-                continue
-
-            entity = entity_result.data
-            observations = entity.observations
-            content = observations[0] if observations else ""
-            is_met = entity.metadata.get("is_met", False)
-
-            criteria.append(
+        create_result = self.memory_entity_repo.create_campaign_items(
+            campaign_id,
+            [
                 {
-                    "id": entity.id,
-                    "content": content,
-                    "is_met": is_met,
-                    "order_index": assoc.order_index,
+                    "session_name": f"campaign-research-{campaign_id}",
+                    "workflow_type": "campaign-research",
+                    "name": f"research-{research_type}",
+                    "entity_type": "campaign_research",
+                    "observations": [content],
+                    "metadata": {"research_type": research_type},
+                    "association_type": "research",
+                    "notes": research_type,
                 }
-            )
-
-        return DomainSuccess.create(data=criteria)
-
-    def _get_task_research(self, task_id: str) -> DomainResult[List[Dict[str, Any]]]:
-        """Get research items for a task."""
-        assoc_result = self.memory_association_repo.list_by_task(
-            task_id, association_type="research"
+                for content, research_type in items
+            ],
         )
-        if assoc_result.is_failure:
-            return DomainSuccess.create(data=[])
-
-        research = []
-        for assoc in assoc_result.data or []:
-            entity_result = self.memory_entity_repo.get(assoc.memory_entity_id)
-            if entity_result.is_failure:
-                continue
-
-            entity = entity_result.data
-            observations = entity.observations
-            content = observations[0] if observations else ""
-            research_type = entity.metadata.get("research_type", "findings")
+        if create_result.is_failure or create_result.data is None:
+            return self._validate_result_data(create_result, "create campaign research items")
 
-            research.append(
-                {
-                    "id": entity.id,
-                    "content": content,
-                    "type": research_type,
-                    "order_index": assoc.order_index,
-                }
+        created = [
+            {
+                "id": entity_id,
+                "campaign_id": campaign_id,
+                "content": content,
+                "research_type": research_type,
+            }
+            for (entity_id, _), (content, research_type) in zip(
+                create_result.data, items, strict=True
             )
+        ]
+        return DomainSuccess.create(data=created)
 
-        return DomainSuccess.create(data=research)
-
-    def _get_task_notes(self, task_id: str) -> DomainResult[List[Dict[str, Any]]]:
-        """Get implementation notes for a task."""
-        assoc_result = self.memory_association_repo.list_by_task(
-            task_id, association_type="implementation_note"
-        )
-        if assoc_result.is_failure:
-            return DomainSuccess.create(data=[])
-
-        notes = []
-        for assoc in assoc_result.data or []:
-            entity_result = self.memory_entity_repo.get(assoc.memory_entity_id)
-            if entity_result.is_failure:
-                continue
-
-            entity = entity_result.data
-            observations = entity.observations
-            content = observations[0] if observations else ""
+    def list_campaign_research(
+        self, campaign_id: str, research_type: Optional[str] = None
+    ) -> DomainResult[List[Dict[str, Any]]]:
+        """
+        List research items for a campaign.
 
-            notes.append(
-                {
-                    "id": entity.id,
-                    "content": content,
-                    "order_index": assoc.order_index,
-                }
-            )
+        Args:
+            campaign_id: Campaign UUID.
+            research_type: Optional filter by research type.
 
-        return DomainSuccess.create(data=notes)
+        Returns:
+            DomainResult with list of research items.
+        """
+        # Get associations for campaign, joined to their research entities
+        pairs_result = self.memory_association_repo.list_with_entities_by_campaign(
+            campaign_id,
+            association_type="research",
+            entity_metadata={"research_type": research_type} if research_type else None,
+            metadata_defaults={"research_type": _DEFAULT_RESEARCH_TYPE},
+        )
+        if pairs_result.is_failure or pairs_result.data is None:
+            return self._validate_result_data(pairs_result, "list campaign research")
+        pairs = pairs_result.data
+
+        # Associations reference their campaign by foreign key, so the campaign
+        # only needs checking when none match
+        if not pairs:
+            campaign_result = self.campaign_repo.get(campaign_id)
+            if campaign_result.is_failure:
+                return campaign_result
+
+        research_items = [_project_research_entity(entity, assoc) for assoc, entity in pairs]
+        return DomainSuccess.create(data=research_items)
 
     # --- Bulk Operations ---
 
@@ -834,103 +700,162 @@ class CampaignService:
 
         topological_order = validation_result.data
 
-        # Step 2: Create the campaign
-        campaign_result = self.campaign_repo.create_campaign(
-            {
-                "name": campaign_spec.name,
-                "description": campaign_spec.description or "",
-                "priority": campaign_spec.priority,
-                "status": campaign_spec.status,
-                "metadata": campaign_spec.metadata,
-            }
-        )
-
-        if campaign_result.is_failure:
-            return campaign_result
-
-        campaign_dto = campaign_result.data
-        campaign_id = campaign_dto.id
-        campaign_data = campaign_dto.to_dict()
-
-        # Step 3: Add campaign research if provided
-        for research in campaign_spec.research:
-            self.add_campaign_research(
-                campaign_id=campaign_id,
-                content=research.content,
-                research_type=research.research_type,
-            )
-
-        # Step 4: Create tasks in topological order
-        temp_id_to_uuid: Dict[str, str] = {}
-        created_tasks: List[Dict[str, Any]] = []
-        tasks_with_criteria = 0
-        tasks_with_research = 0
-
-        for temp_id in topological_order:
-            task_spec = campaign_spec.get_task_by_temp_id(temp_id)
-            if not task_spec:
-                continue
-
-            # Map dependency temp_ids to actual UUIDs
-            resolved_dependencies = [
-                temp_id_to_uuid[dep_id]
-                for dep_id in task_spec.dependencies
-                if dep_id in temp_id_to_uuid
-            ]
-
-            # Create the task
-            task_result = self.task_repo.create(
+        # Steps 2-4 share one transaction, so the campaign, its research and
+        # every task with its criteria and research commit together or not at all.
+        with self.campaign_repo.orm_manager.transaction() as session:
+            # Step 2: Create the campaign
+            campaign_result = self.campaign_repo.create_campaign(
                 {
-                    "title": task_spec.title,
-                    "campaign_id": campaign_id,
-                    "description": task_spec.description or "",
-                    "priority": task_spec.priority,
-                    "status": task_spec.status,
-                    "type": task_spec.task_type,
-                    "category": task_spec.category,
-                    "tags": task_spec.tags,
-                    "dependencies": resolved_dependencies,
+                    "name": campaign_spec.name,
+                    "description": campaign_spec.description or "",
+                    "priority": campaign_spec.priority,
+                    "status": campaign_spec.status,
+                    "metadata": campaign_spec.metadata,
                 }
             )
 
-            if task_result.is_failure:
-                # Rollback: delete the campaign (cascades to tasks)
-                self.campaign_repo.delete(campaign_id)
+            if campaign_result.is_failure:
+                session.rollback()
+                return campaign_result
+
+            campaign_dto = campaign_result.data
+            campaign_id = campaign_dto.id
+            campaign_data = campaign_dto.to_dict()
+
+            # Step 3: Add campaign research if provided
+            if campaign_spec.research:
+                research_items = [(r.content, r.research_type) for r in campaign_spec.research]
+                research_result = self._create_campaign_research_items(campaign_id, research_items)
+                if research_result.is_failure:
+                    session.rollback()
+                    return self._validate_result_data(research_result, "create campaign research")
+
+            # Step 4: Create tasks in topological order. IDs are assigned here
+            # so dependencies can reference tasks inserted in the same batch.
+            spec_by_temp_id = {t.temp_id: t for t in campaign_spec.tasks}
+            temp_id_to_uuid: Dict[str, str] = {}
+            task_specs: List[Tuple[str, "TaskSpec"]] = []
+            task_rows: List[Dict[str, Any]] = []
+
+            for temp_id in topological_order:
+                task_spec = spec_by_temp_id[temp_id]
+
+                # Map dependency temp_ids to actual UUIDs, dropping repeats.
+                # Validation rejected unknown references, and topological order
+                # puts every dependency first, so each one already has a UUID.
+                resolved_dependencies = [
+                    temp_id_to_uuid[dep_id] for dep_id in dict.fromkeys(task_spec.dependencies)
+                ]
+
+                task_id = str(uuid.uuid4())
+                temp_id_to_uuid[temp_id] = task_id
+                task_specs.append((temp_id, task_spec))
+                task_rows.append(
+                    {
+                        "id": task_id,
+                        "title": task_spec.title,
+                        "campaign_id": campaign_id,
+                        "description": task_spec.description or "",
+                        "priority": task_spec.priority,
+                        "status": task_spec.status,
+                        "type": task_spec.task_type,
+                        "category": task_spec.category,
+                        "tags": task_spec.tags,
+                        "dependencies": resolved_dependencies,
+                    }
+                )
+
+            tasks_result = self.task_repo.create_many(task_rows)
+            if tasks_result.is_failure:
+                session.rollback()
                 return DomainError.operation_failed(
                     operation="create_task",
-                    reason=f"Failed to create task '{task_spec.title}': {task_result.error_message}",
+                    reason=f"Failed to create tasks: {tasks_result.error_message}",
                 )
 
-            task_dto = task_result.data
-            task_id = task_dto.id
-            temp_id_to_uuid[temp_id] = task_id
+            # Acceptance criteria and research for every task, as one batch.
+            # Each detail dict gets its id and order_index once inserted.
+            created_tasks: List[Dict[str, Any]] = []
+            items: List[Dict[str, Any]] = []
+            item_details: List[Dict[str, Any]] = []
+            tasks_with_criteria = 0
+            tasks_with_research = 0
 
-            task_data = task_dto.to_dict()
-            task_data["temp_id"] = temp_id
-
-            # Add acceptance criteria
-            if task_spec.acceptance_criteria:
-                tasks_with_criteria += 1
-                criteria_details = []
-                for criterion in task_spec.acceptance_criteria:
-                    criteria_result = self._add_task_criteria(task_id, criterion)
-                    if criteria_result.is_success:
-                        criteria_details.append(criteria_result.data)
-                task_data["acceptance_criteria_details"] = criteria_details
-
-            # Add research items
-            if task_spec.research:
-                tasks_with_research += 1
-                research_details = []
-                for research in task_spec.research:
-                    research_result = self._add_task_research(
-                        task_id, research.content, research.research_type
-                    )
-                    if research_result.is_success:
-                        research_details.append(research_result.data)
-                task_data["research"] = research_details
+            created_dtos = tasks_result.data or []
+            for (temp_id, task_spec), task_dto in zip(task_specs, created_dtos, strict=True):
+                task_id = task_dto.id
+                task_data = task_dto.to_dict()
+                task_data["temp_id"] = temp_id
+
+                if task_spec.acceptance_criteria:
+                    tasks_with_criteria += 1
+                    criteria_details = []
+                    for criterion in task_spec.acceptance_criteria:
+                        items.append(
+                            task_detail_item(
+                                task_id,
+                                f"criterion-{task_id}",
+                                "acceptance_criteria",
+                                criterion,
+                                "acceptance_criteria",
+                                metadata={"is_met": False},
+                            )
+                        )
+                        criteria_details.append(
+                            {
+                                "id": None,
+                                "task_id": task_id,
+                                "content": criterion,
+                                "is_met": False,
+                                "order_index": None,
+                            }
+                        )
+                    item_details.extend(criteria_details)
+                    task_data["acceptance_criteria_details"] = criteria_details
+
+                if task_spec.research:
+                    tasks_with_research += 1
+                    research_details = []
+                    for research in task_spec.research:
+                        research_type = research.research_type
+                        items.append(
+                            task_detail_item(
+                                task_id,
+                                f"research-{research_type}-{task_id}",
+                                "research_item",
+                                research.content,
+                                "research",
+                                metadata={"research_type": research_type},
+                                notes=research_type,
+                            )
+                        )
+                        research_details.append(
+                            {
+                                "id": None,
+                                "task_id": task_id,
+                                "content": research.content,
+                                "type": research_type,
+                                "order_index": None,
+                            }
+                        )
+                    item_details.extend(research_details)
+                    task_data["research"] = research_details
+
+                created_tasks.append(task_data)
+
+            items_result = self.memory_entity_repo.create_task_items(items)
+            if items_result.is_failure:
+                session.rollback()
+                return DomainError.operation_failed(
+                    operation="create_task_details",
+                    reason=f"Failed to add task criteria and research: "
+                    f"{items_result.error_message}",
+                )
 
-            created_tasks.append(task_data)
+            created_items = items_result.data or []
+            for detail, (entity_id, order_index) in zip(item_details, created_items, strict=True):
+                detail["id"] = entity_id
+                detail["order_index"] = order_index
 
         # Build response
         result_data: Dict[str, Any] = {
@@ -952,110 +877,10 @@ class CampaignService:
                 task_count=len(created_tasks),
                 tasks_with_criteria=tasks_with_criteria,
             )
-            hint_data = self._hint_generator.format_for_response(hints)
-            result_data.update(hint_data)
+            self._hint_generator.add_to_response(hints, result_data)
 
         return DomainSuccess.create(data=result_data)
 
-    def _add_task_criteria(self, task_id: str, content: str) -> DomainResult[Dict[str, Any]]:
-        """Add acceptance criterion to a task (internal helper)."""
-        # Get or create memory session for task
-        session_name = f"task-details-{task_id}"
-        session_result = self.memory_session_repo.get_or_create(
-            name=session_name, workflow_type="task-details"
-        )
-        if session_result.is_failure:
-            return session_result
-
-        session_id = session_result.data.id
-
-        # Create memory entity for criterion
-        entity_result = self.memory_entity_repo.create(
-            {
-                "session_id": session_id,
-                "name": f"criterion-{task_id}",
-                "entity_type": "acceptance_criteria",
-                "observations": [content],
-                "metadata": {"is_met": False},
-            }
-        )
-        if entity_result.is_failure:
-            return entity_result
-
-        entity_id = entity_result.data.id
-
-        # Create association to task
-        assoc_result = self.memory_association_repo.create(
-            {
-                "memory_entity_id": entity_id,
-                "task_id": task_id,
-                "association_type": "acceptance_criteria",
-            }
-        )
-        if assoc_result.is_failure:
-            return assoc_result
-
-        return DomainSuccess.create(
-            data={
-                "id": entity_id,
-                "task_id": task_id,
-                "content": content,
-                "is_met": False,
-                "order_index": assoc_result.data.order_index,
-            }
-        )
-
-    def _add_task_research(
-        self, task_id: str, content: str, research_type: str = "findings"
-    ) -> DomainResult[Dict[str, Any]]:
-        """Add research item to a task (internal helper)."""
-        # Get or create memory session for task
-        session_name = f"task-details-{task_id}"
-        session_result = self.memory_session_repo.get_or_create(
-            name=session_name, workflow_type="task-details"
-        )
-        if session_result.is_failure:
-            return session_result
-
-        session_id = session_result.data.id
-
-        # Create memory entity
-        entity_result = self.memory_entity_repo.create(
-            {
-                "session_id": session_id,
-                "name": f"research-{research_type}-{task_id}",
-                "entity_type": "research_item",
-                "observations": [content],
-                "metadata": {"research_type": research_type},
-            }
-        )
-        if entity_result.is_failure:
-            return entity_result
-
-        entity_id = entity_result.data.id
-
-        # Create association to task
-        assoc_result = self.memory_association_repo.create(
-            {
-                "memory_entity_id": entity_id,
-                "task_id": task_id,
-                "association_type": "research",
-                "notes": research_type,
-            }
-        )
-        if assoc_result.is_failure:
-            return assoc_result
-
-        return DomainSuccess.create(
-            data={
-                "id": entity_id,
-                "task_id": task_id,
-                "content": content,
-                "type": research_type,
-                "order_index": assoc_result.data.order_index,
-            }
-        )
-
     # --- Campaign Overview & State Operations ---
 
     def get_campaign_overview(
@@ -1157,12 +982,11 @@ class CampaignService:
                 )
 
                 # Merge hints (setup hints first as they're more actionable)
-                all_hints = setup_hints.hints + health_hints.hints
+                all_hints = [*setup_hints.hints, *health_hints.hints]
                 from task_crusade_mcp.domain.entities.hint import HintCollection
 
                 combined_hints = HintCollection(hints=all_hints)
-                hint_data = self._hint_generator.format_for_response(combined_hints)
-                result_data.update(hint_data)
+                self._hint_generator.add_to_response(combined_hints, result_data)
 
         return DomainSuccess.create(data=result_data)
 
@@ -1185,30 +1009,29 @@ class CampaignService:
         campaign_dto = campaign_result.data
         campaign_data = campaign_dto.to_dict()
 
-        # Get all tasks with full details
+        # Get all tasks with full details, loading their criteria, research
+        # and notes for the whole campaign at once
         tasks_result = self.task_repo.list(filters={"campaign_id": campaign_id})
-        tasks_data = []
-        if tasks_result.is_success and tasks_result.data:
-            for task_dto in tasks_result.data:
-                task_data = task_dto.to_dict()
-                task_id = task_dto.id
-
-                # Get acceptance criteria
-                criteria_result = self._get_task_criteria(task_id)
-                if criteria_result.is_success:
-                    task_data["acceptance_criteria_details"] = criteria_result.data
-
-                # Get research
-                research_result = self._get_task_research(task_id)
-                if research_result.is_success:
-                    task_data["research"] = research_result.data
-
-                # Get notes
-                notes_result = self._get_task_notes(task_id)
-                if notes_result.is_success:
-                    task_data["implementation_notes"] = notes_result.data
+        tasks = tasks_result.data if tasks_result.is_success and tasks_result.data else []
+        items_by_task = self._get_task_items(
+            [t.id for t in tasks], ["acceptance_criteria", "research", "implementation_note"]
+        )
 
-                tasks_data.append(task_data)
+        tasks_data = []
+        total_criteria = total_research = total_notes = 0
+        for task_dto in tasks:
+            task_data = task_dto.to_dict()
+            task_items = items_by_task.get(task_dto.id, {})
+            criteria = task_items.get("acceptance_criteria", [])
+            research = task_items.get("research", [])
+            notes = task_items.get("implementation_note", [])
+            task_data["acceptance_criteria_details"] = criteria
+            task_data["research"] = research
+            task_data["implementation_notes"] = notes
+            tasks_data.append(task_data)
+            total_criteria += len(criteria)
+            total_research += len(research)
+            total_notes += len(notes)
 
         # Get campaign research
         research_result = self.list_campaign_research(campaign_id)
@@ -1225,16 +1048,9 @@ class CampaignService:
             "progress": progress_data,
             "metadata": {
                 "total_tasks": len(tasks_data),
-                "total_criteria": sum(
-                    len(t.get("acceptance_criteria_details", []))
-                    for t in tasks_data
-                ),
-                "total_research": sum(
-                    len(t.get("research", [])) for t in tasks_data
-                ) + len(campaign_research),
-                "total_notes": sum(
-                    len(t.get("implementation_notes", [])) for t in tasks_data
-                ),
+                "total_criteria": total_criteria,
+                "total_research": total_research + len(campaign_research),
+                "total_notes": total_notes,
             },
         }
 
@@ -1289,21 +1105,20 @@ class CampaignService:
         if has_cycle:
             issues.append(f"Circular dependency detected: {cycle_info}")
 
-        # Check for actionable tasks
-        actionable_result = self.task_repo.get_actionable_tasks(campaign_id, 1)
-        actionable_count = (
-            len(actionable_result.data)
-            if actionable_result.is_success and actionable_result.data
-            else 0
-        )
-
-        if actionable_count == 0 and tasks:
-            warnings.append("No actionable tasks - all tasks may be blocked")
+        # Check for actionable tasks (an empty campaign has none to look up)
+        actionable_count = 0
+        if tasks:
+            actionable_result = self.task_repo.get_actionable_tasks(campaign_id, 1)
+            if actionable_result.is_success and actionable_result.data:
+                actionable_count = len(actionable_result.data)
+            else:
+                warnings.append("No actionable tasks - all tasks may be blocked")
 
         # Build campaign health info for quality analysis
         health_info = self._build_campaign_health_info(
             campaign_id=campaign_id,
             campaign_name=campaign_dto.name,
+            tasks=tasks if tasks_result.is_success else None,
         )
 
         tasks_without_criteria = 0
@@ -1347,8 +1162,7 @@ class CampaignService:
                 health_info=health_info,
                 context="validate",
             )
-            hint_data = self._hint_generator.format_for_response(hints)
-            result_data.update(hint_data)
+            self._hint_generator.add_to_response(hints, result_data)
 
         return DomainSuccess.create(data=result_data)
 
@@ -1362,13 +1176,24 @@ class CampaignService:
 
         unvisited, visiting, visited = 0, 1, 2
         color = {t.id: unvisited for t in tasks}
-        path: List[str] = []
 
-        def dfs(task_id: str) -> Optional[str]:
-            color[task_id] = visiting
-            path.append(task_id)
+        # Iterative DFS: path holds the tasks being visited and stack holds an
+        # iterator over each one's remaining dependencies, so long dependency
+        # chains cannot hit the recursion limit.
+        for root in color:
+            if color[root] != unvisited:
+                continue
+
+            color[root] = visiting
+            path: List[str] = [root]
+            stack = [iter(dependencies[root])]
+            while stack:
+                dep_id = next(stack[-1], None)
+                if dep_id is None:
+                    stack.pop()
+                    color[path.pop()] = visited
+                    continue
 
-            for dep_id in dependencies.get(task_id, []):
                 if dep_id not in color:
                     continue  # Invalid reference, handled elsewhere
 
@@ -1380,22 +1205,12 @@ class CampaignService:
                         task_map[tid].title if tid in task_map else tid
                         for tid in cycle_tasks
                     ]
-                    return " -> ".join(cycle_names)
+                    return True, " -> ".join(cycle_names)
 
                 if color[dep_id] == unvisited:
-                    result = dfs(dep_id)
-                    if result:
-                        return result
-
-            path.pop()
-            color[task_id] = visited
-            return None
-
-        for task_id in color:
-            if color[task_id] == unvisited:
-                result = dfs(task_id)
-                if result:
-                    return True, result
+                    color[dep_id] = visiting
+                    path.append(dep_id)
+                    stack.append(iter(dependencies[dep_id]))
 
         return False, None
 
@@ -1414,43 +1229,47 @@ class CampaignService:
         Returns:
             DomainResult with research item data.
         """
-        # Verify campaign exists
-        campaign_result = self.campaign_repo.get(campaign_id)
-        if campaign_result.is_failure:
-            return campaign_result
+        records_result = self._get_research_records(campaign_id, research_id)
+        if records_result.is_failure or records_result.data is None:
+            return self._validate_result_data(records_result, "load campaign research")
+
+        entity, assoc = records_result.data
+        return DomainSuccess.create(data=self._project_campaign_research(entity, assoc))
 
+    def _get_research_records(
+        self, campaign_id: str, research_id: str
+    ) -> DomainResult[Tuple[MemoryEntityDTO, MemoryTaskAssociationDTO]]:
+        """Load a campaign research entity and its association to the campaign."""
         # Get entity
         entity_result = self.memory_entity_repo.get(research_id)
-        if entity_result.is_failure:
-            return DomainError.not_found("Research item", research_id)
-
-        entity = entity_result.data
+        if entity_result.is_failure or entity_result.data is None:
+            return self._research_not_found(campaign_id, research_id)
 
-        # Verify it's associated with the campaign
+        # Verify it's associated with the campaign. The association references
+        # the campaign by foreign key, so a match also proves the campaign exists.
         assoc_result = self.memory_association_repo.get_by_entity(research_id)
         if assoc_result.is_failure:
-            return DomainError.not_found("Research item", research_id)
+            return self._research_not_found(campaign_id, research_id)
 
         assoc = assoc_result.data
-        if assoc.campaign_id != campaign_id:
-            return DomainError.not_found("Research item", research_id)
+        if assoc is None or assoc.campaign_id != campaign_id:
+            return self._research_not_found(campaign_id, research_id)
 
-        observations = entity.observations
-        content = observations[0] if observations else ""
-        research_type = entity.metadata.get("research_type", "analysis")
+        return DomainSuccess.create(data=(entity_result.data, assoc))
 
-        result_data: Dict[str, Any] = {
-            "id": entity.id,
-            "campaign_id": campaign_id,
-            "content": content,
-            "research_type": research_type,
-            "order_index": assoc.order_index,
-            "created_at": (
-                entity.created_at.isoformat() if entity.created_at else None
-            ),
-        }
+    def _project_campaign_research(
+        self, entity: MemoryEntityDTO, assoc: MemoryTaskAssociationDTO
+    ) -> Dict[str, Any]:
+        """Build the single-item research response, which includes the campaign ID."""
+        result_data = _project_research_entity(entity, assoc)
+        result_data["campaign_id"] = assoc.campaign_id
+        return result_data
 
-        return DomainSuccess.create(data=result_data)
+    def _research_not_found(self, campaign_id: str, research_id: str) -> DomainResult[Any]:
+        """Report a missing campaign, or else a missing research item."""
+        if self.campaign_repo.get(campaign_id).is_failure:
+            return DomainError.not_found("Campaign", campaign_id)
+        return DomainError.not_found("Research item", research_id)
 
     def update_campaign_research(
         self,
@@ -1472,9 +1291,10 @@ class CampaignService:
             DomainResult with updated research item data.
         """
         # Get current research item
-        current_result = self.get_campaign_research(campaign_id, research_id)
-        if current_result.is_failure:
-            return current_result
+        records_result = self._get_research_records(campaign_id, research_id)
+        if records_result.is_failure or records_result.data is None:
+            return self._validate_result_data(records_result, "load campaign research")
+        entity, assoc = records_result.data
 
         # Build updates
         updates: Dict[str, Any] = {}
@@ -1483,22 +1303,18 @@ class CampaignService:
             updates["observations"] = [content]
 
         if research_type is not None:
-            entity_result = self.memory_entity_repo.get(research_id)
-            if entity_result.is_success:
-                metadata = entity_result.data.metadata or {}
-                metadata["research_type"] = research_type
-                updates["metadata"] = metadata
-
-        if not updates:
-            return current_result
+            metadata = dict(entity.metadata or {})
+            metadata["research_type"] = research_type
+            updates["metadata"] = metadata
 
-        # Update entity
-        update_result = self.memory_entity_repo.update(research_id, updates)
-        if update_result.is_failure:
-            return update_result
+        if updates:
+            # Update entity; the repository returns the updated row
+            update_result = self.memory_entity_repo.update(research_id, updates)
+            if update_result.is_failure or update_result.data is None:
+                return self._validate_result_data(update_result, "update campaign research")
+            entity = update_result.data
 
-        # Return updated data
-        return self.get_campaign_research(campaign_id, research_id)
+        return DomainSuccess.create(data=self._project_campaign_research(entity, assoc))
 
     def delete_campaign_research(
         self, campaign_id: str, research_id: str
@@ -1514,9 +1330,9 @@ class CampaignService:
             DomainResult with deletion confirmation.
         """
         # Verify research belongs to campaign
-        current_result = self.get_campaign_research(campaign_id, research_id)
-        if current_result.is_failure:
-            return current_result
+        records_result = self._get_research_records(campaign_id, research_id)
+        if records_result.is_failure or records_result.data is None:
+            return self._validate_result_data(records_result, "load campaign research")
 
         # Delete entity (cascades to association)
         delete_result = self.memory_entity_repo.delete(research_id)
@@ -1546,24 +1362,21 @@ class CampaignService:
             DomainResult with updated research item data.
         """
         # Verify research belongs to campaign
-        current_result = self.get_campaign_research(campaign_id, research_id)
-        if current_result.is_failure:
-            return current_result
+        records_result = self._get_research_records(campaign_id, research_id)
+        if records_result.is_failure or records_result.data is None:
+            return self._validate_result_data(records_result, "load campaign research")
+        entity, assoc = records_result.data
 
-        # Get association
-        assoc_result = self.memory_association_repo.get_by_entity(research_id)
-        if assoc_result.is_failure:
-            return assoc_result
-
-        # Update order_index
+        # Update order_index; the repository returns the updated association
         update_result = self.memory_association_repo.update(
-            assoc_result.data.id, {"order_index": new_order}
+            assoc.id, {"order_index": new_order}
         )
-        if update_result.is_failure:
-            return update_result
+        if update_result.is_failure or update_result.data is None:
+            return self._validate_result_data(update_result, "reorder campaign research")
 
-        # Return updated data
-        return self.get_campaign_research(campaign_id, research_id)
+        return DomainSuccess.create(
+            data=self._project_campaign_research(entity, update_result.data)
+        )
 
     # --- Campaign Task Utilities ---
 
@@ -1605,20 +1418,25 @@ class CampaignService:
         # Get topological order
         ordered_ids = self._get_topological_order(tasks)
 
-        # Renumber tasks
+        # Renumber tasks, writing every priority_order in one batch
+        task_by_id = {t.id: t for t in tasks}
+        updates: List[Tuple[str, Dict[str, Any]]] = []
         renumbered = []
         for idx, task_id in enumerate(ordered_ids):
             task_number = start_from + idx
-            task = next((t for t in tasks if t.id == task_id), None)
+            task = task_by_id.get(task_id)
             if task:
-                # Update task priority_order with number
-                self.task_repo.update(task_id, {"priority_order": task_number})
+                updates.append((task_id, {"priority_order": task_number}))
                 renumbered.append({
                     "task_id": task_id,
                     "title": task.title,
                     "number": task_number,
                 })
 
+        update_result = self.task_repo.update_many(updates)
+        if update_result.is_failure or update_result.data is None:
+            return self._validate_result_data(update_result, "renumber tasks")
+
         result_data: Dict[str, Any] = {
             "campaign_id": campaign_id,
             "tasks_renumbered": len(renumbered),
@@ -1640,28 +1458,26 @@ class CampaignService:
                     in_degree[task.id] += 1
                     dependents[dep_id].append(task.id)
 
-        # Start with tasks that have no dependencies
-        queue = [tid for tid, deg in in_degree.items() if deg == 0]
+        # Start with tasks that have no dependencies. The queue is a heap of
+        # (title, id) so ready tasks come out in a deterministic order.
+        title_by_id = {t.id: t.title or "" for t in tasks}
+        queue = [(title_by_id[tid], tid) for tid, deg in in_degree.items() if deg == 0]
+        heapq.heapify(queue)
         result: List[str] = []
 
         while queue:
-            # Sort by title for deterministic ordering
-            queue.sort(
-                key=lambda tid: next(
-                    (t.title for t in tasks if t.id == tid), ""
-                )
-            )
-            current = queue.pop(0)
+            _, current = heapq.heappop(queue)
             result.append(current)
 
             for dependent in dependents[current]:
                 in_degree[dependent] -= 1
                 if in_degree[dependent] == 0:
-                    queue.append(dependent)
+                    heapq.heappush(queue, (title_by_id[dependent], dependent))
 
         # Add any remaining tasks (cycle handling)
+        ordered = set(result)
         for task in tasks:
-            if task.id not in result:
+            if task.id not in ordered:
                 result.append(task.id)
 
         return result
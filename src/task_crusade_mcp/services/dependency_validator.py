@@ -8,7 +8,7 @@ Provides validation of task dependency graphs including:
 """
 
 from collections import deque
-from typing import Dict, List, Set
+from typing import Dict, List, Set, Tuple
 
 from task_crusade_mcp.domain.entities.campaign_spec import TaskSpec
 from task_crusade_mcp.domain.entities.result_types import (
@@ -36,8 +36,25 @@ class DependencyValidator:
             tasks: List of TaskSpec objects to validate.
         """
         self.tasks = tasks
-        self._temp_id_to_task: Dict[str, TaskSpec] = {t.temp_id: t for t in tasks}
-        self._temp_id_to_index: Dict[str, int] = {t.temp_id: i for i, t in enumerate(tasks)}
+        self._temp_id_to_task: Dict[str, TaskSpec] = {}
+        self._dependents: Dict[str, List[str]] = {}
+        for task in tasks:
+            self._temp_id_to_task[task.temp_id] = task
+            self._dependents[task.temp_id] = []
+
+        # Split dependencies into valid and invalid references and index
+        # dependents by dependency in one pass, shared by all the checks below
+        self._valid_deps: Dict[str, List[str]] = {}
+        self._invalid_deps: List[Tuple[TaskSpec, str]] = []
+        for task in tasks:
+            valid_deps = []
+            for dep_id in task.dependencies:
+                if dep_id in self._temp_id_to_task:
+                    valid_deps.append(dep_id)
+                    self._dependents[dep_id].append(task.temp_id)
+                else:
+                    self._invalid_deps.append((task, dep_id))
+            self._valid_deps[task.temp_id] = valid_deps
 
     def validate_references(self) -> List[str]:
         """
@@ -46,19 +63,17 @@ class DependencyValidator:
         Returns:
             List of error messages for invalid references.
         """
-        errors = []
-        valid_temp_ids = set(self._temp_id_to_task.keys())
-
-        for task in self.tasks:
-            for dep_id in task.dependencies:
-                if dep_id not in valid_temp_ids:
-                    errors.append(
-                        f"Task '{task.temp_id}' ('{task.title}') depends on "
-                        f"'{dep_id}' which doesn't exist. "
-                        f"Available temp_ids: {sorted(valid_temp_ids)}"
-                    )
-
-        return errors
+        if not self._invalid_deps:
+            return []
+
+        # Every message lists the same IDs, so sort and format them once
+        available = str(sorted(self._temp_id_to_task))
+        return [
+            f"Task '{task.temp_id}' ('{task.title}') depends on "
+            f"'{dep_id}' which doesn't exist. "
+            f"Available temp_ids: {available}"
+            for task, dep_id in self._invalid_deps
+        ]
 
     def validate_temp_ids(self) -> List[str]:
         """
@@ -86,7 +101,7 @@ class DependencyValidator:
 
         Colors:
         - 0 (White): Unvisited
-        - 1 (Gray): Currently visiting (in recursion stack)
+        - 1 (Gray): Currently visiting (on the DFS path)
         - 2 (Black): Finished visiting
 
         Returns:
@@ -94,49 +109,38 @@ class DependencyValidator:
         """
         errors = []
         colors: Dict[str, int] = {t.temp_id: 0 for t in self.tasks}
-        parent: Dict[str, str] = {}
 
-        def dfs(node: str) -> bool:
-            """DFS traversal returning True if cycle found."""
-            colors[node] = 1  # Mark gray (visiting)
-
-            task = self._temp_id_to_task.get(node)
-            if not task:
-                return False
-
-            for neighbor in task.dependencies:
-                if neighbor not in colors:
-                    continue  # Invalid reference, handled elsewhere
+        # Iterative DFS so long dependency chains cannot hit the recursion
+        # limit. path holds the gray nodes; stack holds an iterator over each
+        # one's remaining dependencies.
+        for task in self.tasks:
+            if colors[task.temp_id] != 0:
+                continue
+
+            colors[task.temp_id] = 1  # Mark gray (visiting)
+            path = [task.temp_id]
+            stack = [iter(self._valid_deps[task.temp_id])]
+            while stack:
+                neighbor = next(stack[-1], None)
+                if neighbor is None:
+                    stack.pop()
+                    colors[path.pop()] = 2  # Mark black (finished)
+                    continue
 
                 if colors[neighbor] == 1:  # Gray - cycle found
-                    # Build cycle path
-                    cycle_path = [neighbor]
-                    current = node
-                    while current != neighbor:
-                        cycle_path.append(current)
-                        current = parent.get(current, neighbor)
-                    cycle_path.append(neighbor)
-                    cycle_path.reverse()
+                    cycle_path = path[path.index(neighbor) :] + [neighbor]
 
                     # Build readable error with task titles
                     cycle_str = " -> ".join(
                         f"{tid} ('{self._temp_id_to_task[tid].title}')" for tid in cycle_path
                     )
                     errors.append(f"Circular dependency detected: {cycle_str}")
-                    return True
+                    return errors  # Stop after first cycle found
 
                 if colors[neighbor] == 0:  # White - unvisited
-                    parent[neighbor] = node
-                    if dfs(neighbor):
-                        return True
-
-            colors[node] = 2  # Mark black (finished)
-            return False
-
-        # Start DFS from each unvisited node
-        for task in self.tasks:
-            if colors[task.temp_id] == 0 and dfs(task.temp_id):
-                break  # Stop after first cycle found
+                    colors[neighbor] = 1
+                    path.append(neighbor)
+                    stack.append(iter(self._valid_deps[neighbor]))
 
         return errors
 
@@ -152,13 +156,10 @@ class DependencyValidator:
         Raises:
             ValueError: If graph has cycles (should detect with detect_cycles first).
         """
-        # Calculate in-degrees (number of dependencies)
-        in_degree: Dict[str, int] = {t.temp_id: len(t.dependencies) for t in self.tasks}
-
-        # Filter to only valid dependencies
-        for task in self.tasks:
-            valid_deps = [d for d in task.dependencies if d in self._temp_id_to_task]
-            in_degree[task.temp_id] = len(valid_deps)
+        # Each edge is visited once through the dependents index, instead of
+        # rescanning every task per node
+        in_degree = {temp_id: len(deps) for temp_id, deps in self._valid_deps.items()}
+        dependents = self._dependents
 
         # Initialize queue with nodes having no dependencies
         queue = deque([tid for tid, degree in in_degree.items() if degree == 0])
@@ -169,11 +170,10 @@ class DependencyValidator:
             result.append(node)
 
             # Reduce in-degree of dependents
-            for task in self.tasks:
-                if node in task.dependencies:
-                    in_degree[task.temp_id] -= 1
-                    if in_degree[task.temp_id] == 0:
-                        queue.append(task.temp_id)
+            for dependent in dependents[node]:
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    queue.append(dependent)
 
         # If result doesn't contain all nodes, there's a cycle
         if len(result) != len(self.tasks):
@@ -6,7 +6,7 @@ This is a lightweight implementation focused on actionable guidance.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from task_crusade_mcp.domain.entities.hint import (
     CampaignHealthInfo,
@@ -19,6 +19,28 @@ from task_crusade_mcp.domain.entities.hint import (
 
 logger = logging.getLogger(__name__)
 
+# Returned whenever there are no hints; the tuple keeps it from being mutated
+_EMPTY_HINTS = HintCollection(hints=())
+
+
+def _progress_counts(progress: Dict[str, Any]) -> Tuple[int, int, int, int, int, float]:
+    """
+    Read task counts from a campaign progress summary.
+
+    Returns:
+        (pending, in_progress, done, blocked, total_tasks, completion_rate),
+        with 0 for anything the summary does not include.
+    """
+    tasks_by_status = progress.get("tasks_by_status", {})
+    return (
+        tasks_by_status.get("pending", 0),
+        tasks_by_status.get("in-progress", 0),
+        tasks_by_status.get("done", 0),
+        tasks_by_status.get("blocked", 0),
+        progress.get("total_tasks", 0),
+        progress.get("completion_rate", 0),
+    )
+
 
 class HintGenerator:
     """
@@ -28,6 +50,8 @@ class HintGenerator:
     and current state to provide actionable guidance to AI agents.
     """
 
+    __slots__ = ("enabled",)
+
     def __init__(self, enabled: bool = True):
         """
         Initialize hint generator.
@@ -38,8 +62,8 @@ class HintGenerator:
         self.enabled = enabled
 
     def _empty(self) -> HintCollection:
-        """Return empty hint collection."""
-        return HintCollection(hints=[])
+        """Return the shared empty hint collection."""
+        return _EMPTY_HINTS
 
     # --- Campaign Operation Hints ---
 
@@ -90,13 +114,9 @@ class HintGenerator:
         if not self.enabled:
             return self._empty()
 
-        tasks_by_status = progress_data.get("tasks_by_status", {})
-        pending = tasks_by_status.get("pending", 0)
-        in_progress = tasks_by_status.get("in-progress", 0)
-        done = tasks_by_status.get("done", 0)
-        blocked = tasks_by_status.get("blocked", 0)
-        total = progress_data.get("total_tasks", 0)
-        completion_rate = progress_data.get("completion_rate", 0)
+        pending, in_progress, done, blocked, total, completion_rate = _progress_counts(
+            progress_data
+        )
 
         hints: List[Hint] = []
 
@@ -303,13 +323,9 @@ class HintGenerator:
         hints: List[Hint] = []
 
         if campaign_progress:
-            tasks_by_status = campaign_progress.get("tasks_by_status", {})
-            pending = tasks_by_status.get("pending", 0)
-            in_progress = tasks_by_status.get("in-progress", 0)
-            blocked = tasks_by_status.get("blocked", 0)
-            done = tasks_by_status.get("done", 0)
-            total = campaign_progress.get("total_tasks", 0)
-            completion_rate = campaign_progress.get("completion_rate", 0)
+            pending, in_progress, done, blocked, total, completion_rate = _progress_counts(
+                campaign_progress
+            )
 
             remaining = pending + in_progress + blocked
 
@@ -379,10 +395,7 @@ class HintGenerator:
         if no_actionable or task_data is None:
             # No actionable task found
             if campaign_progress:
-                tasks_by_status = campaign_progress.get("tasks_by_status", {})
-                pending = tasks_by_status.get("pending", 0)
-                blocked = tasks_by_status.get("blocked", 0)
-                done = tasks_by_status.get("done", 0)
+                pending, _, done, blocked, _, _ = _progress_counts(campaign_progress)
 
                 if pending == 0 and blocked == 0:
                     hints.append(
@@ -1236,13 +1249,27 @@ class HintGenerator:
         Returns:
             Dict with 'hints' and optional 'next_action' keys
         """
+        result: Dict[str, Any] = {}
+        self.add_to_response(hints, result)
+        return result
+
+    def add_to_response(self, hints: HintCollection, response: Dict[str, Any]) -> None:
+        """
+        Add formatted hints directly to a service response.
+
+        Sets the same 'hints' and 'next_action' keys as format_for_response,
+        without building an intermediate dict to merge. Leaves the response
+        untouched when there are no hints.
+
+        Args:
+            hints: HintCollection to format
+            response: Response data to add the hint keys to
+        """
         if hints.is_empty():
-            return {}
+            return
 
-        result: Dict[str, Any] = {"hints": hints.to_list()}
+        response["hints"] = hints.to_list()
 
         primary = hints.get_primary_tool_call()
         if primary:
-            result["next_action"] = primary
-
-        return result
+            response["next_action"] = primary
@@ -41,6 +41,11 @@ def get_service_factory(orm_manager: Optional[ORMManager] = None) -> "ServiceFac
     """
     global _global_factory
 
+    # Fast path: once created, the factory is returned without taking the lock.
+    factory = _global_factory
+    if factory is not None:
+        return factory
+
     with _global_lock:
         if _global_factory is None:
             _global_factory = ServiceFactory(orm_manager)
@@ -63,6 +68,19 @@ class ServiceFactory:
     ORM manager and repositories.
     """
 
+    __slots__ = (
+        "_orm_manager",
+        "_lock",
+        "_campaign_repo",
+        "_task_repo",
+        "_memory_session_repo",
+        "_memory_entity_repo",
+        "_memory_association_repo",
+        "_campaign_service",
+        "_task_service",
+        "_hint_generator",
+    )
+
     def __init__(self, orm_manager: Optional[ORMManager] = None):
         """
         Initialize the service factory.
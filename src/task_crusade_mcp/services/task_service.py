@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import logging
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Sequence, Tuple
 
 from task_crusade_mcp.database.repositories import (
     CampaignRepository,
@@ -32,6 +32,91 @@ from task_crusade_mcp.domain.entities.hint import TaskCompletenessInfo
 logger = logging.getLogger(__name__)
 
 
+def task_detail_item(
+    task_id: str,
+    name: str,
+    entity_type: str,
+    content: str,
+    association_type: str,
+    metadata: Optional[Dict[str, Any]] = None,
+    notes: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Describe one task sub-item for MemoryEntityRepository.create_task_items."""
+    return {
+        "session_name": f"task-details-{task_id}",
+        "workflow_type": "task-details",
+        "task_id": task_id,
+        "name": name,
+        "entity_type": entity_type,
+        "observations": [content],
+        "metadata": metadata or {},
+        "association_type": association_type,
+        "notes": notes,
+    }
+
+
+# Metadata copied into task sub-item dicts, by association type:
+# association_type -> ((item key, metadata key, default), ...)
+_TASK_ITEM_METADATA: Dict[str, Tuple[Tuple[str, str, Any], ...]] = {
+    "acceptance_criteria": (("is_met", "is_met", False),),
+    "research": (("type", "research_type", "findings"),),
+    "implementation_note": (),
+    "testing_step": (
+        ("step_type", "step_type", "verify"),
+        ("test_status", "test_status", "pending"),
+    ),
+}
+
+
+def load_task_items(
+    association_repo: MemoryAssociationRepository,
+    task_ids: List[str],
+    association_types: List[str],
+) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+    """
+    Load task sub-items (criteria, research, notes, testing steps) for many tasks.
+
+    Associations are loaded joined to their entities in a single query, rather
+    than one query per task plus one per item.
+
+    Args:
+        association_repo: Repository for memory associations.
+        task_ids: Task UUIDs.
+        association_types: Association types to load.
+
+    Returns:
+        Mapping of task_id -> association_type -> items in order_index order.
+        Tasks and types without items are absent; lookup failures yield {}.
+    """
+    pairs_result = association_repo.list_with_entities_by_tasks(task_ids, association_types)
+    if pairs_result.is_failure:
+        return {}
+
+    # Bound once: the loop below runs per item.
+    get_fields = _TASK_ITEM_METADATA.get
+
+    items_by_task: Dict[str, Dict[str, List[Dict[str, Any]]]] = {}
+    for assoc, entity in pairs_result.data or []:
+        task_id = assoc.task_id
+        if task_id is None:
+            continue
+        association_type = assoc.association_type
+        observations = entity.observations
+        item: Dict[str, Any] = {
+            "id": entity.id,
+            "content": observations[0] if observations else "",
+        }
+        metadata = entity.metadata
+        for key, metadata_key, default in get_fields(association_type, ()):
+            item[key] = metadata.get(metadata_key, default)
+        item["order_index"] = assoc.order_index
+
+        task_items = items_by_task.setdefault(task_id, {})
+        task_items.setdefault(association_type, []).append(item)
+
+    return items_by_task
+
+
 class TaskService:
     """
     Service for task business logic.
@@ -40,6 +125,15 @@ class TaskService:
     research items, and implementation notes.
     """
 
+    __slots__ = (
+        "task_repo",
+        "campaign_repo",
+        "memory_session_repo",
+        "memory_entity_repo",
+        "memory_association_repo",
+        "_hint_generator",
+    )
+
     def __init__(
         self,
         task_repo: TaskRepository,
@@ -180,46 +274,92 @@ class TaskService:
             if invalid_deps:
                 return DomainError.validation_error(f"Invalid dependency task IDs: {invalid_deps}")
 
-        # Create task
-        result = self.task_repo.create(
-            {
-                "title": title,
-                "campaign_id": campaign_id,
-                "description": description or "",
-                "priority": priority,
-                "status": status,
-                "category": category,
-                "type": task_type,
-                "dependencies": dependencies or [],
-                "tags": tags or [],
-            }
-        )
-
-        if result.is_failure:
-            return result
+        # Initial criteria and research are written with the task in one
+        # transaction. They skip add_acceptance_criteria/add_research, whose
+        # per-item hints would only be nested in this response.
+        with self.task_repo.orm_manager.transaction() as session:
+            result = self.task_repo.create(
+                {
+                    "title": title,
+                    "campaign_id": campaign_id,
+                    "description": description or "",
+                    "priority": priority,
+                    "status": status,
+                    "category": category,
+                    "type": task_type,
+                    "dependencies": dependencies or [],
+                    "tags": tags or [],
+                }
+            )
 
-        task_dto = result.data
-        task_data = task_dto.to_dict()
+            if result.is_failure or result.data is None:
+                session.rollback()
+                return self._validate_result_data(result, "create task")
+
+            task_dto = result.data
+            task_data = task_dto.to_dict()
+
+            items: List[Dict[str, Any]] = []
+            details: List[Dict[str, Any]] = []
+            for criterion in acceptance_criteria or []:
+                items.append(
+                    task_detail_item(
+                        task_dto.id,
+                        f"criterion-{task_dto.id}",
+                        "acceptance_criteria",
+                        criterion,
+                        "acceptance_criteria",
+                        metadata={"is_met": False},
+                    )
+                )
+                details.append(
+                    {
+                        "id": None,
+                        "task_id": task_dto.id,
+                        "content": criterion,
+                        "is_met": False,
+                        "order_index": None,
+                    }
+                )
+            for item in research_items or []:
+                content = item.get("content", "")
+                research_type = item.get("type", "findings")
+                items.append(
+                    task_detail_item(
+                        task_dto.id,
+                        f"research-{research_type}-{task_dto.id}",
+                        "research_item",
+                        content,
+                        "research",
+                        metadata={"research_type": research_type},
+                        notes=research_type,
+                    )
+                )
+                details.append(
+                    {
+                        "id": None,
+                        "task_id": task_dto.id,
+                        "content": content,
+                        "type": research_type,
+                        "order_index": None,
+                    }
+                )
 
-        # Add acceptance criteria if provided
+            if items:
+                items_result = self.memory_entity_repo.create_task_items(items)
+                if items_result.is_failure or items_result.data is None:
+                    session.rollback()
+                    return self._validate_result_data(items_result, "create task items")
+                created = items_result.data
+                for detail, (entity_id, order_index) in zip(details, created, strict=True):
+                    detail["id"] = entity_id
+                    detail["order_index"] = order_index
+
+        criteria_count = len(acceptance_criteria or [])
         if acceptance_criteria:
-            criteria_results = []
-            for criterion in acceptance_criteria:
-                criteria_result = self.add_acceptance_criteria(task_dto.id, criterion)
-                if criteria_result.is_success:
-                    criteria_results.append(criteria_result.data)
-            task_data["acceptance_criteria_details"] = criteria_results
-
-        # Add research items if provided
+            task_data["acceptance_criteria_details"] = details[:criteria_count]
         if research_items:
-            research_results = []
-            for item in research_items:
-                content = item.get("content", "")
-                research_type = item.get("type", "findings")
-                research_result = self.add_research(task_dto.id, content, research_type)
-                if research_result.is_success:
-                    research_results.append(research_result.data)
-            task_data["research"] = research_results
+            task_data["research"] = details[criteria_count:]
 
         # Generate hints if hint generator is available
         if self._hint_generator:
@@ -232,8 +372,7 @@ class TaskService:
                 has_acceptance_criteria=has_criteria,
                 criteria_count=len(criteria_details),
             )
-            hint_data = self._hint_generator.format_for_response(hints)
-            task_data.update(hint_data)
+            self._hint_generator.add_to_response(hints, task_data)
 
         return DomainSuccess.create(data=task_data)
 
@@ -283,8 +422,7 @@ class TaskService:
                 completeness_info=completeness_info,
                 context="inspection",
             )
-            hint_data = self._hint_generator.format_for_response(hints)
-            task_data.update(hint_data)
+            self._hint_generator.add_to_response(hints, task_data)
 
         return DomainSuccess.create(data=task_data)
 
@@ -418,8 +556,7 @@ class TaskService:
                 unmet_criteria_count=unmet_count,
                 blocking_tasks=blocking_tasks,
             )
-            hint_data = self._hint_generator.format_for_response(hints)
-            task_data.update(hint_data)
+            self._hint_generator.add_to_response(hints, task_data)
 
         return DomainSuccess.create(data=task_data)
 
@@ -485,8 +622,7 @@ class TaskService:
                 campaign_id=campaign_id,
                 campaign_progress=progress_data,
             )
-            hint_data = self._hint_generator.format_for_response(hints)
-            task_data.update(hint_data)
+            self._hint_generator.add_to_response(hints, task_data)
 
         return DomainSuccess.create(data=task_data)
 
@@ -566,8 +702,7 @@ class TaskService:
                 task_title=task_title,
                 criteria_count=criteria_count,
             )
-            hint_data = self._hint_generator.format_for_response(hints)
-            result_data.update(hint_data)
+            self._hint_generator.add_to_response(hints, result_data)
 
         return DomainSuccess.create(data=result_data)
 
@@ -623,8 +758,7 @@ class TaskService:
                         met_count=met_count,
                         total_count=total_count,
                     )
-                    hint_data = self._hint_generator.format_for_response(hints)
-                    result_data.update(hint_data)
+                    self._hint_generator.add_to_response(hints, result_data)
                     result_data["task_id"] = task_id
 
         return DomainSuccess.create(data=result_data)
@@ -681,8 +815,7 @@ class TaskService:
                         met_count=met_count,
                         total_count=total_count,
                     )
-                    hint_data = self._hint_generator.format_for_response(hints)
-                    result_data.update(hint_data)
+                    self._hint_generator.add_to_response(hints, result_data)
                     result_data["task_id"] = task_id
 
         return DomainSuccess.create(data=result_data)
@@ -766,8 +899,7 @@ class TaskService:
                 task_title=task_title,
                 research_type=research_type,
             )
-            hint_data = self._hint_generator.format_for_response(hints)
-            result_data.update(hint_data)
+            self._hint_generator.add_to_response(hints, result_data)
 
         return DomainSuccess.create(data=result_data)
 
@@ -849,8 +981,7 @@ class TaskService:
                 task_title=task_title,
                 unmet_criteria=unmet_criteria,
             )
-            hint_data = self._hint_generator.format_for_response(hints)
-            result_data.update(hint_data)
+            self._hint_generator.add_to_response(hints, result_data)
 
         return DomainSuccess.create(data=result_data)
 
@@ -933,148 +1064,32 @@ class TaskService:
                 task_title=task_title,
                 step_type=step_type,
             )
-            hint_data = self._hint_generator.format_for_response(hints)
-            result_data.update(hint_data)
+            self._hint_generator.add_to_response(hints, result_data)
 
         return DomainSuccess.create(data=result_data)
 
     # --- Internal helper methods ---
 
+    def _get_task_items_of_type(self, task_id: str, association_type: str) -> List[Dict[str, Any]]:
+        """Get one type of sub-item for a single task."""
+        items_by_task = load_task_items(self.memory_association_repo, [task_id], [association_type])
+        return items_by_task.get(task_id, {}).get(association_type, [])
+
     def _get_task_criteria(self, task_id: str) -> List[Dict[str, Any]]:
         """Get acceptance criteria for a task."""
-        assoc_result = self.memory_association_repo.list_by_task(
-            task_id, association_type="acceptance_criteria"
-        )
-        if assoc_result.is_failure:
-            return []
-
-        criteria = []
-        for assoc in assoc_result.data or []:
-            entity_result = self.memory_entity_repo.get(assoc.memory_entity_id)
-            if entity_result.is_failure:
-                logger.warning(
-                    f"Failed to retrieve acceptance criteria entity {assoc.memory_entity_id} "
-                    f"for task {task_id}: {entity_result.error_message}"
-                )
-                continue
-
-            entity = entity_result.data
-            observations = entity.observations
-            content = observations[0] if observations else ""
-            is_met = entity.metadata.get("is_met", False)
-
-            criteria.append(
-                {
-                    "id": entity.id,
-                    "content": content,
-                    "is_met": is_met,
-                    "order_index": assoc.order_index,
-                }
-            )
-
-        return criteria
+        return self._get_task_items_of_type(task_id, "acceptance_criteria")
 
     def _get_task_research(self, task_id: str) -> List[Dict[str, Any]]:
         """Get research items for a task."""
-        assoc_result = self.memory_association_repo.list_by_task(
-            task_id, association_type="research"
-        )
-        if assoc_result.is_failure:
-            return []
-
-        research = []
-        for assoc in assoc_result.data or []:
-            entity_result = self.memory_entity_repo.get(assoc.memory_entity_id)
-            if entity_result.is_failure:
-                logger.warning(
-                    f"Failed to retrieve research entity {assoc.memory_entity_id} "
-                    f"for task {task_id}: {entity_result.error_message}"
-                )
-                continue
-
-            entity = entity_result.data
-            observations = entity.observations
-            content = observations[0] if observations else ""
-            research_type = entity.metadata.get("research_type", "findings")
-
-            research.append(
-                {
-                    "id": entity.id,
-                    "content": content,
-                    "type": research_type,
-                    "order_index": assoc.order_index,
-                }
-            )
-
-        return research
+        return self._get_task_items_of_type(task_id, "research")
 
     def _get_task_notes(self, task_id: str) -> List[Dict[str, Any]]:
         """Get implementation notes for a task."""
-        assoc_result = self.memory_association_repo.list_by_task(
-            task_id, association_type="implementation_note"
-        )
-        if assoc_result.is_failure:
-            return []
-
-        notes = []
-        for assoc in assoc_result.data or []:
-            entity_result = self.memory_entity_repo.get(assoc.memory_entity_id)
-            if entity_result.is_failure:
-                logger.warning(
-                    f"Failed to retrieve implementation note entity {assoc.memory_entity_id} "
-                    f"for task {task_id}: {entity_result.error_message}"
-                )
-                continue
-
-            entity = entity_result.data
-            observations = entity.observations
-            content = observations[0] if observations else ""
-
-            notes.append(
-                {
-                    "id": entity.id,
-                    "content": content,
-                    "order_index": assoc.order_index,
-                }
-            )
-
-        return notes
+        return self._get_task_items_of_type(task_id, "implementation_note")
 
     def _get_task_testing_steps(self, task_id: str) -> List[Dict[str, Any]]:
         """Get testing steps for a task."""
-        assoc_result = self.memory_association_repo.list_by_task(
-            task_id, association_type="testing_step"
-        )
-        if assoc_result.is_failure:
-            return []
-
-        steps = []
-        for assoc in assoc_result.data or []:
-            entity_result = self.memory_entity_repo.get(assoc.memory_entity_id)
-            if entity_result.is_failure:
-                logger.warning(
-                    f"Failed to retrieve testing step entity {assoc.memory_entity_id} "
-                    f"for task {task_id}: {entity_result.error_message}"
-                )
-                continue
-
-            entity = entity_result.data
-            observations = entity.observations
-            content = observations[0] if observations else ""
-            step_type = entity.metadata.get("step_type", "verify")
-            test_status = entity.metadata.get("test_status", "pending")
-
-            steps.append(
-                {
-                    "id": entity.id,
-                    "content": content,
-                    "step_type": step_type,
-                    "test_status": test_status,
-                    "order_index": assoc.order_index,
-                }
-            )
-
-        return steps
+        return self._get_task_items_of_type(task_id, "testing_step")
 
     # --- Search & Analytics Operations ---
 
@@ -1936,17 +1951,27 @@ class TaskService:
             }
         )
 
+    def mark_testing_step(
+        self, task_id: str, step_id: str, status: str
+    ) -> DomainResult[Dict[str, Any]]:
+        """Mark a testing step as passed, failed, or skipped."""
+        if status not in ("passed", "failed", "skipped"):
+            return DomainError.validation_error(
+                f"Invalid testing step status: {status}. Must be passed, failed, or skipped"
+            )
+        return self._update_testing_step_status(task_id, step_id, status)
+
     def mark_testing_step_passed(self, task_id: str, step_id: str) -> DomainResult[Dict[str, Any]]:
         """Mark a testing step as passed."""
-        return self._update_testing_step_status(task_id, step_id, "passed")
+        return self.mark_testing_step(task_id, step_id, "passed")
 
     def mark_testing_step_failed(self, task_id: str, step_id: str) -> DomainResult[Dict[str, Any]]:
         """Mark a testing step as failed."""
-        return self._update_testing_step_status(task_id, step_id, "failed")
+        return self.mark_testing_step(task_id, step_id, "failed")
 
     def mark_testing_step_skipped(self, task_id: str, step_id: str) -> DomainResult[Dict[str, Any]]:
         """Mark a testing step as skipped."""
-        return self._update_testing_step_status(task_id, step_id, "skipped")
+        return self.mark_testing_step(task_id, step_id, "skipped")
 
     def _update_testing_step_status(
         self, task_id: str, step_id: str, status: str
@@ -1993,12 +2018,13 @@ class TaskService:
 
     def bulk_add_research(
         self,
-        task_ids: List[str],
-        research_items: List[Dict[str, Any]],
+        task_ids: Sequence[str],
+        research_items: Sequence[Mapping[str, Any]],
     ) -> DomainResult[Dict[str, Any]]:
         """Add research items to multiple tasks atomically.
 
-        Adds ALL research items to ALL specified tasks.
+        Adds ALL research items to ALL specified tasks. Every item is written
+        in a single transaction, so a failure leaves no task partially updated.
 
         Args:
             task_ids: List of task IDs to add research to.
@@ -2014,36 +2040,49 @@ class TaskService:
 
         # Validate all tasks exist
         for tid in task_ids:
-            result = self.task_repo.get_task(tid)
+            result = self.task_repo.get(tid)
             if result.is_failure:
                 return DomainError.not_found("task", tid)
 
-        total_added = 0
+        items: List[Dict[str, Any]] = []
         for tid in task_ids:
             for item in research_items:
                 content = item.get("content", "")
                 research_type = item.get("type", "findings")
                 if not content:
                     continue
-                add_result = self.add_research(tid, content, research_type)
-                if add_result.is_failure:
-                    return add_result
-                total_added += 1
+                items.append(
+                    task_detail_item(
+                        tid,
+                        f"research-{research_type}-{tid}",
+                        "research_item",
+                        content,
+                        "research",
+                        metadata={"research_type": research_type},
+                        notes=research_type,
+                    )
+                )
+
+        create_result = self.memory_entity_repo.create_task_items(items)
+        if create_result.is_failure or create_result.data is None:
+            return self._validate_result_data(create_result, "create bulk research items")
 
         return DomainSuccess.create({
             "tasks_updated": len(task_ids),
             "research_added_per_task": len(research_items),
-            "total_research_added": total_added,
+            "total_research_added": len(create_result.data),
             "task_ids": task_ids,
         })
 
     def bulk_add_details(
         self,
-        tasks: List[Dict[str, Any]],
+        tasks: Sequence[Mapping[str, Any]],
     ) -> DomainResult[Dict[str, Any]]:
         """Add different details to multiple tasks atomically.
 
         Each task receives its own specific research, notes, criteria, and testing steps.
+        Entries without an existing task are counted as failed; the details for all
+        other tasks are written in a single transaction.
 
         Args:
             tasks: List of dicts with task_id and optional research, notes, criteria, testing_strategy.
@@ -2055,7 +2094,7 @@ class TaskService:
             return DomainError.validation_error("tasks must be non-empty")
 
         details: List[Dict[str, Any]] = []
-        success_count = 0
+        items: List[Dict[str, Any]] = []
         failed_count = 0
 
         for task_entry in tasks:
@@ -2065,7 +2104,7 @@ class TaskService:
                 continue
 
             # Validate task exists
-            task_result = self.task_repo.get_task(tid)
+            task_result = self.task_repo.get(tid)
             if task_result.is_failure:
                 failed_count += 1
                 continue
@@ -2074,44 +2113,68 @@ class TaskService:
                 "task_id": tid, "research": 0, "notes": 0, "criteria": 0, "testing_steps": 0,
             }
 
-            # Add research
+            # Research
             for item in task_entry.get("research", []):
                 content = item.get("content", "")
                 research_type = item.get("type", "findings")
                 if content:
-                    r = self.add_research(tid, content, research_type)
-                    if r.is_success:
-                        task_detail["research"] += 1
+                    items.append(
+                        task_detail_item(
+                            tid,
+                            f"research-{research_type}-{tid}",
+                            "research_item",
+                            content,
+                            "research",
+                            metadata={"research_type": research_type},
+                            notes=research_type,
+                        )
+                    )
+                    task_detail["research"] += 1
 
-            # Add notes
+            # Notes
             for item in task_entry.get("notes", []):
                 content = item.get("content", "")
                 if content:
-                    r = self.add_implementation_note(tid, content)
-                    if r.is_success:
-                        task_detail["notes"] += 1
+                    items.append(
+                        task_detail_item(
+                            tid, f"note-{tid}", "implementation_note", content,
+                            "implementation_note",
+                        )
+                    )
+                    task_detail["notes"] += 1
 
-            # Add criteria
+            # Criteria
             for criterion in task_entry.get("criteria", []):
                 if isinstance(criterion, str) and criterion:
-                    r = self.add_acceptance_criteria(tid, criterion)
-                    if r.is_success:
-                        task_detail["criteria"] += 1
+                    items.append(
+                        task_detail_item(
+                            tid, f"criterion-{tid}", "acceptance_criteria", criterion,
+                            "acceptance_criteria", metadata={"is_met": False},
+                        )
+                    )
+                    task_detail["criteria"] += 1
 
-            # Add testing strategy steps
+            # Testing strategy steps
             for step in task_entry.get("testing_strategy", []):
                 content = step.get("content", "")
                 step_type = step.get("step_type", "verify")
                 if content:
-                    r = self.add_testing_step(tid, content, step_type)
-                    if r.is_success:
-                        task_detail["testing_steps"] += 1
+                    items.append(
+                        task_detail_item(
+                            tid, f"testing-step-{tid}", "testing_step", content,
+                            "testing_step", metadata={"step_type": step_type}, notes=step_type,
+                        )
+                    )
+                    task_detail["testing_steps"] += 1
 
             details.append(task_detail)
-            success_count += 1
+
+        create_result = self.memory_entity_repo.create_task_items(items)
+        if create_result.is_failure or create_result.data is None:
+            return self._validate_result_data(create_result, "create bulk task details")
 
         return DomainSuccess.create({
-            "success_count": success_count,
+            "success_count": len(details),
             "failed_count": failed_count,
             "details": details,
         })
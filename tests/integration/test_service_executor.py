@@ -1,9 +1,12 @@
 """Integration tests for ServiceExecutor."""
 
+import json
+
 import pytest
 import yaml
 
 from task_crusade_mcp.server.service_executor import ServiceExecutor
+from task_crusade_mcp.server.tools import get_all_tools
 
 
 @pytest.fixture
@@ -254,6 +257,12 @@ class TestCampaignTools:
         assert "phases" in data["data"]
         assert len(data["data"]["phases"]) == 3
 
+    def test_every_tool_has_handler(self, service_executor):
+        """Test every advertised tool is routed by the handler table."""
+        tool_names = {tool.name for tool in get_all_tools()}
+
+        assert tool_names == set(service_executor._tool_handlers)
+
     @pytest.mark.asyncio
     async def test_unknown_tool(self, service_executor):
         """Test handling of unknown tool."""
@@ -609,6 +618,26 @@ class TestTaskTools:
         assert data["data"]["content"] == "Run unit tests"
         assert data["data"]["step_type"] == "verify"
 
+    @pytest.mark.asyncio
+    async def test_testing_strategy_mark_tools(self, service_executor):
+        """Test the mark_passed/failed/skipped tools set the step status."""
+        (task_id,) = await _create_tasks(service_executor, 1)
+        step_result = await service_executor.execute_tool(
+            "task_testing_strategy_add",
+            {"task_id": task_id, "content": "Run pytest"},
+        )
+        step_id = yaml.safe_load(step_result)["data"]["id"]
+
+        for status in ("passed", "failed", "skipped"):
+            result = await service_executor.execute_tool(
+                f"task_testing_strategy_mark_{status}",
+                {"task_id": task_id, "step_id": step_id},
+            )
+            data = yaml.safe_load(result)
+
+            assert data["success"] is True
+            assert data["data"]["test_status"] == status
+
     @pytest.mark.asyncio
     async def test_task_complete_workflow(self, service_executor):
         """Test completing a task with all criteria met."""
@@ -732,3 +761,152 @@ class TestErrorHandling:
         data = yaml.safe_load(result)
 
         assert data["success"] is False
+
+
+class TestResultFormatting:
+    """Test the YAML encoding of tool results."""
+
+    def test_format_result_round_trips(self, service_executor):
+        """Test strings YAML would misread are quoted so they load back unchanged."""
+        data = {
+            "title": "Ship it 🚀 — naïve café",
+            "description": "line one\nline two: with colon\t# not a comment",
+            "values": ["yes", "null", "123", "", "2024-01-01", "- item", "'quoted'"],
+            "count": 3,
+            "done": False,
+            "missing": None,
+            "hints": ["Add acceptance criteria"],
+        }
+
+        loaded = yaml.safe_load(service_executor._format_result(dict(data)))
+
+        hints = data.pop("hints")
+        assert loaded == {"success": True, "data": data, "hints": hints}
+
+
+async def _create_tasks(service_executor, count):
+    """Create a campaign with ``count`` tasks and return the task IDs."""
+    campaign_result = await service_executor.execute_tool(
+        "campaign_create",
+        {"name": "Bulk Campaign"},
+    )
+    campaign_id = yaml.safe_load(campaign_result)["data"]["id"]
+
+    task_ids = []
+    for i in range(count):
+        task_result = await service_executor.execute_tool(
+            "task_create",
+            {"title": f"Bulk Task {i}", "campaign_id": campaign_id},
+        )
+        task_ids.append(yaml.safe_load(task_result)["data"]["id"])
+    return task_ids
+
+
+class TestBulkTools:
+    """Test bulk tool execution via ServiceExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_research(self, service_executor):
+        """Test adding the same research to several tasks."""
+        task_ids = await _create_tasks(service_executor, 2)
+
+        result = await service_executor.execute_tool(
+            "task_bulk_add_research",
+            {
+                "research_json": json.dumps(
+                    {
+                        "task_ids": task_ids,
+                        "research_items": [{"content": "Finding", "type": "findings"}],
+                    }
+                )
+            },
+        )
+        data = yaml.safe_load(result)
+
+        assert data["success"] is True
+        assert data["data"]["total_research_added"] == 2
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_research_double_encoded(self, service_executor):
+        """Test a JSON payload that was encoded twice is still accepted."""
+        task_ids = await _create_tasks(service_executor, 1)
+        payload = json.dumps({"task_ids": task_ids, "research_items": [{"content": "Finding"}]})
+
+        result = await service_executor.execute_tool(
+            "task_bulk_add_research",
+            {"research_json": json.dumps(payload)},
+        )
+        data = yaml.safe_load(result)
+
+        assert data["success"] is True
+        assert data["data"]["total_research_added"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_research_invalid_shape(self, service_executor):
+        """Test a payload with the wrong structure is rejected with its location."""
+        result = await service_executor.execute_tool(
+            "task_bulk_add_research",
+            {"research_json": json.dumps({"task_ids": "task-1", "research_items": []})},
+        )
+        data = yaml.safe_load(result)
+
+        assert data["success"] is False
+        assert "task_ids" in data["error"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_research_invalid_json(self, service_executor):
+        """Test malformed JSON is reported."""
+        result = await service_executor.execute_tool(
+            "task_bulk_add_research",
+            {"research_json": "{not json"},
+        )
+        data = yaml.safe_load(result)
+
+        assert data["success"] is False
+        assert "Invalid JSON" in data["error"]
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_details(self, service_executor):
+        """Test adding different details to each task."""
+        first_id, second_id = await _create_tasks(service_executor, 2)
+
+        result = await service_executor.execute_tool(
+            "task_bulk_add_details",
+            {
+                "details_json": json.dumps(
+                    {
+                        "tasks": [
+                            {
+                                "task_id": first_id,
+                                "research": [{"content": "Docs", "type": "docs"}],
+                                "notes": [{"content": "Use the cache"}],
+                            },
+                            {
+                                "task_id": second_id,
+                                "criteria": ["Tests pass"],
+                                "testing_strategy": [{"content": "Run pytest"}],
+                            },
+                        ]
+                    }
+                )
+            },
+        )
+        data = yaml.safe_load(result)
+
+        assert data["success"] is True
+        assert data["data"]["success_count"] == 2
+        first, second = data["data"]["details"]
+        assert (first["research"], first["notes"]) == (1, 1)
+        assert (second["criteria"], second["testing_steps"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_bulk_add_details_invalid_item(self, service_executor):
+        """Test a malformed nested item is rejected with its location."""
+        result = await service_executor.execute_tool(
+            "task_bulk_add_details",
+            {"details_json": json.dumps({"tasks": [{"task_id": "t", "criteria": [1]}]})},
+        )
+        data = yaml.safe_load(result)
+
+        assert data["success"] is False
+        assert "tasks.0.criteria.0" in data["error"]
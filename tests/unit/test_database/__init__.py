@@ -0,0 +1 @@
+"""Database layer unit tests."""
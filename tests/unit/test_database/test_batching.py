@@ -0,0 +1,108 @@
+"""Tests for batching queries over long ID lists."""
+
+from functools import partial
+
+from task_crusade_mcp.database.repositories import (
+    batching,
+    memory_association_repository,
+    memory_entity_repository,
+    task_repository,
+)
+from task_crusade_mcp.database.repositories.batching import chunked
+from task_crusade_mcp.services.task_service import task_detail_item
+
+
+class TestChunked:
+    """Tests for chunked."""
+
+    def test_splits_into_bounded_slices(self):
+        """Test values are split in order into slices of at most size items."""
+        assert list(chunked(["a", "b", "c", "d", "e"], 2)) == [["a", "b"], ["c", "d"], ["e"]]
+
+    def test_empty_values(self):
+        """Test no slices are produced for an empty sequence."""
+        assert list(chunked([], 2)) == []
+
+    def test_default_size_fits_sqlite_limit(self):
+        """Test the default chunk stays below SQLite's oldest parameter limit."""
+        assert batching.MAX_IN_PARAMS < 999
+
+
+class TestChunkedQueries:
+    """Tests for repository queries that span several chunks."""
+
+    def test_results_merge_across_chunks(self, monkeypatch, task_service, campaign_service):
+        """Test batched lookups return every row when the IDs need several queries."""
+        small_chunks = partial(chunked, size=2)
+        for module in (memory_entity_repository, memory_association_repository, task_repository):
+            monkeypatch.setattr(module, "chunked", small_chunks)
+
+        campaign_id = campaign_service.create_campaign(name="Chunks").data["id"]
+        task_ids = [
+            task_service.create_task(
+                title=f"Task {i}", campaign_id=campaign_id, acceptance_criteria=["A", "B"]
+            ).data["id"]
+            for i in range(5)
+        ]
+        assoc_repo = task_service.memory_association_repo
+
+        pairs = assoc_repo.list_with_entities_by_tasks(task_ids, ["acceptance_criteria"]).data
+        counts = assoc_repo.count_by_tasks(task_ids).data
+        updated = task_service.task_repo.update_many(
+            [(task_id, {"priority_order": i}) for i, task_id in enumerate(task_ids)]
+        ).data
+
+        assert len(pairs) == 10
+        assert all(a.memory_entity_id == e.id for a, e in pairs)
+        assert counts == {task_id: {"acceptance_criteria": 2} for task_id in task_ids}
+        assert [task.priority_order for task in updated] == [0, 1, 2, 3, 4]
+
+    def test_create_task_items_spans_chunks(self, task_service, campaign_service):
+        """Test bulk item creation over more than MAX_IN_PARAMS tasks continues order."""
+        campaign_id = campaign_service.create_campaign(name="Many").data["id"]
+        task_repo = task_service.task_repo
+        task_ids = [
+            task_repo.create({"title": f"Task {i}", "campaign_id": campaign_id}).data.id
+            for i in range(batching.MAX_IN_PARAMS + 10)
+        ]
+        entity_repo = task_service.memory_entity_repo
+
+        def items(content):
+            return [
+                task_detail_item(
+                    task_id, "note", "implementation_note", content, "implementation_note"
+                )
+                for task_id in task_ids
+            ]
+
+        first = entity_repo.create_task_items(items("First")).data
+        second = entity_repo.create_task_items(items("Second")).data
+        pairs = task_service.memory_association_repo.list_with_entities_by_tasks(
+            task_ids, ["implementation_note"]
+        ).data
+        sessions_by_task = {}
+        for assoc, entity in pairs:
+            sessions_by_task.setdefault(assoc.task_id, set()).add(entity.session_id)
+
+        assert [order for _, order in first] == [1] * len(task_ids)
+        assert [order for _, order in second] == [2] * len(task_ids)
+        assert len(pairs) == 2 * len(task_ids)
+        assert len(sessions_by_task) == len(task_ids)
+        assert all(len(sessions) == 1 for sessions in sessions_by_task.values())
+
+    def test_campaign_statistics_span_chunks(self, campaign_repo, task_service):
+        """Test listing more than MAX_IN_PARAMS campaigns reports every campaign's tasks."""
+        campaign_ids = [
+            campaign_repo.create_campaign({"name": f"Campaign {i}"}).data.id
+            for i in range(batching.MAX_IN_PARAMS + 10)
+        ]
+        task_repo = task_service.task_repo
+        for campaign_id in (campaign_ids[0], campaign_ids[-1]):
+            task_repo.create({"title": "Task", "campaign_id": campaign_id, "status": "done"})
+
+        campaigns = campaign_repo.list().data
+
+        totals = {c["id"]: c["task_statistics"]["total"] for c in campaigns}
+        assert len(totals) == len(campaign_ids)
+        assert totals[campaign_ids[0]] == totals[campaign_ids[-1]] == 1
+        assert sum(totals.values()) == 2
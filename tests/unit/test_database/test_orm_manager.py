@@ -0,0 +1,53 @@
+"""Tests for ORM manager session and transaction handling."""
+
+import pytest
+
+
+class TestTransaction:
+    """Tests for ORMManager.transaction."""
+
+    def test_repository_calls_commit_together(self, orm_manager, campaign_repo, task_repo):
+        """Test repository writes inside a transaction are visible after it exits."""
+        with orm_manager.transaction():
+            campaign = campaign_repo.create_campaign({"name": "Joined"}).data
+            task_repo.create({"title": "Task", "campaign_id": campaign.id})
+
+        assert campaign_repo.get(campaign.id).is_success
+        assert len(task_repo.list(filters={"campaign_id": campaign.id}).data) == 1
+
+    def test_exception_rolls_back_all_calls(self, orm_manager, campaign_repo):
+        """Test an exception discards every write made in the transaction."""
+        with pytest.raises(RuntimeError), orm_manager.transaction():
+            campaign = campaign_repo.create_campaign({"name": "Discarded"}).data
+            raise RuntimeError("abort")
+
+        assert campaign_repo.get(campaign.id).is_failure
+
+    def test_session_rollback_discards_writes(self, orm_manager, campaign_repo):
+        """Test rolling back the yielded session discards earlier repository writes."""
+        with orm_manager.transaction() as session:
+            campaign = campaign_repo.create_campaign({"name": "Rolled back"}).data
+            session.rollback()
+
+        assert campaign_repo.get(campaign.id).is_failure
+
+    def test_nested_transaction_joins_outer(self, orm_manager):
+        """Test a nested transaction reuses the outer session."""
+        with orm_manager.transaction() as outer, orm_manager.transaction() as inner:
+            assert inner is outer
+            with orm_manager.get_session() as session:
+                assert session is outer
+
+
+class TestConnectionPool:
+    """Tests for connection reuse across sessions."""
+
+    def test_sessions_reuse_pooled_connection(self, orm_manager):
+        """Test consecutive sessions on one thread share one DBAPI connection."""
+        with orm_manager.get_session() as session:
+            first = session.connection().connection.dbapi_connection
+        with orm_manager.get_session() as session:
+            second = session.connection().connection.dbapi_connection
+
+        assert first is second
+        assert orm_manager.engine.pool.checkedout() == 0
@@ -0,0 +1,75 @@
+"""Tests for dict-style access and slots on DTOs."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from task_crusade_mcp.domain.entities import (
+    CampaignDTO,
+    MemoryEntityDTO,
+    MemorySessionDTO,
+    MemoryTaskAssociationDTO,
+    TaskDTO,
+)
+
+NOW = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+DTOS = [
+    TaskDTO(id="t1", title="Task", created_at=NOW, tags=["a"]),
+    CampaignDTO(id="c1", name="Campaign", created_at=NOW, metadata={"owner": "me"}),
+    MemoryEntityDTO(
+        id="e1",
+        session_id="s1",
+        name="entity",
+        entity_type="research_item",
+        observations=["finding"],
+        metadata={},
+        created_at=NOW,
+    ),
+    MemorySessionDTO(
+        id="s1", name="session", status="active", workflow_type=None, metadata={}, created_at=NOW
+    ),
+    MemoryTaskAssociationDTO(
+        id="a1",
+        memory_entity_id="e1",
+        task_id="t1",
+        campaign_id=None,
+        association_type="research",
+        notes=None,
+        order_index=1,
+        created_at=NOW,
+    ),
+]
+
+
+class TestDictAccess:
+    """Tests for DictAccessMixin."""
+
+    @pytest.mark.parametrize("dto", DTOS, ids=lambda dto: type(dto).__name__)
+    def test_lookups_match_to_dict(self, dto):
+        """Test every key reads the same value as to_dict() would return."""
+        expected = dto.to_dict()
+
+        for key, value in expected.items():
+            assert key in dto
+            assert dto[key] == value
+            assert dto.get(key) == value
+
+    @pytest.mark.parametrize("dto", DTOS, ids=lambda dto: type(dto).__name__)
+    def test_unknown_key(self, dto):
+        """Test keys outside to_dict() behave like a missing dict key."""
+        assert "to_dict" not in dto
+        assert dto.get("to_dict", "default") == "default"
+        with pytest.raises(KeyError):
+            dto["to_dict"]
+
+
+class TestDTOSlots:
+    """Tests for slotted DTO dataclasses."""
+
+    @pytest.mark.parametrize("dto", DTOS, ids=lambda dto: type(dto).__name__)
+    def test_dtos_have_no_instance_dict(self, dto):
+        """Test DTOs store fields in slots and reject unknown attributes."""
+        assert not hasattr(dto, "__dict__")
+        with pytest.raises(AttributeError):
+            dto.unknown_field = "value"
@@ -0,0 +1 @@
+"""Server layer unit tests."""
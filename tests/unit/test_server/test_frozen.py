@@ -0,0 +1,106 @@
+"""Tests for read-only schema fragment containers."""
+
+import copy
+import pickle
+
+import pytest
+
+from task_crusade_mcp.server.tools import get_all_tools, get_task_tools
+from task_crusade_mcp.server.tools.frozen import FrozenDict, FrozenList, freeze
+
+
+class TestFrozenDict:
+    """Tests for FrozenDict."""
+
+    def test_mutation_raises(self):
+        """Test every mutating operation is rejected."""
+        frozen = FrozenDict({"type": "string"})
+
+        with pytest.raises(TypeError):
+            frozen["type"] = "integer"
+        with pytest.raises(TypeError):
+            del frozen["type"]
+        with pytest.raises(TypeError):
+            frozen.update(description="x")
+        with pytest.raises(TypeError):
+            frozen.pop("type")
+
+        assert frozen == {"type": "string"}
+
+    def test_copy_is_mutable(self):
+        """Test a shallow copy returns an ordinary dict."""
+        copied = copy.copy(FrozenDict({"type": "string"}))
+        copied["type"] = "integer"
+
+        assert type(copied) is dict
+
+    def test_deepcopy_and_pickle(self):
+        """Test deepcopy shares the fragment and pickling round-trips."""
+        frozen = FrozenDict({"type": "string"})
+
+        assert copy.deepcopy(frozen) is frozen
+        assert pickle.loads(pickle.dumps(frozen)) == frozen
+
+
+class TestFrozenList:
+    """Tests for FrozenList."""
+
+    def test_mutation_raises(self):
+        """Test every mutating operation is rejected."""
+        frozen = FrozenList(["low", "high"])
+
+        with pytest.raises(TypeError):
+            frozen.append("medium")
+        with pytest.raises(TypeError):
+            frozen[0] = "medium"
+        with pytest.raises(TypeError):
+            frozen += ["medium"]
+
+        assert frozen == ["low", "high"]
+
+
+class TestFreeze:
+    """Tests for freeze()."""
+
+    def test_freezes_nested_containers(self):
+        """Test nested dicts and lists are converted recursively."""
+        frozen = freeze({"properties": {"tags": {"enum": ["a", "b"]}}})
+
+        assert isinstance(frozen, FrozenDict)
+        assert isinstance(frozen["properties"]["tags"], FrozenDict)
+        assert isinstance(frozen["properties"]["tags"]["enum"], FrozenList)
+        assert frozen == {"properties": {"tags": {"enum": ["a", "b"]}}}
+
+    def test_keeps_frozen_fragments(self):
+        """Test already-frozen fragments are shared rather than copied."""
+        fragment = FrozenDict({"type": "string"})
+
+        assert freeze({"task_id": fragment})["task_id"] is fragment
+
+
+class TestSharedSchemaFragments:
+    """Tests that shared tool schema fragments cannot be modified."""
+
+    def test_shared_task_id_property_is_read_only(self):
+        """Test the task_id property shared by task tools rejects mutation."""
+        schema = next(tool for tool in get_task_tools() if tool.name == "task_show").inputSchema
+
+        with pytest.raises(TypeError):
+            schema["properties"]["task_id"]["description"] = "changed"
+
+    def test_every_tool_schema_is_frozen(self):
+        """Test every cached tool schema rejects mutation at the top level."""
+        for tool in get_all_tools():
+            assert isinstance(tool.inputSchema, FrozenDict)
+            assert isinstance(tool.inputSchema["properties"], FrozenDict)
+
+    def test_tools_with_same_arguments_share_schema(self):
+        """Test schemas built from shared fields are one object per argument set."""
+        tools = {tool.name: tool for tool in get_task_tools()}
+
+        assert tools["task_show"].inputSchema is tools["task_complete"].inputSchema
+        assert (
+            tools["task_testing_strategy_mark_passed"].inputSchema
+            is tools["task_testing_strategy_show"].inputSchema
+        )
+        assert tools["task_show"].inputSchema is not tools["task_research_show"].inputSchema
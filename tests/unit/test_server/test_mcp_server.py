@@ -0,0 +1,36 @@
+"""Tests for the MCP server protocol handlers."""
+
+from mcp.types import CallToolRequest, CallToolRequestParams
+
+from task_crusade_mcp.server.mcp_server import CrusaderMCPServer
+
+
+async def call_tool(server, name, arguments):
+    """Drive the registered call_tool handler as the SDK does for a request."""
+    handler = server._server.request_handlers[CallToolRequest]
+    request = CallToolRequest(
+        method="tools/call", params=CallToolRequestParams(name=name, arguments=arguments)
+    )
+    return (await handler(request)).root
+
+
+class TestCallTool:
+    """Tests for the call_tool handler."""
+
+    async def test_invalid_arguments_return_error_result(self):
+        """Test arguments failing validation produce an isError tool result."""
+        server = CrusaderMCPServer()
+
+        result = await call_tool(server, "task_show", {})
+
+        assert result.isError is True
+        assert result.content[0].text.startswith("Input validation error:")
+
+    async def test_valid_arguments_run_tool(self):
+        """Test arguments passing validation reach the tool."""
+        server = CrusaderMCPServer()
+
+        result = await call_tool(server, "campaign_create", {"name": "Handled"})
+
+        assert result.isError is False
+        assert "Handled" in result.content[0].text
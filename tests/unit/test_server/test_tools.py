@@ -0,0 +1,54 @@
+"""Tests for MCP tool definitions."""
+
+from mcp.types import Tool
+
+from task_crusade_mcp.server.tools import (
+    get_all_tools,
+    get_campaign_tools,
+    get_task_tools,
+)
+
+
+class TestTaskTools:
+    """Tests for task tool definitions."""
+
+    def test_tool_names_are_unique(self):
+        """Test every task tool has a distinct name."""
+        names = [tool.name for tool in get_task_tools()]
+
+        assert len(names) == len(set(names))
+
+    def test_tools_are_built_once(self):
+        """Test repeated calls return the same cached tuple."""
+        assert get_task_tools() is get_task_tools()
+
+
+class TestCampaignTools:
+    """Tests for campaign tool definitions."""
+
+    def test_tool_names_are_unique(self):
+        """Test every campaign tool has a distinct name."""
+        names = [tool.name for tool in get_campaign_tools()]
+
+        assert len(names) == len(set(names))
+
+    def test_tools_are_built_once(self):
+        """Test repeated calls return the same cached tuple."""
+        assert get_campaign_tools() is get_campaign_tools()
+
+
+class TestAllTools:
+    """Tests for the combined tool list."""
+
+    def test_all_tools_combines_campaign_and_task_tools(self):
+        """Test the combined list holds the cached tool instances in order."""
+        tools = get_all_tools()
+
+        assert tools == [*get_campaign_tools(), *get_task_tools()]
+        assert tools[0] is get_campaign_tools()[0]
+        assert len({tool.name for tool in tools}) == len(tools)
+
+    def test_tools_pass_model_validation(self):
+        """Test tools built with model_construct would also pass validation."""
+        for tool in get_all_tools():
+            assert Tool.model_validate(tool.model_dump()).model_dump() == tool.model_dump()
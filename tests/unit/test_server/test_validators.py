@@ -0,0 +1,83 @@
+"""Tests for MCP tool argument validators."""
+
+from jsonschema import Draft202012Validator
+
+from task_crusade_mcp.server.tools import (
+    build_validators,
+    get_all_tools,
+    get_validator,
+    validate_tool_arguments,
+)
+from task_crusade_mcp.server.tools.validators import _get_fast_checks, _get_validators
+
+
+class TestToolValidators:
+    """Tests for prebuilt tool argument validators."""
+
+    def test_every_tool_schema_is_valid(self):
+        """Test every tool input schema is a valid Draft 2020-12 schema."""
+        for tool in get_all_tools():
+            Draft202012Validator.check_schema(tool.inputSchema)
+
+    def test_every_tool_has_validator(self):
+        """Test a validator is built for every tool."""
+        for tool in get_all_tools():
+            assert get_validator(tool.name) is not None
+
+    def test_validator_is_reused(self):
+        """Test repeated lookups return the same validator instance."""
+        assert get_validator("task_show") is get_validator("task_show")
+
+    def test_build_validators_prebuilds_caches(self):
+        """Test build_validators fills the caches the call path reads."""
+        _get_validators.cache_clear()
+        _get_fast_checks.cache_clear()
+
+        assert build_validators() == len(get_all_tools())
+        assert _get_validators.cache_info().currsize == 1
+        assert _get_fast_checks.cache_info().currsize == 1
+
+    def test_valid_arguments(self):
+        """Test valid arguments produce no error."""
+        assert validate_tool_arguments("task_show", {"task_id": "abc"}) is None
+
+    def test_missing_required_argument(self):
+        """Test a missing required argument is reported."""
+        error = validate_tool_arguments("task_show", {})
+
+        assert error is not None
+        assert "task_id" in error
+
+    def test_invalid_enum_value(self):
+        """Test a value outside an enum is reported."""
+        error = validate_tool_arguments("task_update", {"task_id": "abc", "status": "unknown"})
+
+        assert error is not None
+        assert "unknown" in error
+
+    def test_unknown_tool(self):
+        """Test unknown tools are left to the executor to reject."""
+        assert validate_tool_arguments("no_such_tool", {}) is None
+
+    def test_every_tool_has_fast_check(self):
+        """Test every tool schema compiles to a fast-path check."""
+        checks = _get_fast_checks()
+
+        for tool in get_all_tools():
+            assert tool.name in checks
+
+    def test_fast_check_defers_on_invalid_arguments(self):
+        """Test the fast-path check rejects what it cannot prove valid."""
+        check = _get_fast_checks()["task_update"]
+
+        assert check({"task_id": "abc", "status": "done"})
+        assert not check({"task_id": "abc", "status": "unknown"})
+        assert not check({"status": "done"})
+        assert not check({"task_id": True})
+
+    def test_integral_float_falls_back_to_jsonschema(self):
+        """Test values the fast path declines are still judged by jsonschema."""
+        arguments = {"query": "auth", "limit": 5.0}
+
+        assert not _get_fast_checks()["task_search"](arguments)
+        assert validate_tool_arguments("task_search", arguments) is None
@@ -57,6 +57,31 @@ class TestCampaignService:
         assert result.is_success
         assert len(result.data) >= 2
 
+    def test_list_campaigns_task_statistics(self, campaign_service, task_service):
+        """Test each listed campaign gets statistics for its own tasks only."""
+        busy = campaign_service.create_campaign(name="Busy", status="active").data["id"]
+        empty = campaign_service.create_campaign(name="Empty", status="active").data["id"]
+        campaign_service.create_campaign(name="Planned")
+        done = task_service.create_task(title="Done", campaign_id=busy).data["id"]
+        task_service.create_task(title="Open", campaign_id=busy)
+        task_service.update_task(done, status="done")
+
+        result = campaign_service.list_campaigns(status="active")
+
+        assert result.is_success
+        stats = {c["id"]: c["task_statistics"] for c in result.data}
+        assert set(stats) == {busy, empty}
+        assert stats[busy]["total"] == 2
+        assert stats[busy]["by_status"] == {
+            "done": 1,
+            "in-progress": 0,
+            "pending": 1,
+            "blocked": 0,
+        }
+        assert stats[busy]["completed_percentage"] == 50.0
+        assert stats[empty]["total"] == 0
+        assert stats[empty]["completed_percentage"] == 0.0
+
     def test_update_campaign(self, campaign_service):
         """Test updating a campaign."""
         create_result = campaign_service.create_campaign(name="Original")
@@ -101,6 +126,257 @@ class TestCampaignService:
         assert result.data["total_tasks"] == 2
         assert result.data["completion_rate"] == 0.0
 
+    def test_get_all_actionable_tasks_warns_about_in_progress(self, campaign_service, task_service):
+        """Test in-progress actionable tasks are counted in the warnings."""
+        campaign_id = campaign_service.create_campaign(name="In Progress").data["id"]
+        started = task_service.create_task(title="Started", campaign_id=campaign_id).data["id"]
+        task_service.create_task(title="Waiting", campaign_id=campaign_id)
+        task_service.update_task(started, status="in-progress")
+
+        result = campaign_service.get_all_actionable_tasks(campaign_id)
+
+        assert result.is_success
+        assert result.data["total_actionable"] == 2
+        assert result.data["has_in_progress_tasks"] is True
+        assert result.data["warnings"] == ["1 tasks currently in-progress"]
+
+    def test_get_all_actionable_tasks_full_context(self, campaign_service, task_service):
+        """Test each actionable task gets only its own criteria, research and notes."""
+        campaign_id = campaign_service.create_campaign(name="Actionable").data["id"]
+        first = task_service.create_task(title="First", campaign_id=campaign_id).data["id"]
+        second = task_service.create_task(title="Second", campaign_id=campaign_id).data["id"]
+        task_service.add_acceptance_criteria(first, "First criterion")
+        task_service.add_acceptance_criteria(first, "Second criterion")
+        task_service.add_research(second, "Docs link", "docs")
+        task_service.add_implementation_note(second, "Use the cache")
+
+        result = campaign_service.get_all_actionable_tasks(campaign_id, context_depth="full")
+
+        assert result.is_success
+        tasks = {task["id"]: task for task in result.data["actionable_tasks"]}
+        assert [c["content"] for c in tasks[first]["acceptance_criteria_details"]] == [
+            "First criterion",
+            "Second criterion",
+        ]
+        assert tasks[first]["acceptance_criteria_details"][0]["is_met"] is False
+        assert tasks[first]["research"] == []
+        assert tasks[second]["acceptance_criteria_details"] == []
+        assert tasks[second]["research"][0]["type"] == "docs"
+        assert tasks[second]["implementation_notes"][0]["content"] == "Use the cache"
+
+    def test_actionable_tasks_unknown_campaign(self, campaign_service):
+        """Test both actionable-task lookups report a missing campaign."""
+        next_result = campaign_service.get_next_actionable_task("nonexistent")
+        all_result = campaign_service.get_all_actionable_tasks("nonexistent")
+
+        assert next_result.is_failure
+        assert all_result.is_failure
+        assert "not found" in next_result.error_message.lower()
+
+    def test_campaign_research_unknown_campaign(self, campaign_service):
+        """Test adding and listing research report a missing campaign."""
+        add_result = campaign_service.add_campaign_research("nonexistent", "Finding")
+        list_result = campaign_service.list_campaign_research("nonexistent")
+
+        assert add_result.is_failure
+        assert list_result.is_failure
+        assert "not found" in add_result.error_message.lower()
+        assert "not found" in list_result.error_message.lower()
+
+    def test_campaign_research_add_and_list(self, campaign_service):
+        """Test a campaign lists no research until some is added."""
+        campaign_id = campaign_service.create_campaign(name="Research").data["id"]
+
+        empty = campaign_service.list_campaign_research(campaign_id)
+        added = campaign_service.add_campaign_research(campaign_id, "Use SQLite", "strategy")
+        listed = campaign_service.list_campaign_research(campaign_id)
+
+        assert empty.is_success
+        assert empty.data == []
+        assert added.is_success
+        assert "hints" in added.data
+        assert [(r["content"], r["research_type"]) for r in listed.data] == [
+            ("Use SQLite", "strategy")
+        ]
+
+    def test_campaign_research_order_and_session(self, campaign_service):
+        """Test added research continues the order and shares one memory session."""
+        campaign_id = campaign_service.create_campaign(name="Research").data["id"]
+        first = campaign_service.add_campaign_research(campaign_id, "First").data["id"]
+        second = campaign_service.add_campaign_research(campaign_id, "Second").data["id"]
+
+        listed = campaign_service.list_campaign_research(campaign_id).data
+        entity_repo = campaign_service.memory_entity_repo
+
+        assert [(r["id"], r["order_index"]) for r in listed] == [(first, 1), (second, 2)]
+        assert entity_repo.get(first).data.session_id == entity_repo.get(second).data.session_id
+
+    def test_campaign_research_filter_by_type(self, campaign_service):
+        """Test listing research by type returns only matching items, in order."""
+        campaign_id = campaign_service.create_campaign(name="Research").data["id"]
+        campaign_service.add_campaign_research(campaign_id, "Plan", "strategy")
+        campaign_service.add_campaign_research(campaign_id, "Measure", "analysis")
+        campaign_service.add_campaign_research(campaign_id, "Ship", "strategy")
+
+        strategy = campaign_service.list_campaign_research(campaign_id, research_type="strategy")
+        missing = campaign_service.list_campaign_research(campaign_id, research_type="other")
+
+        assert [r["content"] for r in strategy.data] == ["Plan", "Ship"]
+        assert missing.is_success
+        assert missing.data == []
+
+    def test_campaign_research_filter_defaults_to_analysis(self, campaign_service):
+        """Test research stored without a type is listed under 'analysis'."""
+        campaign_id = campaign_service.create_campaign(name="Research").data["id"]
+        untyped = campaign_service.add_campaign_research(campaign_id, "Untyped", "strategy")
+        campaign_service.memory_entity_repo.update(untyped.data["id"], {"metadata": {}})
+        campaign_service.add_campaign_research(campaign_id, "Typed", "analysis")
+
+        analysis = campaign_service.list_campaign_research(campaign_id, research_type="analysis")
+        strategy = campaign_service.list_campaign_research(campaign_id, research_type="strategy")
+
+        assert [r["content"] for r in analysis.data] == ["Untyped", "Typed"]
+        assert [r["research_type"] for r in analysis.data] == ["analysis", "analysis"]
+        assert strategy.data == []
+
+    def test_get_campaign_research_not_found(self, campaign_service):
+        """Test a research lookup names the missing campaign or research item."""
+        campaign_id = campaign_service.create_campaign(name="Research").data["id"]
+        research_id = campaign_service.add_campaign_research(campaign_id, "Finding").data["id"]
+
+        found = campaign_service.get_campaign_research(campaign_id, research_id)
+        wrong_campaign = campaign_service.get_campaign_research("nonexistent", research_id)
+        wrong_research = campaign_service.get_campaign_research(campaign_id, "nonexistent")
+
+        assert found.is_success
+        assert found.data["content"] == "Finding"
+        assert "campaign" in wrong_campaign.error_message.lower()
+        assert "research item" in wrong_research.error_message.lower()
+
+    def test_update_and_reorder_campaign_research(self, campaign_service):
+        """Test research updates return the item as stored after the change."""
+        campaign_id = campaign_service.create_campaign(name="Research").data["id"]
+        research_id = campaign_service.add_campaign_research(campaign_id, "Draft").data["id"]
+
+        updated = campaign_service.update_campaign_research(
+            campaign_id, research_id, content="Final", research_type="strategy"
+        )
+        reordered = campaign_service.reorder_campaign_research(campaign_id, research_id, 5)
+        fetched = campaign_service.get_campaign_research(campaign_id, research_id)
+
+        assert updated.is_success
+        assert updated.data["content"] == "Final"
+        assert updated.data["research_type"] == "strategy"
+        assert reordered.data["order_index"] == 5
+        assert fetched.data == reordered.data
+        assert fetched.data["campaign_id"] == campaign_id
+
+    def test_validate_readiness_empty_campaign(self, campaign_service):
+        """Test an empty campaign reports only the missing tasks."""
+        campaign_id = campaign_service.create_campaign(name="Empty").data["id"]
+
+        result = campaign_service.validate_readiness(campaign_id)
+
+        assert result.is_success
+        assert result.data["is_ready"] is False
+        assert result.data["issues"] == ["Campaign has no tasks"]
+        assert result.data["warnings"] == []
+        assert result.data["summary"]["total_tasks"] == 0
+        assert result.data["summary"]["actionable_tasks"] == 0
+        assert "health_score" in result.data["summary"]
+
+    def test_validate_readiness_counts_missing_details(self, campaign_service, task_service):
+        """Test readiness counts tasks lacking acceptance criteria or testing steps."""
+        campaign_id = campaign_service.create_campaign(name="Details").data["id"]
+        complete = task_service.create_task(
+            title="Complete", campaign_id=campaign_id, acceptance_criteria=["Works"]
+        ).data["id"]
+        task_service.add_testing_step(complete, "Run it")
+        task_service.create_task(
+            title="Criteria only", campaign_id=campaign_id, acceptance_criteria=["A", "B"]
+        ).data["id"]
+        task_service.create_task(title="Bare", campaign_id=campaign_id)
+
+        result = campaign_service.validate_readiness(campaign_id)
+
+        assert result.is_success
+        assert result.data["summary"]["tasks_without_criteria"] == 1
+        assert result.data["summary"]["tasks_without_testing"] == 2
+        assert "1 tasks have no acceptance criteria" in result.data["warnings"]
+
+    def test_validate_readiness_reports_cycle(self, campaign_service, task_service):
+        """Test readiness validation names the tasks in a dependency cycle."""
+        campaign_id = campaign_service.create_campaign(name="Cycle").data["id"]
+        first = task_service.create_task(title="First", campaign_id=campaign_id).data["id"]
+        second = task_service.create_task(
+            title="Second", campaign_id=campaign_id, dependencies=[first]
+        ).data["id"]
+        task_service.update_task(first, dependencies=[second])
+
+        result = campaign_service.validate_readiness(campaign_id)
+
+        assert result.is_success
+        assert result.data["is_ready"] is False
+        assert "Circular dependency detected: First -> Second -> First" in result.data["issues"]
+
+    def test_get_state_snapshot(self, campaign_service, task_service):
+        """Test the snapshot gives each task its own details and totals them."""
+        campaign_id = campaign_service.create_campaign(name="Snapshot").data["id"]
+        first = task_service.create_task(
+            title="First", campaign_id=campaign_id, acceptance_criteria=["A", "B"]
+        ).data["id"]
+        second = task_service.create_task(title="Second", campaign_id=campaign_id).data["id"]
+        task_service.add_research(second, "Docs link", "docs")
+        task_service.add_implementation_note(second, "Use the cache")
+        campaign_service.add_campaign_research(campaign_id, "Overall plan", "strategy")
+
+        result = campaign_service.get_state_snapshot(campaign_id)
+
+        assert result.is_success
+        tasks = {task["id"]: task for task in result.data["tasks"]}
+        assert [c["content"] for c in tasks[first]["acceptance_criteria_details"]] == ["A", "B"]
+        assert tasks[first]["research"] == []
+        assert tasks[first]["implementation_notes"] == []
+        assert tasks[second]["acceptance_criteria_details"] == []
+        assert tasks[second]["research"][0]["content"] == "Docs link"
+        assert tasks[second]["implementation_notes"][0]["content"] == "Use the cache"
+        assert result.data["metadata"] == {
+            "total_tasks": 2,
+            "total_criteria": 2,
+            "total_research": 2,
+            "total_notes": 1,
+        }
+
+    def test_get_next_actionable_task_includes_progress(self, campaign_service, task_service):
+        """Test the progress summary is returned with and without an actionable task."""
+        campaign_id = campaign_service.create_campaign(name="Progress").data["id"]
+
+        empty = campaign_service.get_next_actionable_task(campaign_id)
+        task_service.create_task(title="Only", campaign_id=campaign_id)
+        found = campaign_service.get_next_actionable_task(campaign_id)
+
+        assert empty.data["task"] is None
+        assert empty.data["campaign_progress"]["total_tasks"] == 0
+        assert found.data["task"]["title"] == "Only"
+        assert found.data["campaign_progress"]["total_tasks"] == 1
+
+    def test_get_next_actionable_task_context_depth(self, campaign_service, task_service):
+        """Test research and notes are only included with full context."""
+        campaign_id = campaign_service.create_campaign(name="Next").data["id"]
+        task_id = task_service.create_task(
+            title="Only", campaign_id=campaign_id, acceptance_criteria=["Works"]
+        ).data["id"]
+        task_service.add_research(task_id, "Docs link", "docs")
+        task_service.add_implementation_note(task_id, "Use the cache")
+
+        basic = campaign_service.get_next_actionable_task(campaign_id)
+        full = campaign_service.get_next_actionable_task(campaign_id, context_depth="full")
+
+        assert basic.data["task"]["acceptance_criteria_details"][0]["content"] == "Works"
+        assert "research" not in basic.data["task"]
+        assert full.data["task"]["research"][0]["type"] == "docs"
+        assert full.data["task"]["implementation_notes"][0]["content"] == "Use the cache"
+
 
 class TestCreateCampaignWithTasks:
     """Tests for create_campaign_with_tasks method."""
@@ -154,6 +430,49 @@ class TestCreateCampaignWithTasks:
         assert mapping["t1"] in t3_data["dependencies"]
         assert mapping["t2"] in t3_data["dependencies"]
 
+    def test_create_campaign_with_repeated_dependency(self, campaign_service):
+        """Test a dependency listed twice is stored once, for tasks in any input order."""
+        spec = CampaignSpec.from_dict({
+            "campaign": {"name": "Repeated Dependency"},
+            "tasks": [
+                {"temp_id": "t2", "title": "Second Task", "dependencies": ["t1", "t1"]},
+                {"temp_id": "t1", "title": "First Task"},
+            ],
+        })
+
+        result = campaign_service.create_campaign_with_tasks(spec)
+
+        assert result.is_success
+        mapping = result.data["temp_id_to_uuid"]
+        assert [t["temp_id"] for t in result.data["tasks"]] == ["t1", "t2"]
+        assert result.data["tasks"][1]["dependencies"] == [mapping["t1"]]
+
+    def test_renumber_tasks_follows_dependencies(self, campaign_service, task_service):
+        """Test each task is numbered after its dependencies, ready tasks by title."""
+        spec = CampaignSpec.from_dict({
+            "campaign": {"name": "Renumber"},
+            "tasks": [
+                {"temp_id": "c", "title": "C", "dependencies": ["b"]},
+                {"temp_id": "b", "title": "B"},
+                {"temp_id": "a", "title": "A", "dependencies": ["b"]},
+                {"temp_id": "d", "title": "D"},
+            ],
+        })
+        created = campaign_service.create_campaign_with_tasks(spec).data
+        campaign_id = created["campaign"]["id"]
+
+        result = campaign_service.renumber_tasks(campaign_id, start_from=10)
+
+        assert result.is_success
+        assert [(t["title"], t["number"]) for t in result.data["tasks"]] == [
+            ("B", 10),
+            ("A", 11),
+            ("C", 12),
+            ("D", 13),
+        ]
+        task_id = created["temp_id_to_uuid"]["c"]
+        assert task_service.get_task(task_id).data["priority_order"] == 12
+
     def test_create_campaign_with_acceptance_criteria(self, campaign_service):
         """Test creating campaign with task acceptance criteria."""
         spec = CampaignSpec.from_dict({
@@ -178,6 +497,35 @@ class TestCreateCampaignWithTasks:
         assert "acceptance_criteria_details" in task
         assert len(task["acceptance_criteria_details"]) == 2
 
+    def test_create_campaign_details_match_stored_items(self, campaign_service, task_service):
+        """Test returned criteria and research carry the IDs and order of stored items."""
+        spec = CampaignSpec.from_dict({
+            "campaign": {"name": "Stored Details"},
+            "tasks": [
+                {"temp_id": "t1", "title": "First", "acceptance_criteria": ["A", "B"]},
+                {
+                    "temp_id": "t2",
+                    "title": "Second",
+                    "dependencies": ["t1"],
+                    "research": [{"content": "Notes", "type": "docs"}],
+                },
+            ],
+        })
+
+        result = campaign_service.create_campaign_with_tasks(spec)
+
+        assert result.is_success
+        first, second = result.data["tasks"]
+        stored = task_service.get_task(first["id"]).data["acceptance_criteria_details"]
+        assert [(c["id"], c["order_index"]) for c in first["acceptance_criteria_details"]] == [
+            (c["id"], c["order_index"]) for c in stored
+        ]
+        assert [c["order_index"] for c in stored] == [1, 2]
+        assert second["dependencies"] == [first["id"]]
+        stored_research = task_service.get_task(second["id"]).data["research"]
+        assert second["research"][0]["id"] == stored_research[0]["id"]
+        assert stored_research[0]["type"] == "docs"
+
     def test_create_campaign_with_research(self, campaign_service):
         """Test creating campaign with task research items."""
         spec = CampaignSpec.from_dict({
@@ -201,6 +549,29 @@ class TestCreateCampaignWithTasks:
         assert "research" in task
         assert len(task["research"]) == 1
 
+    def test_create_campaign_with_campaign_research(self, campaign_service):
+        """Test campaign-level research is stored in spec order."""
+        spec = CampaignSpec.from_dict({
+            "campaign": {
+                "name": "Campaign Research",
+                "research": [
+                    {"content": "Plan", "type": "strategy"},
+                    {"content": "Constraints", "type": "requirements"},
+                ],
+            },
+            "tasks": [{"temp_id": "t1", "title": "Task"}],
+        })
+
+        result = campaign_service.create_campaign_with_tasks(spec)
+
+        assert result.is_success
+        campaign_id = result.data["campaign"]["id"]
+        research = campaign_service.list_campaign_research(campaign_id).data
+        assert [(r["content"], r["research_type"]) for r in research] == [
+            ("Plan", "strategy"),
+            ("Constraints", "requirements"),
+        ]
+
     def test_create_campaign_fails_on_cycle(self, campaign_service):
         """Test that circular dependencies are rejected."""
         spec = CampaignSpec.from_dict({
@@ -91,9 +91,10 @@ class TestDependencyValidator:
 
         errors = validator.validate_references()
 
-        assert len(errors) == 1
-        assert "t99" in errors[0]
-        assert "doesn't exist" in errors[0]
+        assert errors == [
+            "Task 't2' ('Task t2') depends on 't99' which doesn't exist. "
+            "Available temp_ids: ['t1', 't2']"
+        ]
 
     def test_validate_references_multiple_invalid(self):
         """Test that multiple invalid references are all detected."""
@@ -163,6 +164,46 @@ class TestDependencyValidator:
         assert len(errors) == 1
         assert "Circular dependency" in errors[0]
 
+    def test_detect_cycles_reports_cycle_path(self):
+        """Test the error lists the cycle's tasks in dependency order."""
+        tasks = [
+            self._make_task("t0", "Start", dependencies=["t1"]),
+            self._make_task("t1", "Task 1", dependencies=["t2"]),
+            self._make_task("t2", "Task 2", dependencies=["t1"]),
+        ]
+        validator = DependencyValidator(tasks)
+
+        errors = validator.detect_cycles()
+
+        assert errors == [
+            "Circular dependency detected: t1 ('Task 1') -> t2 ('Task 2') -> t1 ('Task 1')"
+        ]
+
+    def test_detect_cycles_ignores_invalid_reference(self):
+        """Test an unknown dependency neither hides nor causes a cycle."""
+        tasks = [
+            self._make_task("t1", "Task 1", dependencies=["missing", "t2"]),
+            self._make_task("t2", "Task 2", dependencies=["t1"]),
+        ]
+        validator = DependencyValidator(tasks)
+
+        errors = validator.detect_cycles()
+
+        assert errors == [
+            "Circular dependency detected: t1 ('Task 1') -> t2 ('Task 2') -> t1 ('Task 1')"
+        ]
+        assert len(validator.validate_references()) == 1
+
+    def test_detect_cycles_long_chain(self):
+        """Test a chain deeper than the recursion limit is checked without error."""
+        tasks = [self._make_task("t0", "Task 0")] + [
+            self._make_task(f"t{i}", f"Task {i}", dependencies=[f"t{i - 1}"])
+            for i in range(1, 5000)
+        ]
+        validator = DependencyValidator(tasks[::-1])
+
+        assert validator.detect_cycles() == []
+
     # --- get_topological_order Tests ---
 
     def test_topological_order_simple(self):
@@ -229,6 +270,28 @@ class TestDependencyValidator:
         with pytest.raises(ValueError, match="cycle"):
             validator.get_topological_order()
 
+    def test_topological_order_duplicate_dependency(self):
+        """Test a dependency listed twice does not leave its dependent unordered."""
+        tasks = [
+            self._make_task("t1"),
+            self._make_task("t2", dependencies=["t1", "t1"]),
+        ]
+        validator = DependencyValidator(tasks)
+
+        assert validator.get_topological_order() == ["t1", "t2"]
+
+    def test_topological_order_keeps_task_order_among_ready_tasks(self):
+        """Test tasks that become ready together keep their input order."""
+        tasks = [
+            self._make_task("t1"),
+            self._make_task("t3", dependencies=["t1"]),
+            self._make_task("t2", dependencies=["t1"]),
+            self._make_task("t4"),
+        ]
+        validator = DependencyValidator(tasks)
+
+        assert validator.get_topological_order() == ["t1", "t4", "t3", "t2"]
+
     # --- validate (Full Validation) Tests ---
 
     def test_validate_success(self):
@@ -1,5 +1,7 @@
 """Tests for the HintGenerator service."""
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from task_crusade_mcp.domain.entities.hint import (
@@ -50,6 +52,14 @@ class TestHintDataclass:
             "context": None,
         }
 
+    def test_hints_are_slotted(self):
+        """Test Hint and HintCollection store fields in slots."""
+        hint = Hint(category=HintCategory.PROGRESS, message="Progress update")
+        collection = HintCollection(hints=[hint])
+
+        assert not hasattr(hint, "__dict__")
+        assert not hasattr(collection, "__dict__")
+
 
 class TestHintCollection:
     """Tests for the HintCollection dataclass."""
@@ -163,6 +173,16 @@ class TestHintGenerator:
 
         assert result.is_empty()
 
+    def test_disabled_generator_shares_empty_collection(self, disabled_generator):
+        """Test disabled hint methods return one shared, immutable empty collection."""
+        first = disabled_generator.post_campaign_create("test-id", "Test Campaign")
+        second = disabled_generator.post_campaign_progress("test-id", {})
+
+        assert first is second
+        assert isinstance(first.hints, tuple)
+        with pytest.raises(FrozenInstanceError):
+            first.hints = [Hint(category=HintCategory.PROGRESS, message="Leaked")]
+
     # --- Campaign Hint Tests ---
 
     def test_post_campaign_create(self, generator):
@@ -533,6 +553,26 @@ class TestHintGenerator:
         assert "hints" in result
         assert "next_action" not in result
 
+    def test_add_to_response(self, generator):
+        """Test add_to_response sets hint keys on the response in place."""
+        collection = HintCollection(
+            hints=[
+                Hint(
+                    category=HintCategory.WORKFLOW,
+                    message="Test message",
+                    tool_call="test_tool()",
+                )
+            ]
+        )
+        response = {"id": "task-1"}
+        untouched = {"id": "task-2"}
+
+        generator.add_to_response(collection, response)
+        generator.add_to_response(HintCollection(hints=[]), untouched)
+
+        assert response == {"id": "task-1", **generator.format_for_response(collection)}
+        assert untouched == {"id": "task-2"}
+
     # --- Task Memory Operations Hint Tests ---
 
     def test_post_acceptance_criteria_add(self, generator):
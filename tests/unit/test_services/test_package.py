@@ -0,0 +1,49 @@
+"""Tests for the services package exports."""
+
+import subprocess
+import sys
+
+import pytest
+
+import task_crusade_mcp.services as services
+
+
+class TestServicesPackage:
+    """Tests for lazily loaded service exports."""
+
+    def test_all_exports_resolve(self):
+        """Test every name in __all__ resolves to its submodule definition."""
+        for name in services.__all__:
+            value = getattr(services, name)
+
+            assert value.__module__.startswith("task_crusade_mcp.services.")
+
+    def test_all_matches_lazy_exports(self):
+        """Test __all__ is an immutable tuple naming exactly the lazy exports."""
+        assert isinstance(services.__all__, tuple)
+        assert set(services.__all__) == set(services._LAZY_EXPORTS)
+
+    def test_star_import_binds_every_export(self):
+        """Test from-import-star resolves every lazy export."""
+        namespace: dict = {}
+        exec("from task_crusade_mcp.services import *", namespace)
+
+        assert set(services.__all__) <= namespace.keys()
+
+    def test_unknown_attribute_raises(self):
+        """Test unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            services.NotAService  # noqa: B018
+
+    def test_importing_factory_skips_service_modules(self):
+        """Test importing get_service_factory does not load the service modules."""
+        code = (
+            "import sys\n"
+            "from task_crusade_mcp.services import get_service_factory\n"
+            "print('task_crusade_mcp.services.task_service' in sys.modules)\n"
+        )
+        output = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+
+        assert output.strip() == "False"
@@ -0,0 +1,55 @@
+"""Tests for the service factory singleton."""
+
+import threading
+
+from task_crusade_mcp.services.service_factory import get_service_factory, reset_service_factory
+
+
+class TestGetServiceFactory:
+    """Tests for get_service_factory."""
+
+    def test_returns_singleton(self):
+        """Test repeated calls return the same factory."""
+        assert get_service_factory() is get_service_factory()
+
+    def test_reset_creates_new_factory(self):
+        """Test a reset factory is replaced on the next call."""
+        first = get_service_factory()
+        reset_service_factory()
+
+        assert get_service_factory() is not first
+
+    def test_concurrent_first_calls_share_factory(self):
+        """Test threads racing on first use all get the same factory."""
+        reset_service_factory()
+        results = []
+        barrier = threading.Barrier(8)
+
+        def worker():
+            barrier.wait()
+            results.append(get_service_factory())
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len({id(factory) for factory in results}) == 1
+
+
+class TestServiceFactory:
+    """Tests for ServiceFactory instances."""
+
+    def test_factory_and_services_use_slots(self):
+        """Test the factory and the services it builds have no instance __dict__."""
+        factory = get_service_factory()
+        instances = [
+            factory,
+            factory.get_campaign_service(),
+            factory.get_task_service(),
+            factory.get_hint_generator(),
+        ]
+
+        for instance in instances:
+            assert not hasattr(instance, "__dict__")
@@ -1,5 +1,7 @@
 """Tests for task service."""
 
+from task_crusade_mcp.services.task_service import load_task_items
+
 
 class TestTaskService:
     """Tests for TaskService."""
@@ -46,6 +48,27 @@ class TestTaskService:
         assert result.is_success
         assert len(result.data.get("acceptance_criteria_details", [])) == 2
 
+    def test_create_task_details_match_stored_items(self, task_service, campaign_service):
+        """Test initial criteria and research are returned as stored, without nested hints."""
+        campaign = campaign_service.create_campaign(name="Test")
+
+        result = task_service.create_task(
+            title="Task with Details",
+            campaign_id=campaign.data["id"],
+            acceptance_criteria=["Criterion 1", "Criterion 2"],
+            research_items=[{"content": "Use a cache", "type": "approaches"}],
+        )
+
+        assert result.is_success
+        stored = task_service.get_task(result.data["id"]).data
+        criteria = result.data["acceptance_criteria_details"]
+        assert [(c["id"], c["content"], c["order_index"]) for c in criteria] == [
+            (c["id"], c["content"], c["order_index"]) for c in stored["acceptance_criteria_details"]
+        ]
+        assert [r["id"] for r in result.data["research"]] == [r["id"] for r in stored["research"]]
+        assert result.data["research"][0]["type"] == "approaches"
+        assert all("hints" not in item for item in [*criteria, *result.data["research"]])
+
     def test_get_task(self, task_service, campaign_service):
         """Test getting a task."""
         campaign = campaign_service.create_campaign(name="Test")
@@ -311,3 +334,100 @@ class TestTaskService:
 
         assert result.is_failure
         assert "itself" in result.error_message.lower()
+
+    def test_mark_testing_step(self, task_service, campaign_service):
+        """Test setting each testing step status through the shared method."""
+        campaign = campaign_service.create_campaign(name="Test")
+        task = task_service.create_task(title="Test", campaign_id=campaign.data["id"])
+        task_id = task.data["id"]
+        step = task_service.add_testing_step(task_id, "Run the suite")
+        step_id = step.data["id"]
+
+        for status in ("passed", "failed", "skipped"):
+            result = task_service.mark_testing_step(task_id, step_id, status)
+
+            assert result.is_success
+            assert result.data["test_status"] == status
+
+    def test_mark_testing_step_invalid_status(self, task_service, campaign_service):
+        """Test an unknown testing step status is rejected."""
+        campaign = campaign_service.create_campaign(name="Test")
+        task = task_service.create_task(title="Test", campaign_id=campaign.data["id"])
+        task_id = task.data["id"]
+        step = task_service.add_testing_step(task_id, "Run the suite")
+
+        result = task_service.mark_testing_step(task_id, step.data["id"], "pending")
+
+        assert result.is_failure
+
+    def test_bulk_add_details_continues_existing_order(self, task_service, campaign_service):
+        """Test bulk-added items are stored in order after existing ones."""
+        campaign = campaign_service.create_campaign(name="Test")
+        task = task_service.create_task(title="Test", campaign_id=campaign.data["id"])
+        task_id = task.data["id"]
+        task_service.add_implementation_note(task_id, "Existing note")
+
+        result = task_service.bulk_add_details(
+            [
+                {
+                    "task_id": task_id,
+                    "notes": [{"content": "Second"}, {"content": "Third"}],
+                    "criteria": ["Works", ""],
+                    "testing_strategy": [{"content": "Run it", "step_type": "trigger"}],
+                },
+                {"task_id": "nonexistent"},
+            ]
+        )
+
+        assert result.is_success
+        assert result.data["success_count"] == 1
+        assert result.data["failed_count"] == 1
+        assert result.data["details"][0]["notes"] == 2
+        assert result.data["details"][0]["criteria"] == 1
+
+        details = task_service.get_task(task_id).data
+        assert [note["content"] for note in details["implementation_notes"]] == [
+            "Existing note",
+            "Second",
+            "Third",
+        ]
+        assert [note["order_index"] for note in details["implementation_notes"]] == [1, 2, 3]
+        assert details["acceptance_criteria_details"][0]["content"] == "Works"
+        assert details["testing_steps"][0]["step_type"] == "trigger"
+
+    def test_bulk_add_research_rejects_unknown_task(self, task_service, campaign_service):
+        """Test no research is written when any task does not exist."""
+        campaign = campaign_service.create_campaign(name="Test")
+        task = task_service.create_task(title="Test", campaign_id=campaign.data["id"])
+        task_id = task.data["id"]
+
+        result = task_service.bulk_add_research(
+            [task_id, "nonexistent"], [{"content": "Finding", "type": "findings"}]
+        )
+
+        assert result.is_failure
+        assert task_service.get_task(task_id).data["research"] == []
+
+    def test_load_task_items_groups_by_task_and_type(self, task_service, campaign_service):
+        """Test items for several tasks and types are loaded and grouped in one call."""
+        campaign = campaign_service.create_campaign(name="Test")
+        first = task_service.create_task(
+            title="First", campaign_id=campaign.data["id"], acceptance_criteria=["Works"]
+        ).data["id"]
+        second = task_service.create_task(title="Second", campaign_id=campaign.data["id"])
+        second = second.data["id"]
+        task_service.add_testing_step(second, "Run the suite")
+        task_service.add_testing_step(second, "Check the output")
+
+        items = load_task_items(
+            task_service.memory_association_repo,
+            [first, second],
+            ["acceptance_criteria", "testing_step"],
+        )
+
+        assert items[first]["acceptance_criteria"][0]["content"] == "Works"
+        assert items[first]["acceptance_criteria"][0]["is_met"] is False
+        assert "testing_step" not in items[first]
+        steps = items[second]["testing_step"]
+        assert [step["content"] for step in steps] == ["Run the suite", "Check the output"]
+        assert steps[0]["test_status"] == "pending"